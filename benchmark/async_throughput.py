@@ -0,0 +1,29 @@
+"""
+Requests per second of AsyncNimiqClient, in a separate module as it requires Python 3.5.
+"""
+
+from nimiqclient import AsyncNimiqClient
+
+import asyncio
+import time
+
+
+def throughput(port, concurrency, requests, height):
+    async def run():
+        async with AsyncNimiqClient(port=port) as client:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def request(number):
+                async with semaphore:
+                    await client.get_block_by_number(number % height + 1)
+
+            await request(0)
+            start = time.time()
+            await asyncio.gather(*[request(n) for n in range(requests)])
+            return requests / (time.time() - start)
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(run())
+    finally:
+        loop.close()
@@ -0,0 +1,70 @@
+"""
+Measures the cost of decoding the responses in test/fixtures with every codec available.
+
+Run from the repository root directory::
+
+    python -m benchmark.codec
+"""
+
+from nimiqclient import JSONCodec, OrjsonCodec, UjsonCodec
+from test.fixtures import *
+
+import argparse
+import inspect
+import timeit
+
+FIXTURES = [
+    AccountFixtures,
+    BlockFixtures,
+    MemPoolFixtures,
+    MinerFixtures,
+    NodeFixtures,
+    PeerFixtures,
+    TransactionFixtures,
+]
+
+
+def available_codecs():
+    codecs = []
+    for codec_class in [JSONCodec, OrjsonCodec, UjsonCodec]:
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            pass
+    return codecs
+
+
+def fixture_responses():
+    for fixtures in FIXTURES:
+        for name, method in inspect.getmembers(fixtures, inspect.isfunction):
+            yield "{0}.{1}".format(fixtures.__name__, name), method()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "-n", "--number", type=int, default=10000, help="decodes per measurement"
+    )
+    args = parser.parse_args()
+
+    codecs = available_codecs()
+    print(
+        "{0:<55} {1:>7}".format("fixture", "bytes")
+        + "".join(" {0:>10}".format(codec.name) for codec in codecs)
+    )
+    for name, response in fixture_responses():
+        data = JSONCodec().dumps(response)
+        timings = [
+            timeit.timeit(lambda: codec.loads(data), number=args.number)
+            / args.number
+            * 1e6
+            for codec in codecs
+        ]
+        print(
+            "{0:<55} {1:>7}".format(name, len(data))
+            + "".join(" {0:>8.2f}us".format(timing) for timing in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
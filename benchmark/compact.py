@@ -0,0 +1,81 @@
+"""
+Measures the memory used by each transaction, including its values, as Transaction and CompactTransaction.
+
+The transactions are decoded from JSON as returned by the server, sent from and to a limited
+number of accounts, like the history of a set of wallets. Run from the repository root directory::
+
+    python -m benchmark.compact
+"""
+
+from nimiqclient import CompactTransaction, InternPool, Transaction
+from test.fixtures import TransactionFixtures
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+
+def transactions(number, accounts):
+    """
+    Get the JSON encoded response of a request returning generated transactions.
+    """
+    template = TransactionFixtures.get_transaction_full()["result"]
+    result = []
+    for index in range(number):
+        tx = dict(template)
+        tx["hash"] = "{0:064x}".format(index)
+        tx["blockHash"] = "{0:064x}".format(index // 100 + 1 << 128)
+        tx["from"] = "{0:040x}".format(index % accounts)
+        tx["to"] = "{0:040x}".format((index + 1) % accounts)
+        result.append(tx)
+    return json.dumps(result)
+
+
+def measure(decoder, content):
+    """
+    Get the bytes allocated by each transaction decoded from a response.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    decoded = decoder(json.loads(content))
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return size / float(len(decoded))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "-n", "--number", type=int, default=100000, help="transactions decoded"
+    )
+    parser.add_argument(
+        "-a", "--accounts", type=int, default=1000, help="distinct addresses"
+    )
+    args = parser.parse_args()
+
+    content = transactions(args.number, args.accounts)
+
+    def compact(data):
+        pool = InternPool()
+        return [CompactTransaction.from_dict(tx, pool) for tx in data]
+
+    decoders = [
+        ("Transaction", lambda data: [Transaction.from_dict(tx) for tx in data]),
+        (
+            "CompactTransaction",
+            lambda data: [CompactTransaction.from_dict(tx) for tx in data],
+        ),
+        ("CompactTransaction + pool", compact),
+    ]
+    print("{0:<30} {1:>10} {2:>7}".format("model", "per tx", "ratio"))
+    baseline = None
+    for name, decoder in decoders:
+        size = measure(decoder, content)
+        baseline = baseline or size
+        print("{0:<30} {1:>8.0f} B {2:>6.1f}x".format(name, size, baseline / size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Previous implementations of the models, to compare them with the current ones.
+"""
+
+from nimiqclient.models.transaction import TXBase
+
+
+class LegacyTXBase(object):
+    """
+    TXBase as it was before __slots__, storing the attribute 'from_' as 'from' in the __dict__.
+    """
+
+    def __getattr__(self, attr):
+        if attr == "from_":
+            return self.__dict__.__getitem__("from")
+        else:
+            return self.__dict__.__getitem__(attr)
+
+    def __setattr__(self, attr, value):
+        if attr == "from_":
+            self.__dict__.__setitem__("from", value)
+        else:
+            self.__dict__.__setitem__(attr, value)
+
+
+def legacy(model):
+    """
+    Get a copy of a model storing its attributes in a per-instance __dict__, as before __slots__.
+    """
+    base = LegacyTXBase if issubclass(model, TXBase) else object
+    return type("Legacy" + model.__name__, (base,), {"__init__": model.__init__})
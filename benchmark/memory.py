@@ -0,0 +1,69 @@
+"""
+Measures the memory used by each instance of the models, with and without __slots__.
+
+The values of the attributes are shared between the instances, so only the cost of the
+instances themselves is measured. Run from the repository root directory::
+
+    python -m benchmark.memory
+"""
+
+from nimiqclient import Account, Block, Peer, Transaction, TransactionReceipt
+from test.fixtures import *
+from .legacy import legacy
+
+import argparse
+import gc
+import tracemalloc
+
+MODELS = [
+    (Transaction, TransactionFixtures.get_transaction_full),
+    (TransactionReceipt, TransactionFixtures.get_transaction_receipt_found),
+    (Block, BlockFixtures.get_block_found),
+    (Account, AccountFixtures.get_account_basic),
+    (Peer, PeerFixtures.peer_state_normal),
+]
+
+
+def measure(model, data, number):
+    """
+    Get the bytes allocated by each instance of a model.
+    """
+    instances = [None] * number
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    for index in range(number):
+        instances[index] = model(**data)
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return size / float(number)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "-n", "--number", type=int, default=100000, help="instances per measurement"
+    )
+    args = parser.parse_args()
+
+    print(
+        "{0:<20} {1:>10} {2:>10} {3:>7}".format(
+            "model", "__dict__", "__slots__", "ratio"
+        )
+    )
+    for model, fixture in MODELS:
+        data = fixture()["result"]
+        if "transactions" in data:
+            # shared as the other values, the blocks convert their transactions in place
+            data["transactions"] = []
+        before = measure(legacy(model), data, args.number)
+        after = measure(model, data, args.number)
+        print(
+            "{0:<20} {1:>8.0f} B {2:>8.0f} B {3:>6.1f}x".format(
+                model.__name__, before, after, before / after
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+"""
+Runs the benchmarks of the client hot paths and reports them as a table or as JSON to compare runs.
+
+Measures the overhead of a request through the client, the construction of every model, including
+large synthetic blocks and mempools, the throughput against a local stand-in node at several
+concurrency levels, and the memory used by each model instance. It doesn't need network access.
+Run from the repository root directory::
+
+    python -m benchmark.suite --json before.json
+    python -m benchmark.suite --compare before.json
+
+With a cassette recorded by a RecordingSession it also replays the recorded traffic through the
+client, reporting the time taken by each method, to measure the decoding and caching of realistic
+payloads::
+
+    python -m benchmark.suite -b replay --cassette traffic.jsonl.gz
+"""
+
+from nimiqclient import *
+from test.fixtures import *
+from nimiqclient.testing import StandInNode
+from .memory import MODELS as MEMORY_MODELS, measure as measure_memory
+
+from multiprocessing.pool import ThreadPool
+import argparse
+import contextlib
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+HIGHER_IS_BETTER = frozenset(["req/s", "blocks/s"])
+"""Units of the results that improve when they increase."""
+
+
+class _NullSession:
+    """
+    Session answering every request with the same body, without any I/O.
+    """
+
+    def __init__(self, response):
+        self.content = json.dumps(response).encode("utf-8")
+
+    def post(self, url, data, auth, timeout=None):
+        return self
+
+
+def per_call(function, number):
+    """
+    Get the microseconds taken by each call of a function.
+    """
+    function()
+    return timeit.timeit(function, number=number) / number * 1e6
+
+
+def call_benchmarks(scale):
+    """
+    Overhead of a request through the client, without any I/O.
+    """
+    number = 20000 * scale
+
+    def client(response, **kwargs):
+        client = NimiqClient(**kwargs)
+        client.session = _NullSession(response)
+        return client
+
+    block = BlockFixtures.get_block_found()
+    cases = [
+        ("block_number", client(BlockFixtures.block_number()).block_number),
+        ("get_block_by_number", lambda c=client(block): c.get_block_by_number(1)),
+        (
+            "get_block_by_number.json",
+            lambda c=client(block, response_mode=ResponseMode.JSON): (
+                c.get_block_by_number(1)
+            ),
+        ),
+        (
+            "get_block_by_number.bytes",
+            lambda c=client(block, response_mode=ResponseMode.BYTES): (
+                c.get_block_by_number(1)
+            ),
+        ),
+        (
+            "get_block_by_hash.cached",
+            lambda c=client(block, cache_size=100): c.get_block_by_hash(
+                block["result"]["hash"]
+            ),
+        ),
+        (
+            "get_block_by_number.coalesce",
+            lambda c=client(block, coalesce=True): c.get_block_by_number(1),
+        ),
+        (
+            "get_block_by_number.retry_policy",
+            lambda c=client(block, retry_policy=RetryPolicy()): (
+                c.get_block_by_number(1)
+            ),
+        ),
+    ]
+    for name, function in cases:
+        yield "call." + name, "us", per_call(function, number)
+
+
+def synthetic_block(transactions):
+    return StandInNode(transactions=transactions).block(1, True)
+
+
+def synthetic_mempool(transactions):
+    node = StandInNode()
+    return [node.transaction(1, index, True) for index in range(transactions)]
+
+
+def model_benchmarks(scale):
+    """
+    Construction of every model from the decoded JSON results.
+    """
+    number = 5000 * scale
+    client = NimiqClient()
+
+    def block(data):
+        # the transactions are decoded in place, so each block gets a copy of the list
+        block = client._get_block(dict(data, transactions=list(data["transactions"])))
+        list(block.transactions)
+        return block
+
+    cases = [
+        ("Account", AccountFixtures.get_account_basic()["result"], client._get_account),
+        (
+            "VestingContract",
+            AccountFixtures.get_account_vesting()["result"],
+            client._get_account,
+        ),
+        (
+            "HTLC",
+            AccountFixtures.get_account_vesting_htlc()["result"],
+            client._get_account,
+        ),
+        ("Wallet", AccountFixtures.create_account()["result"], lambda d: Wallet(**d)),
+        ("Block", BlockFixtures.get_block_found()["result"], block),
+        (
+            "Block.transactions",
+            BlockFixtures.get_block_with_transactions()["result"],
+            block,
+        ),
+        (
+            "BlockTemplate",
+            MinerFixtures.get_work_block_template()["result"],
+            client._get_block_template,
+        ),
+        (
+            "MempoolInfo",
+            MemPoolFixtures.mempool()["result"],
+            lambda d: MempoolInfo(**d),
+        ),
+        (
+            "WorkInstructions",
+            MinerFixtures.get_work()["result"],
+            lambda d: WorkInstructions(**d),
+        ),
+        ("SyncStatus", NodeFixtures.syncing()["result"], client._get_sync_status),
+        ("Peer", PeerFixtures.peer_state_normal()["result"], lambda d: Peer(**d)),
+        (
+            "Transaction",
+            TransactionFixtures.get_transaction_full()["result"],
+            client._get_transaction,
+        ),
+        (
+            "TransactionReceipt",
+            TransactionFixtures.get_transaction_receipt_found()["result"],
+            client._get_transaction_receipt,
+        ),
+    ]
+    for name, data, decoder in cases:
+        yield "model." + name, "us", per_call(lambda: decoder(data), number)
+
+    data = synthetic_block(1000)
+    yield "model.Block.1000_transactions", "us", per_call(
+        lambda: block(data), max(number // 1000, 5)
+    )
+    data = synthetic_mempool(10000)
+    yield "model.mempool.10000_transactions", "us", per_call(
+        lambda: client._get_transactions(data), max(number // 10000, 3)
+    )
+
+
+@contextlib.contextmanager
+def stand_in_process(height, transactions):
+    """
+    Runs a stand-in node in another process, so it doesn't compete with the client for the GIL.
+
+    :return: The port of the node.
+    """
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "nimiqclient.testing",
+            "--port=0",
+            "--height={0}".format(height),
+            "--transactions={0}".format(transactions),
+        ],
+        stdout=subprocess.PIPE,
+    )
+    try:
+        line = process.stdout.readline().decode("utf-8")
+        yield int(line.strip().rsplit(":", 1)[1])
+    finally:
+        process.terminate()
+        process.wait()
+        process.stdout.close()
+
+
+def throughput_benchmarks(scale):
+    """
+    Requests per second against a local stand-in node, with several threads or coroutines.
+    """
+    requests = 500 * scale
+    height = 1000
+    with stand_in_process(height, 10) as port:
+        for concurrency in (1, 4, 16):
+            client = NimiqClient(port=port, pool_maxsize=concurrency)
+            pool = ThreadPool(concurrency)
+            try:
+                heights = [n % height + 1 for n in range(requests)]
+                pool.map(client.get_block_by_number, heights[:concurrency])
+                start = time.time()
+                pool.map(client.get_block_by_number, heights)
+                elapsed = time.time() - start
+            finally:
+                pool.terminate()
+            yield "throughput.threads.{0}".format(concurrency), "req/s", (
+                requests / elapsed
+            )
+
+        client = NimiqClient(port=port)
+        start = time.time()
+        count = sum(1 for block in client.iter_blocks(1, height + 1, True))
+        yield "throughput.iter_blocks", "blocks/s", count / (time.time() - start)
+
+        if sys.version_info >= (3, 5):
+            from .async_throughput import throughput
+
+            for concurrency in (1, 16):
+                yield "throughput.async.{0}".format(concurrency), "req/s", (
+                    throughput(port, concurrency, requests, height)
+                )
+
+
+def replay_benchmarks(cassette, scale):
+    """
+    Microseconds taken by each method replaying a cassette, without a cache and with one.
+    """
+    for name, kwargs in (("replay", {}), ("replay.cached", {"cache_size": 10000})):
+        totals = {}
+        for _ in range(scale):
+            client = NimiqClient(**kwargs)
+            client.session = ReplaySession(cassette, speed=None)
+            for method, seconds, error in replay(client, cassette, speed=None):
+                total, count = totals.get(method, (0, 0))
+                totals[method] = (total + seconds, count + 1)
+        for method, (total, count) in sorted(totals.items()):
+            yield "{0}.{1}".format(name, method), "us", total / count * 1e6
+        yield "{0}.total".format(name), "ms", sum(
+            total for total, count in totals.values()
+        ) / scale * 1e3
+
+
+def memory_benchmarks(scale):
+    """
+    Bytes used by each instance of the models.
+    """
+    for model, fixture in MEMORY_MODELS:
+        data = fixture()["result"]
+        if "transactions" in data:
+            data["transactions"] = []
+        yield "memory." + model.__name__, "B", measure_memory(
+            model, data, 10000 * scale
+        )
+
+
+BENCHMARKS = [
+    ("call", call_benchmarks),
+    ("model", model_benchmarks),
+    ("throughput", throughput_benchmarks),
+    ("memory", memory_benchmarks),
+]
+
+
+def compare(result, baseline):
+    """
+    Get the relative change of a result against the baseline, positive when it improved.
+    """
+    if result["unit"] in HIGHER_IS_BETTER:
+        return result["value"] / baseline["value"] - 1
+    return baseline["value"] / result["value"] - 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "-s", "--scale", type=int, default=1, help="multiplier of the iterations"
+    )
+    parser.add_argument(
+        "-b",
+        "--benchmark",
+        action="append",
+        choices=[name for name, function in BENCHMARKS] + ["replay"],
+        help="benchmark to run, all of them if omitted",
+    )
+    parser.add_argument("--json", metavar="FILE", help="write the results to a file")
+    parser.add_argument(
+        "--compare", metavar="FILE", help="compare with the results of a previous run"
+    )
+    parser.add_argument(
+        "--cassette", metavar="FILE", help="replay the traffic recorded in a cassette"
+    )
+    args = parser.parse_args()
+
+    benchmarks = list(BENCHMARKS)
+    if args.cassette:
+        cassette = Cassette.load(args.cassette)
+        benchmarks.append(("replay", lambda scale: replay_benchmarks(cassette, scale)))
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = dict((r["name"], r) for r in json.load(f)["results"])
+
+    results = []
+    print("{0:<40} {1:>14} {2:>9}".format("benchmark", "result", "change"))
+    for name, function in benchmarks:
+        if args.benchmark and name not in args.benchmark:
+            continue
+        for label, unit, value in function(args.scale):
+            result = {"name": label, "unit": unit, "value": value}
+            results.append(result)
+            change = ""
+            if label in baseline:
+                change = "{0:>+8.1f}%".format(100 * compare(result, baseline[label]))
+            print("{0:<40} {1:>10.2f} {2:<3} {3:>9}".format(label, value, unit, change))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "time": time.time(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
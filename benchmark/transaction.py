@@ -0,0 +1,64 @@
+"""
+Measures the cost of decoding the transactions in test/fixtures/transaction.py into Transaction objects.
+
+Compares the models before __slots__, the constructor with keyword arguments and Transaction.from_dict.
+Run from the repository root directory::
+
+    python -m benchmark.transaction
+"""
+
+from nimiqclient import Transaction
+from test.fixtures import TransactionFixtures
+from .legacy import legacy
+
+import argparse
+import inspect
+import timeit
+
+
+def transaction_fixtures():
+    for name, method in inspect.getmembers(TransactionFixtures, inspect.isfunction):
+        result = method().get("result")
+        transactions = result if type(result) is list else [result]
+        transactions = [tx for tx in transactions if type(tx) is dict and "from" in tx]
+        if transactions:
+            yield name, transactions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "-n", "--number", type=int, default=100000, help="decodes per measurement"
+    )
+    args = parser.parse_args()
+
+    LegacyTransaction = legacy(Transaction)
+    decoders = [
+        ("legacy", lambda tx: LegacyTransaction(**tx)),
+        ("kwargs", lambda tx: Transaction(**tx)),
+        ("from_dict", Transaction.from_dict),
+    ]
+    print(
+        "{0:<40}".format("fixture")
+        + "".join(" {0:>10}".format(name) for name, decoder in decoders)
+        + " {0:>8}".format("speedup")
+    )
+    for name, transactions in transaction_fixtures():
+        timings = [
+            timeit.timeit(
+                lambda: [decoder(tx) for tx in transactions], number=args.number
+            )
+            / args.number
+            / len(transactions)
+            * 1e6
+            for label, decoder in decoders
+        ]
+        print(
+            "{0:<40}".format(name)
+            + "".join(" {0:>8.2f}us".format(timing) for timing in timings)
+            + " {0:>7.1f}x".format(timings[0] / timings[-1])
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,20 @@
+import sys
+
 from .nimiq_client import *
+from .batch import *
+from .cache import *
+from .chain_follower import *
+from .balanced_nimiq_client import *
+from .codec import *
+from .retry import *
+from .single_flight import *
+from .metrics import *
+from .hooks import *
+from .stream import *
+from .table import *
+from .export import *
+from .compact import *
+from .recording import *
 from .models.account import *
 from .models.block import *
 from .models.mempool import *
@@ -6,3 +22,6 @@ from .models.miner import *
 from .models.node import *
 from .models.peer import *
 from .models.transaction import *
+
+if sys.version_info >= (3, 5):
+    from .async_nimiq_client import *
@@ -0,0 +1,598 @@
+__all__ = [
+    "AsyncNimiqClient",
+    "AsyncNimiqBatch",
+    "AsyncBlockIterator",
+    "AsyncResultIterator",
+]
+
+from .nimiq_client import (
+    NimiqClient,
+    InternalErrorException,
+    RemoteErrorException,
+    TimeoutException,
+    CircuitOpenException,
+    ResponseMode,
+    _RawCallObject,
+    clock,
+)
+from .batch import NimiqBatch
+from .retry import NON_IDEMPOTENT_METHODS
+from .stream import CHUNK_SIZE, NeedMoreData, ResultParser
+
+from collections import deque
+import asyncio
+import base64
+import contextlib
+import itertools
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+
+class AsyncNimiqClient(NimiqClient):
+    """
+    Asynchronous API client for the Nimiq JSON RPC server.
+    It provides the same methods as NimiqClient as coroutines, sent over a pool of
+    keep-alive connections. Requires the aiohttp package.
+
+    The client should be closed when it's not used anymore::
+
+        async with AsyncNimiqClient() as client:
+            block_number = await client.block_number()
+
+    :param scheme: Protocol squeme, "http" or "https".
+    :type scheme: str, optional
+    :param user: Authorized user.
+    :type user: str, optional
+    :param password: Password for the authorized user.
+    :type password: str, optional
+    :param host: Host IP address.
+    :type host: str, optional
+    :param port: Host port.
+    :type port: int, optional
+    :param pool_maxsize: Maximum number of simultaneous connections to the server.
+    :type pool_maxsize: int, optional
+    :param keepalive_timeout: Seconds an idle connection is kept open for reuse.
+    :type keepalive_timeout: float, optional
+    :param codec: Codec used to encode the requests and decode the responses, the fastest one available if None.
+    :type codec: JSONCodec, optional
+    :param cache_size: Maximum number of immutable results (blocks by hash and mined transactions) kept in a cache, disabled if 0.
+    :type cache_size: int, optional
+    :param timeout: Seconds to wait for the whole request, or a (connect, read) tuple. Waits forever if None.
+    :type timeout: float or tuple, optional
+    :param retry_policy: Policy to retry the requests that failed before getting an answer. Not retried if None.
+    :type retry_policy: RetryPolicy, optional
+    :param circuit_breaker: Circuit breaker failing the requests immediately while the server is down. Disabled if None.
+    :type circuit_breaker: CircuitBreaker, optional
+    :param coalesce: If True, identical requests in flight at the same time share a single request and its result. The methods in NON_IDEMPOTENT_METHODS are never coalesced.
+    :type coalesce: bool, optional
+    :param response_mode: Representation of the results returned by the methods.
+    :type response_mode: ResponseMode, optional
+    """
+
+    def __init__(
+        self,
+        scheme="http",
+        user="",
+        password="",
+        host="127.0.0.1",
+        port=8648,
+        pool_maxsize=100,
+        keepalive_timeout=15,
+        codec=None,
+        cache_size=0,
+        timeout=None,
+        retry_policy=None,
+        circuit_breaker=None,
+        coalesce=False,
+        response_mode=ResponseMode.MODELS,
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncNimiqClient requires aiohttp, install it with 'pip install nimiqclient[async]'"
+            )
+        self.keepalive_timeout = keepalive_timeout
+        super(AsyncNimiqClient, self).__init__(
+            scheme,
+            user,
+            password,
+            host,
+            port,
+            pool_maxsize=pool_maxsize,
+            codec=codec,
+            cache_size=cache_size,
+            timeout=timeout,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            coalesce=coalesce,
+            response_mode=response_mode,
+        )
+        self.flights = {}
+        self.deadline_var = None
+        """Deadline of the requests sent by the current task, as a context variable."""
+        if contextvars is not None:
+            self.deadline_var = contextvars.ContextVar("deadline", default=None)
+        credentials = "{0}:{1}".format(user, password).encode("latin1")
+        self.headers = {
+            "Authorization": "Basic " + base64.b64encode(credentials).decode("ascii"),
+            "Content-Type": "application/json",
+        }
+
+    def _create_session(self):
+        # the aiohttp session must be created inside the event loop, see _get_session
+        return None
+
+    def _get_session(self):
+        """
+        Get the HTTP session, creating it on first use.
+
+        :return: The HTTP session.
+        :rtype: aiohttp.ClientSession
+        """
+        if self.session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize, keepalive_timeout=self.keepalive_timeout
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def close(self):
+        """
+        Closes all the connections to the server.
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @contextlib.contextmanager
+    def deadline(self, seconds):
+        """
+        Sets an overall deadline for the requests sent by the current task inside a with block,
+        including the tasks it creates there, like the ones of asyncio.gather. The timeout of each
+        request is shortened to the time left, and the requests sent once the deadline is exceeded
+        fail without reaching the server::
+
+            with client.deadline(5):
+                block = await client.get_block_by_number(await client.block_number())
+
+        Nested deadlines can only shorten the outer one. Requires Python 3.7 or later.
+
+        :param seconds: Seconds from now until the deadline.
+        :type seconds: float
+        """
+        if self.deadline_var is None:
+            raise NotImplementedError("Deadlines require the contextvars module")
+        previous = self.deadline_var.get()
+        deadline = clock() + seconds
+        if previous is not None:
+            deadline = min(deadline, previous)
+        token = self.deadline_var.set(deadline)
+        try:
+            yield
+        finally:
+            self.deadline_var.reset(token)
+
+    def _get_deadline(self):
+        if self.deadline_var is None:
+            return None
+        return self.deadline_var.get()
+
+    def _get_client_timeout(self):
+        """
+        Get the aiohttp timeout of the next request sent by the current task, shortened to its deadline.
+
+        :return: The timeout, or None to wait forever.
+        :rtype: aiohttp.ClientTimeout or None
+        :raises TimeoutException: If the deadline was exceeded.
+        """
+        timeout = self._get_timeout()
+        if timeout is None:
+            return None
+        if type(timeout) is tuple:
+            deadline = self._get_deadline()
+            connect, read = timeout
+            return aiohttp.ClientTimeout(
+                total=deadline - clock() if deadline is not None else None,
+                sock_connect=connect,
+                sock_read=read,
+            )
+        return aiohttp.ClientTimeout(total=timeout)
+
+    async def _call(self, method, *args):
+        if self.cache is not None:
+            result = self.cache.get(method, args)
+            if result is not None:
+                return result
+
+        call_object = self._make_call_object(method, args)
+        result = self._get_result(await self._send(call_object))
+
+        if self.cache is not None:
+            self.cache.put(method, args, result)
+        return result
+
+    async def _send(self, payload):
+        if self.retry_policy is None:
+            return await self._post(payload)
+
+        self.retry_policy.record_request()
+        attempt = 1
+        while True:
+            try:
+                return await self._post(payload)
+            except InternalErrorException as e:
+                delay = self._get_retry_delay(payload, attempt, e)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _post(self, payload):
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenException("Circuit open for {0}".format(self.url))
+
+        # make request
+        req_error = None
+        kwargs = {}
+        timeout = self._get_client_timeout()
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        try:
+            async with self._get_session().post(
+                self.url, data=self.codec.dumps(payload), headers=self.headers, **kwargs
+            ) as response:
+                resp_object = self._decode_response(payload, await response.read())
+
+        except Exception as e:
+            req_error = e
+        except BaseException:
+            # like a cancelled task, the server is not at fault
+            if breaker is not None:
+                breaker.record_cancel()
+            raise
+
+        if breaker is not None:
+            if req_error is None:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+
+        # raise if there was any error
+        if isinstance(req_error, asyncio.TimeoutError):
+            raise TimeoutException(req_error)
+        if req_error is not None:
+            raise InternalErrorException(req_error)
+
+        return resp_object
+
+    async def _request(self, decoder, method, *args):
+        if self.single_flight is None or method in NON_IDEMPOTENT_METHODS:
+            return await self._call_and_decode(decoder, method, *args)
+
+        key = (self.response_mode, method, args)
+        try:
+            future = self.flights.get(key)
+        except TypeError:
+            # unhashable parameters
+            return await self._call_and_decode(decoder, method, *args)
+        if future is None or future.done():
+            future = asyncio.ensure_future(
+                self._call_and_decode(decoder, method, *args)
+            )
+            self.flights[key] = future
+            future.add_done_callback(lambda f: self._end_flight(key, f))
+            # a cancelled caller doesn't cancel the request shared with the others
+            return await asyncio.shield(future)
+
+        self.single_flight.coalesced += 1
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(future), self._get_wait_timeout()
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutException("Timed out waiting for the identical call in flight")
+        except TimeoutException:
+            # the timeout of the request in flight, like its deadline, is not shared
+            pass
+        return await self._call_and_decode(decoder, method, *args)
+
+    def _end_flight(self, key, future):
+        if self.flights.get(key) is future:
+            del self.flights[key]
+
+    async def _call_and_decode(self, decoder, method, *args):
+        if self.response_mode == ResponseMode.BYTES:
+            call_object = _RawCallObject(self._make_call_object(method, args))
+            return self._get_result(await self._send(call_object))
+        result = await self._call(method, *args)
+        if decoder is None or self.response_mode == ResponseMode.JSON:
+            return result
+        return decoder(result)
+
+    def _stream(self, decoder, method, *args):
+        """
+        Performs a JSONRPC request with an array result, and decodes the elements of the result
+        one at a time as the body of the response arrives, instead of buffering the whole body::
+
+            async for transaction in client.iter_mempool_content(True):
+                print(transaction.hash)
+
+        The request is not cached nor retried, and the elements are returned as decoded JSON by a
+        client in JSON or bytes mode.
+
+        :param decoder: Function used to convert each element, or None to return them as is.
+        :type decoder: function or None
+        :param method: JSONRPC method.
+        :type method: str
+        :param params: Parameters used by the request.
+        :type params: list
+        :return: Asynchronous iterator of the elements converted by the decoder.
+        :rtype: AsyncResultIterator
+        """
+        if self.response_mode != ResponseMode.MODELS:
+            decoder = None
+        return AsyncResultIterator(self, decoder, self._make_call_object(method, args))
+
+    def batch(self, max_size=None):
+        """
+        Creates a batch to send several JSONRPC requests to the server in a single round trip.
+        The batch provides the same methods as the client, but each of them returns a BatchEntry
+        which is resolved once the batch is sent.
+
+        :param max_size: Maximum number of requests per HTTP request, the whole batch is sent at once if None.
+        :type max_size: int, optional
+        :return: A new empty batch.
+        :rtype: AsyncNimiqBatch
+        """
+        return AsyncNimiqBatch(self, max_size)
+
+    async def _call_batch(self, call_objects):
+        return self._get_batch_results(await self._send(call_objects))
+
+    def iter_blocks(
+        self, start, stop=None, include_transactions=None, batch_size=100, prefetch=4
+    ):
+        """
+        Iterates over the blocks in a range of heights. The blocks are requested in batches, several
+        of them in flight at the same time, while only a bounded number of blocks is kept in memory.
+
+        :param start: Height of the first block.
+        :type start: int
+        :param stop: Height after the last block, iterates until the latest block if None.
+        :type stop: int, optional
+        :param include_transactions: If True it returns the full transaction objects, if False only the hashes of the transactions.
+        :type include_transactions: bool, optional
+        :param batch_size: Number of blocks requested in each batch.
+        :type batch_size: int, optional
+        :param prefetch: Maximum number of batches requested ahead of the block being returned.
+        :type prefetch: int, optional
+        :return: Asynchronous iterator of blocks in height order, it stops at the first block not found.
+        :rtype: AsyncBlockIterator
+        """
+        return AsyncBlockIterator(
+            self, start, stop, include_transactions, batch_size, prefetch
+        )
+
+    async def _get_blocks(self, start, stop, include_transactions):
+        batch = self.batch()
+        entries = [
+            batch.get_block_by_number(height, include_transactions)
+            for height in range(start, stop)
+        ]
+        await batch.send()
+        return [entry.result() for entry in entries]
+
+
+class AsyncNimiqBatch(NimiqBatch):
+    """
+    Batch of JSONRPC requests sent asynchronously to the server as JSON-RPC 2.0 batches.
+
+    Used as an asynchronous context manager the batch is sent when leaving the block::
+
+        async with client.batch() as batch:
+            balances = [batch.get_balance(address) for address in addresses]
+        print([balance.result() for balance in balances])
+
+    :param client: Client used to send the batch.
+    :type client: AsyncNimiqClient
+    :param max_size: Maximum number of requests per HTTP request, the whole batch is sent at once if None.
+    :type max_size: int, optional
+    """
+
+    async def send(self):
+        """
+        Sends all the queued requests and resolves their entries.
+        An error returned by the server for one of the requests doesn't fail the rest of the batch.
+
+        :return: List with the result of each request in order, or the RemoteErrorException returned by the server.
+        :rtype: list
+        :raises InternalErrorException: If the batch couldn't be sent.
+        """
+        entries = self._take_entries()
+        for chunk in self._chunks(entries):
+            resp_objects = await self.client._call_batch(
+                [entry.call_object for entry in chunk]
+            )
+            self._resolve_chunk(chunk, resp_objects)
+        return self._results(entries)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            await self.send()
+
+
+class AsyncBlockIterator:
+    """
+    Asynchronous iterator over the blocks in a range of heights, returned by AsyncNimiqClient.iter_blocks.
+    """
+
+    def __init__(self, client, start, stop, include_transactions, batch_size, prefetch):
+        self.client = client
+        self.stop = stop
+        self.include_transactions = include_transactions
+        self.batch_size = batch_size
+        self.prefetch = prefetch
+        if stop is None:
+            self.starts = itertools.count(start, batch_size)
+        else:
+            self.starts = iter(range(start, stop, batch_size))
+        self.pending = deque()
+        self.blocks = deque()
+        self.finished = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.blocks:
+            if not self.finished:
+                self._request_batches()
+            if not self.pending:
+                raise StopAsyncIteration
+            try:
+                blocks = await self.pending.popleft()
+            except BaseException:
+                self.close()
+                raise
+            for block in blocks:
+                if block is None:
+                    self.close()
+                    break
+                self.blocks.append(block)
+        return self.blocks.popleft()
+
+    def _request_batches(self):
+        while len(self.pending) < self.prefetch:
+            batch_start = next(self.starts, None)
+            if batch_start is None:
+                break
+            batch_stop = batch_start + self.batch_size
+            if self.stop is not None:
+                batch_stop = min(batch_stop, self.stop)
+            self.pending.append(
+                asyncio.ensure_future(
+                    self.client._get_blocks(
+                        batch_start, batch_stop, self.include_transactions
+                    )
+                )
+            )
+
+    def close(self):
+        """
+        Stops the iteration, cancelling the batches in flight.
+        """
+        self.finished = True
+        for future in self.pending:
+            future.cancel()
+        self.pending.clear()
+
+
+class AsyncResultIterator:
+    """
+    Asynchronous iterator over the elements of the array result of a request, decoded as the
+    response arrives, returned by AsyncNimiqClient.iter_transactions_by_address and
+    AsyncNimiqClient.iter_mempool_content. The request is sent on the first iteration.
+    """
+
+    def __init__(self, client, decoder, call_object):
+        self.client = client
+        self.decoder = decoder
+        self.call_object = call_object
+        self.parser = ResultParser()
+        self.response = None
+        self.finished = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.finished:
+            raise StopAsyncIteration
+        breaker = self.client.circuit_breaker
+        if self.response is None and breaker is not None and not breaker.allow():
+            self.finished = True
+            raise CircuitOpenException("Circuit open for {0}".format(self.client.url))
+
+        try:
+            if self.response is None:
+                await self._send()
+            element = await self._next_element()
+        except RemoteErrorException:
+            self._finish(False)
+            raise
+        except InternalErrorException:
+            self._finish(True)
+            raise
+        except asyncio.TimeoutError as e:
+            self._finish(True)
+            raise TimeoutException(e)
+        except Exception as e:
+            self._finish(True)
+            raise InternalErrorException(e)
+        except BaseException:
+            # like a cancelled task, the server is not at fault
+            self.close()
+            if breaker is not None:
+                breaker.record_cancel()
+            raise
+
+        if element is ResultParser.END:
+            self._finish(False)
+            raise StopAsyncIteration
+        return self.decoder(element) if self.decoder is not None else element
+
+    async def _send(self):
+        client = self.client
+        kwargs = {}
+        timeout = client._get_client_timeout()
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        self.response = await client._get_session().post(
+            client.url,
+            data=client.codec.dumps(self.call_object),
+            headers=client.headers,
+            **kwargs
+        )
+
+    async def _next_element(self):
+        reader = self.parser.reader
+        while True:
+            try:
+                return self.parser.next()
+            except NeedMoreData as e:
+                while reader.available() < e.size and not reader.eof:
+                    reader.push(await self.response.content.read(CHUNK_SIZE))
+
+    def _finish(self, failed):
+        self.close()
+        breaker = self.client.circuit_breaker
+        if breaker is not None:
+            if failed:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+    def close(self):
+        """
+        Stops the iteration, releasing the connection of the response.
+        """
+        self.finished = True
+        if self.response is not None:
+            self.response.close()
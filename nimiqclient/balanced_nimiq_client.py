@@ -0,0 +1,463 @@
+__all__ = ["Endpoint", "BalancingStrategy", "BalancedNimiqClient", "WRITE_METHODS"]
+
+__metaclass__ = type
+
+from .nimiq_client import NimiqClient, InternalErrorException
+from .models.node import ConsensusState
+
+from requests.auth import HTTPBasicAuth
+from enum import Enum
+from collections import deque
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+clock = getattr(time, "monotonic", time.time)
+
+WRITE_METHODS = frozenset(["sendTransaction", "sendRawTransaction", "submitBlock"])
+"""JSONRPC methods sent to the write endpoints."""
+
+
+class BalancingStrategy(str, Enum):
+    """
+    Strategy used to choose the endpoint for a request.
+    """
+
+    LEAST_OUTSTANDING = "least_outstanding"
+    """Endpoint with the fewest requests in flight, the fastest one on ties."""
+    EWMA = "ewma"
+    """Endpoint with the lowest average latency weighted by its requests in flight."""
+
+    def __str__(self):
+        return self.value
+
+
+class Endpoint:
+    """
+    Nimiq JSON RPC server used by BalancedNimiqClient, with its load and health.
+
+    :param scheme: Protocol squeme, "http" or "https".
+    :type scheme: str, optional
+    :param user: Authorized user.
+    :type user: str, optional
+    :param password: Password for the authorized user.
+    :type password: str, optional
+    :param host: Host IP address.
+    :type host: str, optional
+    :param port: Host port.
+    :type port: int, optional
+    :param decay: Weight of the latest latency in the exponentially weighted moving average.
+    :type decay: float, optional
+    :param samples: Number of latest latencies kept to compute the percentiles.
+    :type samples: int, optional
+    :param circuit_breaker: Circuit breaker failing the requests to the endpoint immediately while it's down. Disabled if None.
+    :type circuit_breaker: CircuitBreaker, optional
+    """
+
+    def __init__(
+        self,
+        scheme="http",
+        user="",
+        password="",
+        host="127.0.0.1",
+        port=8648,
+        decay=0.2,
+        samples=100,
+        circuit_breaker=None,
+    ):
+        self.url = "{0}://{1}:{2}".format(scheme, host, port)
+        self.auth = HTTPBasicAuth(user, password)
+        self.decay = decay
+        self.circuit_breaker = circuit_breaker
+        self.lock = threading.Lock()
+        self.outstanding = 0
+        """Number of requests in flight."""
+        self.latency = None
+        """Exponentially weighted moving average of the latency in seconds, None before the first response."""
+        self.latencies = deque(maxlen=samples)
+        """Latest latencies in seconds."""
+        self.healthy = True
+        """False if the endpoint failed the last health check."""
+        self.block_number = None
+        """Block height reported in the last health check."""
+        self.consensus = None
+        """Consensus state reported in the last health check."""
+
+    def __repr__(self):
+        return "Endpoint({0})".format(self.url)
+
+    def start(self):
+        """
+        Registers a request in flight.
+        """
+        with self.lock:
+            self.outstanding += 1
+
+    def finish(self, latency=None):
+        """
+        Registers the end of a request in flight.
+
+        :param latency: Seconds until the response was received, None if the request failed.
+        :type latency: float, optional
+        """
+        with self.lock:
+            self.outstanding -= 1
+            if latency is not None:
+                self.latencies.append(latency)
+                if self.latency is None:
+                    self.latency = latency
+                else:
+                    self.latency += self.decay * (latency - self.latency)
+
+    @property
+    def available(self):
+        """False if the circuit breaker of the endpoint would reject a request."""
+        return self.circuit_breaker is None or self.circuit_breaker.available
+
+    def percentile(self, percentile, min_samples=10):
+        """
+        Get a percentile of the latest latencies.
+
+        :param percentile: The percentile, between 0 and 1.
+        :type percentile: float
+        :param min_samples: Minimum number of latencies required.
+        :type min_samples: int, optional
+        :return: The latency in seconds, or None if there are not enough latencies.
+        :rtype: float or None
+        """
+        with self.lock:
+            latencies = sorted(self.latencies)
+        if not latencies or len(latencies) < min_samples:
+            return None
+        return latencies[int(percentile * (len(latencies) - 1) + 0.5)]
+
+    def load(self, strategy):
+        """
+        Get the load of the endpoint according to a strategy, lower is better.
+
+        :param strategy: Strategy used to choose the endpoint.
+        :type strategy: BalancingStrategy
+        :return: The load.
+        :rtype: tuple
+        """
+        latency = self.latency or 0.0
+        if strategy == BalancingStrategy.EWMA:
+            return (latency * (self.outstanding + 1), self.outstanding)
+        return (self.outstanding, latency)
+
+
+class BalancedNimiqClient(NimiqClient):
+    """
+    API client for several Nimiq JSON RPC servers. Requests are sent to the healthy endpoint
+    with the lowest load, while the write methods in WRITE_METHODS are sent to the write endpoints.
+    Endpoints out of consensus or lagging behind the highest block number are ejected by the
+    health checks, until they recover.
+
+    :param endpoints: Endpoints used for the requests.
+    :type endpoints: list of (Endpoint)
+    :param write_endpoints: Endpoints used for the write methods, the same as endpoints if None.
+    :type write_endpoints: list of (Endpoint), optional
+    :param strategy: Strategy used to choose the endpoint for a request.
+    :type strategy: BalancingStrategy, optional
+    :param max_lag: Maximum number of blocks an endpoint can be behind the highest one to be healthy.
+    :type max_lag: int, optional
+    :param health_check_interval: Seconds between health checks, run in the background. Only checked by calling check_health if None.
+    :type health_check_interval: float, optional
+    :param health_check_timeout: Seconds to wait for each endpoint in a health check, or a (connect, read) tuple, an endpoint not answering in time is unhealthy.
+    :type health_check_timeout: float or tuple, optional
+    :param hedge_percentile: Percentile of the latency of an endpoint after which a read still in flight is duplicated to another endpoint, the first answer is used. Disabled if None.
+    :type hedge_percentile: float, optional
+    :param kwargs: Other arguments of NimiqClient, like pool sizes or caches.
+    """
+
+    def __init__(
+        self,
+        endpoints,
+        write_endpoints=None,
+        strategy=BalancingStrategy.LEAST_OUTSTANDING,
+        max_lag=2,
+        health_check_interval=None,
+        health_check_timeout=5,
+        hedge_percentile=None,
+        **kwargs
+    ):
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        self.endpoints = list(endpoints)
+        self.write_endpoints = list(write_endpoints or endpoints)
+        self.strategy = BalancingStrategy(strategy)
+        self.max_lag = max_lag
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.hedge_percentile = hedge_percentile
+        self.health_check_lock = threading.Lock()
+        self.last_health_check = clock()
+        self.health_check_thread = None
+        """Thread running the last health check due, None if none was due yet."""
+        kwargs.setdefault(
+            "pool_connections", len(set(self.endpoints + self.write_endpoints))
+        )
+        super(BalancedNimiqClient, self).__init__(**kwargs)
+        self.url = self.endpoints[0].url
+        self.auth = self.endpoints[0].auth
+
+    def _is_write(self, payload):
+        call_objects = payload if type(payload) is list else [payload]
+        return any(
+            call_object.get("method") in WRITE_METHODS for call_object in call_objects
+        )
+
+    def _choose_endpoint(self, payload, exclude=()):
+        """
+        Choose the endpoint for a JSONRPC request object, or a list of them.
+
+        :param payload: The JSONRPC request object or list of request objects.
+        :type payload: dict or list of (dict)
+        :param exclude: Endpoints that can't be chosen.
+        :type exclude: list of (Endpoint), optional
+        :return: The endpoint with the lowest load, or None if all of them are excluded.
+        :rtype: Endpoint or None
+        """
+        if self._is_write(payload):
+            candidates = self.write_endpoints
+        else:
+            candidates = self.endpoints
+        candidates = [endpoint for endpoint in candidates if endpoint not in exclude]
+        if not candidates:
+            return None
+        available = [endpoint for endpoint in candidates if endpoint.available]
+        healthy = [endpoint for endpoint in available if endpoint.healthy]
+        return min(
+            healthy or available or candidates, key=lambda e: e.load(self.strategy)
+        )
+
+    def _send(self, payload):
+        # the endpoints that failed an attempt of the request, avoided by its retries
+        previous = getattr(self.local, "failed_endpoints", None)
+        self.local.failed_endpoints = []
+        try:
+            return super(BalancedNimiqClient, self)._send(payload)
+        finally:
+            self.local.failed_endpoints = previous
+
+    def _post(self, payload):
+        self._check_health_if_due()
+        failed = getattr(self.local, "failed_endpoints", None)
+        endpoint = None
+        if failed:
+            endpoint = self._choose_endpoint(payload, exclude=failed)
+        if endpoint is None:
+            # every endpoint failed already, the retry goes to the least loaded one
+            endpoint = self._choose_endpoint(payload)
+        try:
+            if self.hedge_percentile is None or self._is_write(payload):
+                return self._post_to_endpoint(endpoint, payload, self._get_timeout())
+            return self._post_hedged(endpoint, payload)
+        except InternalErrorException:
+            if failed is not None:
+                failed.append(endpoint)
+            raise
+
+    def _stream(self, decoder, method, *args):
+        self._check_health_if_due()
+        endpoint = self._choose_endpoint({"method": method})
+        return self._stream_from_endpoint(endpoint, decoder, method, args)
+
+    def _stream_from_endpoint(self, endpoint, decoder, method, args):
+        """
+        Performs a JSONRPC request with an array result on an endpoint registering its load,
+        decoding the elements of the result as the body of the response arrives.
+
+        :param endpoint: The endpoint.
+        :type endpoint: Endpoint
+        :return: Generator of the elements converted by the decoder.
+        :rtype: generator of (object)
+        """
+        endpoint.start()
+        try:
+            # the latency of a streamed request depends on its size, it's not sampled
+            for element in self._stream_from(
+                endpoint.url,
+                endpoint.auth,
+                endpoint.circuit_breaker,
+                decoder,
+                method,
+                args,
+            ):
+                yield element
+        finally:
+            endpoint.finish()
+
+    def _post_hedged(self, endpoint, payload):
+        """
+        Sends a JSONRPC read request to an endpoint, and duplicates it to another endpoint if
+        there is no answer after the hedge percentile of the latency of the first one.
+
+        :param endpoint: The endpoint.
+        :type endpoint: Endpoint
+        :param payload: The JSONRPC request object or list of request objects.
+        :type payload: dict or list of (dict)
+        :return: The first JSONRPC response object or list of response objects received.
+        :rtype: dict or list of (dict)
+        """
+        responses = queue.Queue()
+        self._post_in_background(endpoint, payload, responses)
+        pending = 1
+        delay = endpoint.percentile(self.hedge_percentile)
+        error = None
+        while pending:
+            try:
+                resp_object, error = responses.get(timeout=delay)
+            except queue.Empty:
+                delay = None
+                hedge = self._choose_endpoint(payload, exclude=[endpoint])
+                if hedge is not None:
+                    self._post_in_background(hedge, payload, responses)
+                    pending += 1
+                continue
+            pending -= 1
+            if error is None:
+                return resp_object
+        raise error
+
+    def _post_in_background(self, endpoint, payload, responses):
+        # the timeout is computed here because the deadline is local to the calling thread
+        thread = threading.Thread(
+            target=self._post_to_queue,
+            args=(
+                self._capture_context(),
+                endpoint,
+                payload,
+                self._get_timeout(),
+                responses,
+            ),
+        )
+        thread.daemon = True
+        thread.start()
+
+    def _post_to_queue(self, context, endpoint, payload, timeout, responses):
+        try:
+            responses.put(
+                (
+                    self._call_in_context(
+                        context, self._post_to_endpoint, endpoint, payload, timeout
+                    ),
+                    None,
+                )
+            )
+        except Exception as e:
+            responses.put((None, e))
+
+    def _post_to_endpoint(self, endpoint, payload, timeout=None):
+        """
+        Sends a JSONRPC request object, or a list of them, to an endpoint registering its load.
+
+        :param endpoint: The endpoint.
+        :type endpoint: Endpoint
+        :param payload: The JSONRPC request object or list of request objects.
+        :type payload: dict or list of (dict)
+        :param timeout: Seconds to wait for the endpoint, or a (connect, read) tuple. Waits forever if None.
+        :type timeout: float or tuple, optional
+        :return: The JSONRPC response object or list of response objects.
+        :rtype: dict or list of (dict)
+        """
+        endpoint.start()
+        start = clock()
+        latency = None
+        try:
+            resp_object = self._post_to(
+                endpoint.url, endpoint.auth, payload, timeout, endpoint.circuit_breaker
+            )
+            latency = clock() - start
+            return resp_object
+        finally:
+            endpoint.finish(latency)
+
+    def _check_health_if_due(self):
+        if self.health_check_interval is None:
+            return
+        if clock() - self.last_health_check < self.health_check_interval:
+            return
+        # only one check runs at a time, in the background, the requests keep using the previous health
+        with self.health_check_lock:
+            thread = self.health_check_thread
+            if thread is not None and thread.is_alive():
+                return
+            self.last_health_check = clock()
+            self.health_check_thread = threading.Thread(target=self._run_health_check)
+            self.health_check_thread.daemon = True
+            self.health_check_thread.start()
+
+    def _run_health_check(self):
+        try:
+            self.check_health()
+        finally:
+            with self.health_check_lock:
+                self.last_health_check = clock()
+
+    def _check_endpoint(self, endpoint):
+        """
+        Requests the consensus state and block number of an endpoint, None if it is not reachable.
+
+        :param endpoint: The endpoint.
+        :type endpoint: Endpoint
+        """
+        call_objects = [
+            self._make_call_object("consensus", []),
+            self._make_call_object("blockNumber", []),
+        ]
+        try:
+            resp_objects = self._get_batch_results(
+                self._post_to_endpoint(
+                    endpoint, call_objects, self.health_check_timeout
+                )
+            )
+            endpoint.consensus = ConsensusState(
+                self._get_result(resp_objects[call_objects[0]["id"]])
+            )
+            endpoint.block_number = self._get_result(
+                resp_objects[call_objects[1]["id"]]
+            )
+        except Exception:
+            endpoint.consensus = None
+            endpoint.block_number = None
+
+    def check_health(self):
+        """
+        Requests the consensus state and block number of every endpoint, and ejects the endpoints
+        that are not reachable, out of consensus or lagging behind the highest block number.
+        The endpoints are checked at the same time, each one within the health check timeout.
+
+        :return: The healthy endpoints.
+        :rtype: list of (Endpoint)
+        """
+        endpoints = []
+        for endpoint in self.endpoints + self.write_endpoints:
+            if endpoint not in endpoints:
+                endpoints.append(endpoint)
+
+        threads = [
+            threading.Thread(target=self._check_endpoint, args=(endpoint,))
+            for endpoint in endpoints
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        block_numbers = [
+            e.block_number for e in endpoints if e.block_number is not None
+        ]
+        highest = max(block_numbers) if block_numbers else None
+        for endpoint in endpoints:
+            endpoint.healthy = (
+                endpoint.consensus == ConsensusState.ESTABLISHED
+                and endpoint.block_number is not None
+                and endpoint.block_number >= highest - self.max_lag
+            )
+        return [endpoint for endpoint in endpoints if endpoint.healthy]
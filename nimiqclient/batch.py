@@ -0,0 +1,170 @@
+__all__ = ["NimiqBatch", "BatchEntry"]
+
+__metaclass__ = type
+
+from .nimiq_client import (
+    NimiqClient,
+    InternalErrorException,
+    RemoteErrorException,
+    ResponseMode,
+)
+
+
+class BatchEntry:
+    """
+    Request queued in a batch. The result is available once the batch is sent.
+
+    :param call_object: The JSONRPC request object.
+    :type call_object: dict
+    :param decoder: Function used to convert the result, or None to return it as is.
+    :type decoder: function or None
+    """
+
+    def __init__(self, call_object, decoder):
+        self.call_object = call_object
+        self.decoder = decoder
+        self.done = False
+        """True once the response for the request was received."""
+        self.value = None
+        """Model representation of the result, None if not done or failed."""
+        self.error = None
+        """Exception raised by the request, None if not done or successful."""
+
+    @property
+    def id(self):
+        """JSONRPC request id."""
+        return self.call_object["id"]
+
+    @property
+    def method(self):
+        """JSONRPC method."""
+        return self.call_object["method"]
+
+    def result(self):
+        """
+        Returns the model representation of the result.
+
+        :return: The result of the request.
+        :rtype: object
+        :raises InternalErrorException: If the batch was not sent yet or there was no response for the request.
+        :raises RemoteErrorException: If the server answered the request with an error.
+        """
+        if not self.done:
+            raise InternalErrorException(
+                "Batch request {0} ({1}) was not sent yet".format(self.id, self.method)
+            )
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def _resolve(self, client, resp_object):
+        try:
+            if resp_object is None:
+                raise InternalErrorException(
+                    "No response for batch request {0} ({1})".format(
+                        self.id, self.method
+                    )
+                )
+            result = client._get_result(resp_object)
+            self.value = self.decoder(result) if self.decoder is not None else result
+        except (InternalErrorException, RemoteErrorException) as e:
+            self.error = e
+        self.done = True
+
+
+class NimiqBatch(NimiqClient):
+    """
+    Batch of JSONRPC requests sent to the server as JSON-RPC 2.0 batches.
+    It provides the same methods as NimiqClient, but instead of the result, every method
+    returns a BatchEntry which is resolved when the batch is sent. The iterators, timeouts,
+    deadlines and response modes are not available on a batch, they are the ones of its client.
+
+    Used as a context manager the batch is sent when leaving the block::
+
+        with client.batch() as batch:
+            balances = [batch.get_balance(address) for address in addresses]
+        print([balance.result() for balance in balances])
+
+    :param client: Client used to send the batch.
+    :type client: NimiqClient
+    :param max_size: Maximum number of requests per HTTP request, the whole batch is sent at once if None.
+    :type max_size: int, optional
+    """
+
+    def __init__(self, client, max_size=None):
+        self.client = client
+        self.max_size = max_size
+        self.entries = []
+
+    def _request(self, decoder, method, *args):
+        if self.client.response_mode != ResponseMode.MODELS:
+            decoder = None
+        entry = BatchEntry(self.client._make_call_object(method, args), decoder)
+        self.entries.append(entry)
+        return entry
+
+    def batch(self, max_size=None):
+        raise InternalErrorException("Batches can't be nested")
+
+    def with_timeout(self, timeout):
+        raise InternalErrorException("The timeout of a batch is the one of its client")
+
+    def with_response_mode(self, response_mode):
+        raise InternalErrorException(
+            "The response mode of a batch is the one of its client"
+        )
+
+    def deadline(self, seconds):
+        raise InternalErrorException("Set the deadline on the client sending the batch")
+
+    def iter_blocks(
+        self, start, stop=None, include_transactions=None, batch_size=100, prefetch=4
+    ):
+        raise InternalErrorException("Iterators can't be batched")
+
+    def iter_transactions_by_address(self, address, number_of_transactions=None):
+        raise InternalErrorException("Iterators can't be batched")
+
+    def iter_mempool_content(self, include_transactions=None):
+        raise InternalErrorException("Iterators can't be batched")
+
+    def send(self):
+        """
+        Sends all the queued requests and resolves their entries.
+        An error returned by the server for one of the requests doesn't fail the rest of the batch.
+
+        :return: List with the result of each request in order, or the RemoteErrorException returned by the server.
+        :rtype: list
+        :raises InternalErrorException: If the batch couldn't be sent.
+        """
+        entries = self._take_entries()
+        for chunk in self._chunks(entries):
+            resp_objects = self.client._call_batch(
+                [entry.call_object for entry in chunk]
+            )
+            self._resolve_chunk(chunk, resp_objects)
+        return self._results(entries)
+
+    def _take_entries(self):
+        entries, self.entries = self.entries, []
+        return entries
+
+    def _chunks(self, entries):
+        size = self.max_size or max(len(entries), 1)
+        return [entries[start : start + size] for start in range(0, len(entries), size)]
+
+    def _resolve_chunk(self, chunk, resp_objects):
+        for entry in chunk:
+            entry._resolve(self.client, resp_objects.get(entry.id))
+
+    def _results(self, entries):
+        return [
+            entry.error if entry.error is not None else entry.value for entry in entries
+        ]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.send()
@@ -0,0 +1,297 @@
+__all__ = ["LRUCache", "ImmutableCache", "VolatileCache", "DEFAULT_VOLATILE_TTLS"]
+
+__metaclass__ = type
+
+from collections import OrderedDict
+import threading
+import time
+
+DEFAULT_VOLATILE_TTLS = {
+    "blockNumber": 1.0,
+    "consensus": 1.0,
+    "hashrate": 5.0,
+    "mempool": 1.0,
+    "peerCount": 5.0,
+    "syncing": 1.0,
+}
+"""Time to live in seconds of the results of frequently polled requests."""
+
+
+class LRUCache:
+    """
+    Thread safe mapping holding up to max_size items, the least recently used items are evicted first.
+
+    :param max_size: Maximum number of items in the cache.
+    :type max_size: int
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, key, default=None):
+        """
+        Get an item and mark it as the most recently used.
+
+        :param key: Key of the item.
+        :type key: object
+        :param default: Value returned if the item is not in the cache.
+        :type default: object, optional
+        :return: The cached item or the default value.
+        :rtype: object
+        """
+        with self.lock:
+            try:
+                value = self.items.pop(key)
+            except KeyError:
+                return default
+            self.items[key] = value
+            return value
+
+    def set(self, key, value):
+        """
+        Adds or replaces an item, evicting the least recently used item if the cache is full.
+
+        :param key: Key of the item.
+        :type key: object
+        :param value: The item.
+        :type value: object
+        """
+        with self.lock:
+            self.items.pop(key, None)
+            self.items[key] = value
+            while len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """
+        Removes an item.
+
+        :param key: Key of the item.
+        :type key: object
+        :param default: Value returned if the item is not in the cache.
+        :type default: object, optional
+        :return: The removed item or the default value.
+        :rtype: object
+        """
+        with self.lock:
+            return self.items.pop(key, default)
+
+    def clear(self):
+        """
+        Removes all the items.
+        """
+        with self.lock:
+            self.items.clear()
+
+
+class ImmutableCache:
+    """
+    Cache for the results of requests that never change once they are available: blocks by hash
+    and transactions included in a block. The number of confirmations is not cached, it's recomputed
+    from the latest block height known by the cache.
+
+    :param max_size: Maximum number of results in the cache.
+    :type max_size: int
+    """
+
+    def __init__(self, max_size):
+        self.items = LRUCache(max_size)
+        self.lock = threading.Lock()
+        self.head = 0
+        """Latest block height known by the cache."""
+
+    def _is_immutable(self, method, result):
+        if method == "getBlockByHash":
+            return result is not None
+        if method == "getTransactionByHash":
+            return result is not None and result.get("blockHash") is not None
+        return False
+
+    def _observe(self, height):
+        with self.lock:
+            if height > self.head:
+                self.head = height
+
+    def get(self, method, params):
+        """
+        Get the cached result of a request.
+
+        :param method: JSONRPC method.
+        :type method: str
+        :param params: Parameters used by the request.
+        :type params: tuple
+        :return: A copy of the cached result with updated confirmations, or None if not cached.
+        :rtype: dict or None
+        """
+        try:
+            entry = self.items.get((method, params))
+        except TypeError:
+            # unhashable parameters
+            return None
+        if entry is None:
+            return None
+        result, head = entry
+        return self._confirmed(result, max(self.head - head, 0))
+
+    def _confirmed(self, data, confirmations):
+        data = dict(data)
+        data["confirmations"] = data.get("confirmations", 0) + confirmations
+        transactions = data.get("transactions")
+        if transactions is not None:
+            data["transactions"] = [
+                self._confirmed(tx, confirmations) if type(tx) is dict else tx
+                for tx in transactions
+            ]
+        return data
+
+    def put(self, method, params, result):
+        """
+        Stores the result of a request if it's immutable, and updates the latest known block height.
+
+        :param method: JSONRPC method.
+        :type method: str
+        :param params: Parameters used by the request.
+        :type params: tuple
+        :param result: Result of the request.
+        :type result: object
+        """
+        if method == "blockNumber":
+            if result is not None:
+                self._observe(result)
+        elif type(result) is dict and result.get("confirmations"):
+            # the server counts the block containing a transaction as one of its confirmations
+            if result.get("number") is not None:
+                self._observe(result["number"] + result["confirmations"])
+            elif result.get("blockNumber") is not None:
+                self._observe(result["blockNumber"] + result["confirmations"] - 1)
+        if self._is_immutable(method, result):
+            try:
+                # the result is copied because the models modify it during decoding
+                self.items.set(
+                    (method, params), (self._confirmed(result, 0), self.head)
+                )
+            except TypeError:
+                # unhashable parameters
+                pass
+
+    def clear(self):
+        """
+        Removes all the cached results.
+        """
+        self.items.clear()
+
+
+def _copy_result(result):
+    """
+    Copies the dicts and lists of a result, so each caller can modify the one it gets.
+    """
+    if type(result) is dict:
+        return dict((key, _copy_result(value)) for key, value in result.items())
+    if type(result) is list:
+        return [_copy_result(value) for value in result]
+    return result
+
+
+class VolatileCache:
+    """
+    Cache for the results of frequently polled requests that change over time, like blockNumber or mempool.
+    A result is fresh during its time to live. After that, it's still returned during the stale period while
+    it's refreshed in the background. All the results are dropped when a new block height is observed.
+
+    :param ttls: Time to live in seconds of the results by JSONRPC method, methods not included are not cached.
+    :type ttls: dict
+    :param stale_ttls: Seconds a result can be returned after its time to live while it's refreshed, by JSONRPC method. Defaults to the time to live.
+    :type stale_ttls: dict, optional
+    """
+
+    def __init__(self, ttls, stale_ttls=None):
+        self.ttls = dict(ttls)
+        self.stale_ttls = dict(ttls)
+        self.stale_ttls.update(stale_ttls or {})
+        self.entries = {}
+        self.refreshing = set()
+        self.lock = threading.Lock()
+        self.head = None
+        """Latest block height observed by the cache."""
+        self.clock = getattr(time, "monotonic", time.time)
+
+    def caches(self, method):
+        """
+        Check if the results of a JSONRPC method are cached.
+
+        :param method: JSONRPC method.
+        :type method: str
+        :return: True if the results are cached.
+        :rtype: bool
+        """
+        return method in self.ttls
+
+    def get(self, method, params, fetch):
+        """
+        Get the result of a request, fetching it if not cached or expired.
+
+        :param method: JSONRPC method.
+        :type method: str
+        :param params: Parameters used by the request.
+        :type params: tuple
+        :param fetch: Function without parameters that performs the request and returns its result.
+        :type fetch: function
+        :return: A copy of the result of the request.
+        :rtype: object
+        """
+        key = (method, params)
+        now = self.clock()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                value, fresh_until, stale_until = entry
+                if now < fresh_until:
+                    return _copy_result(value)
+                if now < stale_until:
+                    if key not in self.refreshing:
+                        self.refreshing.add(key)
+                        thread = threading.Thread(
+                            target=self._refresh, args=(key, fetch)
+                        )
+                        thread.daemon = True
+                        thread.start()
+                    return _copy_result(value)
+        return self._fetch(key, fetch)
+
+    def _fetch(self, key, fetch):
+        value = fetch()
+        now = self.clock()
+        method = key[0]
+        with self.lock:
+            if method == "blockNumber" and value != self.head:
+                if self.head is not None:
+                    self.entries.clear()
+                self.head = value
+            self.entries[key] = (
+                value,
+                now + self.ttls[method],
+                now + self.ttls[method] + self.stale_ttls[method],
+            )
+        return _copy_result(value)
+
+    def _refresh(self, key, fetch):
+        try:
+            self._fetch(key, fetch)
+        except Exception:
+            # the stale result expires and the next request fails instead
+            pass
+        finally:
+            with self.lock:
+                self.refreshing.discard(key)
+
+    def clear(self):
+        """
+        Removes all the cached results.
+        """
+        with self.lock:
+            self.entries.clear()
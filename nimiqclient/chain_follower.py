@@ -0,0 +1,143 @@
+__all__ = ["ChainEventType", "ChainEvent", "ChainFollower"]
+
+__metaclass__ = type
+
+from .nimiq_client import ResponseMode
+
+from collections import deque
+from enum import Enum
+import itertools
+import time
+
+
+class ChainEventType(str, Enum):
+    """
+    Type of a change in the main chain.
+    """
+
+    CONNECTED = "connected"
+    """Block added on top of the main chain."""
+    DISCONNECTED = "disconnected"
+    """Block removed from the top of the main chain by a fork."""
+
+    def __str__(self):
+        return self.value
+
+
+class ChainEvent:
+    """
+    Change in the main chain emitted by ChainFollower.
+
+    :param type: Type of the change.
+    :type type: ChainEventType
+    :param block: The block connected or disconnected.
+    :type block: Block
+    """
+
+    def __init__(self, type, block):
+        self.type = type
+        self.block = block
+
+
+class ChainFollower:
+    """
+    Follows the head of the main chain. It keeps a window with the latest blocks to detect forks
+    using the parent hash of the new blocks, and emits the blocks disconnected by a fork, from the
+    highest to the lowest, followed by the blocks connected, from the lowest to the highest.
+
+    :param client: Client used to request the blocks.
+    :type client: NimiqClient
+    :param start: Height of the first block to connect, the latest block if None.
+    :type start: int, optional
+    :param window: Number of latest blocks kept, forks deeper than this can't be detected.
+    :type window: int, optional
+    :param include_transactions: If True the blocks include the full transaction objects, if False only the hashes of the transactions.
+    :type include_transactions: bool, optional
+    :param batch_size: Number of blocks requested in each batch when catching up.
+    :type batch_size: int, optional
+    """
+
+    def __init__(
+        self, client, start=None, window=100, include_transactions=None, batch_size=100
+    ):
+        if client.response_mode != ResponseMode.MODELS:
+            client = client.with_response_mode(ResponseMode.MODELS)
+        self.client = client
+        self.start = start
+        self.include_transactions = include_transactions
+        self.batch_size = batch_size
+        self.blocks = deque(maxlen=window)
+        """Latest blocks of the main chain, from the lowest to the highest."""
+
+    @property
+    def tip(self):
+        """Highest block followed, None before the first poll."""
+        return self.blocks[-1] if self.blocks else None
+
+    def poll(self):
+        """
+        Requests the changes in the main chain since the last poll.
+        Only the blocks above the last block followed are requested, in batches.
+
+        :return: Generator of the changes in the main chain.
+        :rtype: generator of (ChainEvent)
+        """
+        head = self.client.block_number()
+        if not self.blocks:
+            start = self.start if self.start is not None else head
+            for event in self._connect(self._get_blocks(start, head + 1)):
+                yield event
+            return
+
+        blocks = self._get_blocks(min(self.tip.number, head), head + 1)
+        first = next(blocks, None)
+        fetched = deque([first] if first is not None else [])
+
+        # walk back the window until a block is still in the main chain
+        while self.blocks:
+            tip = self.tip
+            if not fetched or fetched[0].number > tip.number:
+                block = self.client.get_block_by_number(
+                    tip.number, self.include_transactions
+                )
+                if block is not None:
+                    fetched.appendleft(block)
+            if fetched and fetched[0].number == tip.number:
+                if fetched[0].hash == tip.hash:
+                    fetched.popleft()
+                    break
+            self.blocks.pop()
+            yield ChainEvent(ChainEventType.DISCONNECTED, tip)
+
+        for event in self._connect(itertools.chain(fetched, blocks)):
+            yield event
+
+    def follow(self, poll_interval=1.0):
+        """
+        Polls the changes in the main chain forever.
+
+        :param poll_interval: Seconds between polls.
+        :type poll_interval: float, optional
+        :return: Generator of the changes in the main chain.
+        :rtype: generator of (ChainEvent)
+        """
+        while True:
+            for event in self.poll():
+                yield event
+            time.sleep(poll_interval)
+
+    def _get_blocks(self, start, stop):
+        if stop - start <= self.batch_size:
+            blocks = self.client._get_blocks(start, stop, self.include_transactions)
+            return iter(itertools.takewhile(lambda block: block is not None, blocks))
+        return self.client.iter_blocks(
+            start, stop, self.include_transactions, batch_size=self.batch_size
+        )
+
+    def _connect(self, blocks):
+        for block in blocks:
+            if self.blocks and block.parentHash != self.tip.hash:
+                # the main chain changed while requesting the blocks, the next poll will catch up
+                return
+            self.blocks.append(block)
+            yield ChainEvent(ChainEventType.CONNECTED, block)
@@ -0,0 +1,134 @@
+__all__ = ["JSONCodec", "OrjsonCodec", "UjsonCodec", "default_codec"]
+
+__metaclass__ = type
+
+from enum import Enum
+import json
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _default(obj):
+    """
+    Serializes the objects passed as parameters, like OutgoingTransaction, using their attributes.
+    """
+    # the transactions use __slots__ and rename the attribute 'from'
+    to_dict = getattr(obj, "_asdict", None)
+    if to_dict is not None:
+        return to_dict()
+    try:
+        return obj.__dict__
+    except AttributeError:
+        raise TypeError("Object of type {0} is not JSON serializable".format(type(obj)))
+
+
+def _plain(obj):
+    """
+    Replaces the Enum members of an object by their values, the json module of Python 2 encodes
+    the members of str based enums like AccountType by their names, without quotes.
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if type(obj) is dict:
+        return dict((key, _plain(value)) for key, value in obj.items())
+    if type(obj) in (list, tuple):
+        return [_plain(value) for value in obj]
+    to_dict = getattr(obj, "_asdict", None)
+    if to_dict is not None:
+        return _plain(to_dict())
+    return obj
+
+
+class JSONCodec:
+    """
+    Encodes requests and decodes responses with the json module of the standard library.
+    """
+
+    name = "json"
+
+    def dumps(self, obj):
+        """
+        Encodes an object to JSON.
+
+        :param obj: The object to encode.
+        :type obj: object
+        :return: The UTF-8 encoded JSON document.
+        :rtype: bytes
+        """
+        if sys.version_info < (3,):
+            obj = _plain(obj)
+        return json.dumps(obj, default=_default, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data):
+        """
+        Decodes a JSON document.
+
+        :param data: The UTF-8 encoded JSON document.
+        :type data: bytes
+        :return: The decoded object.
+        :rtype: object
+        """
+        if sys.version_info < (3, 6) and type(data) is not str:
+            data = data.decode("utf-8")
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Encodes requests and decodes responses with orjson, directly from and to bytes.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson")
+
+    def dumps(self, obj):
+        return orjson.dumps(obj, default=_default)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """
+    Encodes requests and decodes responses with ujson.
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError("UjsonCodec requires ujson")
+
+    def dumps(self, obj):
+        if sys.version_info < (3,):
+            obj = _plain(obj)
+        return ujson.dumps(obj, default=_default).encode("utf-8")
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+def default_codec():
+    """
+    Get the fastest codec available: orjson, ujson or the standard library json module, in that order.
+
+    :return: A new codec.
+    :rtype: JSONCodec
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+    if ujson is not None:
+        return UjsonCodec()
+    return JSONCodec()
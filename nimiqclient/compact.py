@@ -0,0 +1,407 @@
+__all__ = [
+    "InternPool",
+    "CompactTransaction",
+    "CompactBlock",
+    "to_user_friendly_address",
+]
+
+__metaclass__ = type
+
+from .models.block import Block, TransactionList
+
+import binascii
+import json
+
+_BASE32_ALPHABET = "0123456789ABCDEFGHJKLMNPQRSTUVXY"
+
+
+def to_user_friendly_address(address):
+    """
+    Get the user friendly address (NQ-address) of a raw address.
+
+    :param address: The 20-byte address.
+    :type address: bytes
+    :return: The user friendly address, like "NQ07 0000 0000 0000 0000 0000 0000 0000 0000".
+    :rtype: str
+    """
+    number = int(binascii.hexlify(address), 16)
+    bits = len(address) * 8
+    base32 = "".join(
+        _BASE32_ALPHABET[(number >> shift) & 31] for shift in range(bits - 5, -1, -5)
+    )
+    # IBAN check digits, the letters count as their position in the alphabet plus 9
+    digits = "".join(c if c.isdigit() else str(ord(c) - 55) for c in base32 + "NQ00")
+    friendly = "NQ{0:02d}{1}".format(98 - int(digits) % 97, base32)
+    return " ".join(friendly[i : i + 4] for i in range(0, len(friendly), 4))
+
+
+def _to_hex(value):
+    return binascii.hexlify(value).decode("ascii") if value is not None else None
+
+
+class InternPool:
+    """
+    Pool of the raw hashes and addresses decoded into compact models, so the values repeated
+    between them, like the addresses of an account or the hash of a block, share a single object.
+    The pool keeps every value added, it should live as long as the models using it.
+    """
+
+    def __init__(self):
+        self.values = {}
+
+    def __len__(self):
+        return len(self.values)
+
+    def intern(self, value):
+        """
+        Get the raw bytes of a hex-encoded value, shared with the previous calls with the same value.
+
+        :param value: Hex-encoded value.
+        :type value: str or None
+        :return: The raw bytes, None if the value is None.
+        :rtype: bytes or None
+        """
+        if value is None:
+            return None
+        raw = binascii.unhexlify(value)
+        return self.values.setdefault(raw, raw)
+
+
+def _unhexlify(value, pool=None):
+    if pool is not None:
+        return pool.intern(value)
+    return binascii.unhexlify(value) if value is not None else None
+
+
+class CompactTransaction:
+    """
+    Compact representation of a Transaction for large in-memory collections: the hashes are stored
+    as 32-byte and the addresses as 20-byte raw values, shared through an InternPool, and the
+    user friendly addresses are computed on demand.
+
+    :param hash: 32-byte hash of the transaction.
+    :type hash: bytes
+    :param blockHash: 32-byte hash of the block containing the transaction.
+    :type blockHash: bytes, optional
+    :param blockNumber: Height of the block containing the transaction.
+    :type blockNumber: int, optional
+    :param timestamp: UNIX timestamp of the block containing the transaction.
+    :type timestamp: int, optional
+    :param confirmations: Number of confirmations of the block containing the transaction.
+    :type confirmations: int, optional
+    :param transactionIndex: Index of the transaction in the block.
+    :type transactionIndex: int, optional
+    :param from_: 20-byte address of the sending account.
+    :type from_: bytes
+    :param to: 20-byte address of the recipient account.
+    :type to: bytes
+    :param value: Integer of the value (in smallest unit) sent with this transaction.
+    :type value: int
+    :param fee: Integer of the fee (in smallest unit) for this transaction.
+    :type fee: int
+    :param data: Hex-encoded contract parameters or a message.
+    :type data: str, optional
+    :param flags: Bit-encoded transaction flags.
+    :type flags: int
+    :param valid: Is valid transaction.
+    :type valid: bool, optional
+    :param inMempool: Transaction is in mempool.
+    :type inMempool: bool, optional
+    """
+
+    __slots__ = (
+        "hash",
+        "blockHash",
+        "blockNumber",
+        "timestamp",
+        "confirmations",
+        "transactionIndex",
+        "from_",
+        "to",
+        "value",
+        "fee",
+        "data",
+        "flags",
+        "valid",
+        "inMempool",
+    )
+
+    def __init__(
+        self,
+        hash,
+        from_,
+        to,
+        value,
+        fee,
+        flags,
+        blockHash=None,
+        blockNumber=None,
+        timestamp=None,
+        confirmations=0,
+        transactionIndex=None,
+        data=None,
+        valid=None,
+        inMempool=None,
+    ):
+        self.hash = hash
+        self.blockHash = blockHash
+        self.blockNumber = blockNumber
+        self.timestamp = timestamp
+        self.confirmations = confirmations
+        self.transactionIndex = transactionIndex
+        self.from_ = from_
+        self.to = to
+        self.value = value
+        self.fee = fee
+        self.data = data
+        self.flags = flags
+        self.valid = valid
+        self.inMempool = inMempool
+
+    @property
+    def fromAddress(self):
+        """User friendly address (NQ-address) of the sending account."""
+        return to_user_friendly_address(self.from_)
+
+    @property
+    def toAddress(self):
+        """User friendly address (NQ-address) of the recipient account."""
+        return to_user_friendly_address(self.to)
+
+    @classmethod
+    def from_dict(cls, data, pool=None):
+        """
+        Creates a compact transaction from the dictionary returned by the server, or from a Transaction.
+
+        :param data: The dictionary containing the data, or the transaction.
+        :type data: dict or Transaction
+        :param pool: Pool shared by the hashes and addresses, they are not shared if None.
+        :type pool: InternPool, optional
+        :return: The compact transaction.
+        :rtype: CompactTransaction
+        """
+        if type(data) is not dict:
+            data = data._asdict()
+        get = data.get
+        self = cls.__new__(cls)
+        # the hash of a transaction is unique, it is not added to the pool
+        self.hash = binascii.unhexlify(data["hash"])
+        self.blockHash = _unhexlify(get("blockHash"), pool)
+        self.blockNumber = get("blockNumber")
+        self.timestamp = get("timestamp")
+        self.confirmations = get("confirmations", 0)
+        self.transactionIndex = get("transactionIndex")
+        self.from_ = _unhexlify(data["from"], pool)
+        self.to = _unhexlify(data["to"], pool)
+        self.value = data["value"]
+        self.fee = data["fee"]
+        self.data = get("data")
+        self.flags = data["flags"]
+        self.valid = get("valid")
+        self.inMempool = get("inMempool")
+        return self
+
+    def _asdict(self):
+        """
+        Get the attributes of the transaction hex-encoded, as returned by the server.
+
+        :return: The attributes by name.
+        :rtype: dict
+        """
+        return {
+            "hash": _to_hex(self.hash),
+            "blockHash": _to_hex(self.blockHash),
+            "blockNumber": self.blockNumber,
+            "timestamp": self.timestamp,
+            "confirmations": self.confirmations,
+            "transactionIndex": self.transactionIndex,
+            "from": _to_hex(self.from_),
+            "fromAddress": self.fromAddress,
+            "to": _to_hex(self.to),
+            "toAddress": self.toAddress,
+            "value": self.value,
+            "fee": self.fee,
+            "data": self.data,
+            "flags": self.flags,
+            "valid": self.valid,
+            "inMempool": self.inMempool,
+        }
+
+    def __repr__(self):
+        return json.dumps(self._asdict())
+
+
+# 'from' is a reserved word, the attribute can only be reached with getattr and setattr
+setattr(
+    CompactTransaction,
+    "from",
+    property(
+        lambda self: self.from_, lambda self, value: setattr(self, "from_", value)
+    ),
+)
+
+
+class CompactBlock:
+    """
+    Compact representation of a Block for large in-memory collections: the hashes are stored as
+    32-byte and the miner address as 20-byte raw values, shared through an InternPool, and the
+    user friendly address of the miner is computed on demand.
+
+    :param number: Height of the block.
+    :type number: int
+    :param hash: 32-byte hash of the block.
+    :type hash: bytes
+    :param pow: 32-byte Proof-of-Work hash of the block.
+    :type pow: bytes
+    :param parentHash: 32-byte hash of the predecessor block.
+    :type parentHash: bytes
+    :param nonce: The nonce of the block used to fulfill the Proof-of-Work.
+    :type nonce: int
+    :param bodyHash: 32-byte hash of the block body Merkle root.
+    :type bodyHash: bytes
+    :param accountsHash: 32-byte hash of the accounts tree root.
+    :type accountsHash: bytes
+    :param difficulty: Block difficulty, encoded as decimal number in string.
+    :type difficulty: str
+    :param timestamp: UNIX timestamp of the block.
+    :type timestamp: int
+    :param confirmations: Number of confirmations of the block.
+    :type confirmations: int
+    :param miner: 20-byte address of the miner of the block.
+    :type miner: bytes
+    :param extraData: Hex-encoded value of the extra data field, maximum of 255 bytes.
+    :type extraData: str
+    :param size: Block size in byte.
+    :type size: int
+    :param transactions: List of transactions, either represented by the 32-byte transaction hash or a CompactTransaction.
+    :type transactions: list of (CompactTransaction or bytes)
+    """
+
+    __slots__ = (
+        "number",
+        "hash",
+        "pow",
+        "parentHash",
+        "nonce",
+        "bodyHash",
+        "accountsHash",
+        "difficulty",
+        "timestamp",
+        "confirmations",
+        "miner",
+        "extraData",
+        "size",
+        "transactions",
+    )
+
+    def __init__(
+        self,
+        number,
+        hash,
+        pow,
+        parentHash,
+        nonce,
+        bodyHash,
+        accountsHash,
+        difficulty,
+        timestamp,
+        confirmations,
+        miner,
+        extraData,
+        size,
+        transactions,
+    ):
+        self.number = number
+        self.hash = hash
+        self.pow = pow
+        self.parentHash = parentHash
+        self.nonce = nonce
+        self.bodyHash = bodyHash
+        self.accountsHash = accountsHash
+        self.difficulty = difficulty
+        self.timestamp = timestamp
+        self.confirmations = confirmations
+        self.miner = miner
+        self.extraData = extraData
+        self.size = size
+        self.transactions = transactions
+
+    @property
+    def minerAddress(self):
+        """User friendly address (NQ-address) of the miner of the block."""
+        return to_user_friendly_address(self.miner)
+
+    @classmethod
+    def from_dict(cls, data, pool=None):
+        """
+        Creates a compact block from the dictionary returned by the server, or from a Block.
+        The transactions of the block are converted as well.
+
+        :param data: The dictionary containing the data, or the block.
+        :type data: dict or Block
+        :param pool: Pool shared by the hashes and addresses, they are not shared if None.
+        :type pool: InternPool, optional
+        :return: The compact block.
+        :rtype: CompactBlock
+        """
+        if type(data) is Block:
+            block = data
+            data = dict((name, getattr(block, name)) for name in Block.__slots__)
+            if type(block.transactions) is TransactionList:
+                # the transactions not accessed yet are still dictionaries
+                data["transactions"] = block.transactions.items
+        return cls(
+            data["number"],
+            # the hash is shared with the blockHash of the transactions
+            _unhexlify(data["hash"], pool),
+            binascii.unhexlify(data["pow"]),
+            _unhexlify(data["parentHash"], pool),
+            data["nonce"],
+            binascii.unhexlify(data["bodyHash"]),
+            binascii.unhexlify(data["accountsHash"]),
+            data["difficulty"],
+            data["timestamp"],
+            data.get("confirmations", 0),
+            _unhexlify(data["miner"], pool),
+            data["extraData"],
+            data["size"],
+            [
+                (
+                    binascii.unhexlify(tx)
+                    if isinstance(tx, str)
+                    else CompactTransaction.from_dict(tx, pool)
+                )
+                for tx in data["transactions"]
+            ],
+        )
+
+    def _asdict(self):
+        """
+        Get the attributes of the block hex-encoded, as returned by the server.
+
+        :return: The attributes by name.
+        :rtype: dict
+        """
+        return {
+            "number": self.number,
+            "hash": _to_hex(self.hash),
+            "pow": _to_hex(self.pow),
+            "parentHash": _to_hex(self.parentHash),
+            "nonce": self.nonce,
+            "bodyHash": _to_hex(self.bodyHash),
+            "accountsHash": _to_hex(self.accountsHash),
+            "difficulty": self.difficulty,
+            "timestamp": self.timestamp,
+            "confirmations": self.confirmations,
+            "miner": _to_hex(self.miner),
+            "minerAddress": self.minerAddress,
+            "extraData": self.extraData,
+            "size": self.size,
+            "transactions": [
+                _to_hex(tx) if type(tx) is bytes else tx._asdict()
+                for tx in self.transactions
+            ],
+        }
+
+    def __repr__(self):
+        return json.dumps(self._asdict())
@@ -0,0 +1,276 @@
+__all__ = ["ChainExporter", "ARROW_BLOCK_COLUMNS", "ARROW_TRANSACTION_COLUMNS"]
+
+__metaclass__ = type
+
+from .nimiq_client import ResponseMode
+from .models.block import Block
+from .models.transaction import Transaction
+
+import os
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+_TYPES = {
+    "number": "int64",
+    "hash": "string",
+    "pow": "string",
+    "parentHash": "string",
+    "nonce": "int64",
+    "bodyHash": "string",
+    "accountsHash": "string",
+    "difficulty": "string",
+    "timestamp": "int64",
+    "confirmations": "int64",
+    "miner": "string",
+    "minerAddress": "string",
+    "extraData": "string",
+    "size": "int64",
+    "blockHash": "string",
+    "blockNumber": "int64",
+    "transactionIndex": "int32",
+    "fromAddress": "string",
+    "from_": "string",
+    "to": "string",
+    "toAddress": "string",
+    "value": "int64",
+    "fee": "int64",
+    "data": "string",
+    "flags": "uint8",
+}
+
+ARROW_BLOCK_COLUMNS = [
+    (name, _TYPES[name]) for name in Block.__slots__ if name != "transactions"
+] + [("transactionCount", "int32")]
+"""Name and Arrow type of the columns of the blocks table, the attributes of Block in order."""
+
+ARROW_TRANSACTION_COLUMNS = [
+    ("from" if name == "from_" else name, _TYPES[name])
+    for name in Transaction.__slots__
+    if name in _TYPES
+]
+"""Name and Arrow type of the columns of the transactions table, the attributes of Transaction in order."""
+
+
+def _schema(columns):
+    return pyarrow.schema(
+        [pyarrow.field(name, pyarrow.type_for_alias(alias)) for name, alias in columns]
+    )
+
+
+class ChainExporter:
+    """
+    Exports the blocks and transactions of a range of heights to Arrow record batches and Parquet
+    files, with one table for the blocks and one for their transactions. Requires the pyarrow package.
+
+    The blocks are requested in batches as with iter_blocks and converted to record batches of
+    batch_size blocks, so only a bounded number of blocks is kept in memory. The Parquet files are
+    written in chunks of chunk_size blocks aligned to multiples of chunk_size, each chunk to the
+    files blocks/<start>.parquet and transactions/<start>.parquet of the directory. Exports are
+    resumable: the chunks already complete are skipped, and the last chunk is completed when the
+    chain grows::
+
+        exporter = ChainExporter(client, "/data/nimiq")
+        exporter.export(1)
+
+    :param client: Client used to request the blocks.
+    :type client: NimiqClient
+    :param directory: Directory of the Parquet files, created if it doesn't exist.
+    :type directory: str, optional
+    :param chunk_size: Number of blocks of each Parquet file.
+    :type chunk_size: int, optional
+    :param batch_size: Number of blocks of each record batch, also a row group of the Parquet files.
+    :type batch_size: int, optional
+    :param compression: Compression codec of the Parquet files.
+    :type compression: str, optional
+    """
+
+    def __init__(
+        self,
+        client,
+        directory=".",
+        chunk_size=100000,
+        batch_size=1000,
+        compression="snappy",
+    ):
+        if pyarrow is None:
+            raise ImportError(
+                "ChainExporter requires pyarrow, install it with 'pip install nimiqclient[arrow]'"
+            )
+        # the rows are built from the decoded JSON results, without creating the model objects
+        if client.response_mode != ResponseMode.JSON:
+            client = client.with_response_mode(ResponseMode.JSON)
+        self.client = client
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.compression = compression
+        self.block_schema = _schema(ARROW_BLOCK_COLUMNS)
+        """Arrow schema of the blocks table."""
+        self.transaction_schema = _schema(ARROW_TRANSACTION_COLUMNS)
+        """Arrow schema of the transactions table."""
+
+    def record_batches(self, start, stop=None):
+        """
+        Iterates over the blocks in a range of heights as record batches.
+
+        :param start: Height of the first block.
+        :type start: int
+        :param stop: Height after the last block, iterates until the latest block if None.
+        :type stop: int, optional
+        :return: Generator of the record batches of the blocks and of their transactions, in height order.
+        :rtype: generator of (tuple of (pyarrow.RecordBatch, pyarrow.RecordBatch))
+        """
+        blocks = []
+        for block in self.client.iter_blocks(start, stop, True):
+            blocks.append(block)
+            if len(blocks) >= self.batch_size:
+                yield self._to_record_batches(blocks)
+                blocks = []
+        if blocks:
+            yield self._to_record_batches(blocks)
+
+    def _to_record_batches(self, blocks):
+        """
+        Converts blocks to record batches.
+
+        :param blocks: Dictionaries containing the data of the blocks.
+        :type blocks: list of (dict)
+        :return: The record batches of the blocks and of their transactions.
+        :rtype: tuple of (pyarrow.RecordBatch, pyarrow.RecordBatch)
+        """
+        transactions = [
+            transaction for block in blocks for transaction in block["transactions"]
+        ]
+        block_columns = dict(
+            (name, [block.get(name) for block in blocks])
+            for name, alias in ARROW_BLOCK_COLUMNS
+        )
+        block_columns["transactionCount"] = [
+            len(block["transactions"]) for block in blocks
+        ]
+        transaction_columns = dict(
+            (name, [transaction.get(name) for transaction in transactions])
+            for name, alias in ARROW_TRANSACTION_COLUMNS
+        )
+        return (
+            self._to_record_batch(block_columns, self.block_schema),
+            self._to_record_batch(transaction_columns, self.transaction_schema),
+        )
+
+    @staticmethod
+    def _to_record_batch(columns, schema):
+        return pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array(columns[field.name], type=field.type) for field in schema],
+            schema=schema,
+        )
+
+    def export(self, start, stop=None):
+        """
+        Writes the blocks and transactions in a range of heights to Parquet files, skipping the chunks
+        already complete.
+
+        :param start: Height of the first block.
+        :type start: int
+        :param stop: Height after the last block, exports until the latest block if None.
+        :type stop: int, optional
+        :return: Heights of the first block of each chunk written.
+        :rtype: list of (int)
+        """
+        if stop is None:
+            stop = self.client.block_number() + 1
+        written = []
+        chunk_start = start - start % self.chunk_size
+        while chunk_start < stop:
+            chunk_stop = chunk_start + self.chunk_size
+            first = max(start, chunk_start)
+            last = min(stop, chunk_stop)
+            covered = self._covered_range(chunk_start)
+            if covered is None or not covered[0] <= first < last <= covered[1]:
+                if covered is not None:
+                    # the chunk is rewritten with the blocks already exported, like
+                    # when it was exported before the chain reached its end
+                    first, last = min(first, covered[0]), max(last, covered[1])
+                if self._export_chunk(chunk_start, first, last):
+                    written.append(chunk_start)
+                else:
+                    break
+            chunk_start = chunk_stop
+        return written
+
+    def _path(self, table, chunk_start):
+        return os.path.join(
+            self.directory, table, "{0:012d}.parquet".format(chunk_start)
+        )
+
+    def _covered_range(self, chunk_start):
+        """
+        Get the range of heights written in a chunk, without gaps.
+
+        :param chunk_start: Height of the first block of the chunk.
+        :type chunk_start: int
+        :return: The height of the first block and the height after the last block, None if the
+            chunk was not written or has gaps.
+        :rtype: tuple of (int, int) or None
+        """
+        path = self._path("blocks", chunk_start)
+        if not os.path.exists(path):
+            return None
+        numbers = pyarrow.parquet.read_table(path, columns=["number"]).column(0)
+        if len(numbers) == 0:
+            return None
+        numbers = numbers.to_pylist()
+        first, last = min(numbers), max(numbers) + 1
+        if len(set(numbers)) != last - first:
+            return None
+        return first, last
+
+    def _export_chunk(self, chunk_start, start, stop):
+        """
+        Writes the blocks and transactions of a chunk. The files are written under a temporary name
+        and renamed when they are complete, the blocks file last, so an existing blocks file means
+        that both files are complete.
+
+        :param chunk_start: Height of the first block of the chunk.
+        :type chunk_start: int
+        :param start: Height of the first block.
+        :type start: int
+        :param stop: Height after the last block.
+        :type stop: int
+        :return: True if any block was written.
+        :rtype: bool
+        """
+        paths = [self._path(table, chunk_start) for table in ("blocks", "transactions")]
+        for path in paths:
+            directory = os.path.dirname(path)
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+        temporary = [path + ".tmp" for path in paths]
+        block_writer = pyarrow.parquet.ParquetWriter(
+            temporary[0], self.block_schema, compression=self.compression
+        )
+        transaction_writer = pyarrow.parquet.ParquetWriter(
+            temporary[1], self.transaction_schema, compression=self.compression
+        )
+        count = 0
+        try:
+            for blocks, transactions in self.record_batches(start, stop):
+                block_writer.write_batch(blocks)
+                transaction_writer.write_batch(transactions)
+                count += blocks.num_rows
+        finally:
+            block_writer.close()
+            transaction_writer.close()
+        if count == 0:
+            for path in temporary:
+                os.remove(path)
+            return False
+        # os.rename doesn't replace existing files on Windows
+        for path, temporary_path in reversed(list(zip(paths, temporary))):
+            if os.path.exists(path):
+                os.remove(path)
+            os.rename(temporary_path, path)
+        return True
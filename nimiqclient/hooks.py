@@ -0,0 +1,213 @@
+__all__ = ["RequestTrace", "RequestHooks", "OpenTelemetryHooks"]
+
+__metaclass__ = type
+
+try:
+    from opentelemetry import context as otel_context
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_context = None
+    otel_trace = None
+
+
+class RequestTrace:
+    """
+    Details of an HTTP request sent to a node, passed to the hooks of the client before and after
+    it is sent. Each attempt of a retried request has its own trace.
+
+    :param method: JSONRPC method, "batch" for a JSON-RPC 2.0 batch.
+    :type method: str
+    :param id: Id of the JSONRPC request object, None for a batch.
+    :type id: int or None
+    :param url: URL of the node.
+    :type url: str
+    """
+
+    __slots__ = (
+        "method",
+        "id",
+        "url",
+        "start",
+        "duration",
+        "network",
+        "decode",
+        "request_size",
+        "response_size",
+        "status",
+        "error",
+        "calls",
+        "context",
+    )
+
+    def __init__(self, method, id=None, url=None):
+        self.method = method
+        self.id = id
+        self.url = url
+        self.start = None
+        """UNIX timestamp of the start of the request."""
+        self.duration = None
+        """Seconds taken by the request, set after it finishes."""
+        self.network = None
+        """Seconds spent sending the request and receiving the response."""
+        self.decode = None
+        """Seconds spent decoding the JSON of the response."""
+        self.request_size = None
+        """Bytes of the request body, including the parameters."""
+        self.response_size = None
+        """Bytes of the response body."""
+        self.status = None
+        """HTTP status code of the response."""
+        self.error = None
+        """Code of the JSONRPC error, or "timeout", "circuit_open" or "internal" for the internal errors. None if it succeeded."""
+        self.calls = None
+        """Traces of the requests of a batch, with their method, id and error."""
+        self.context = None
+        """Value kept by the hooks between before_request and after_request, like a span."""
+
+
+class RequestHooks:
+    """
+    Hooks called around each HTTP request sent by a client, to trace or log them.
+    Subclasses override the methods they need::
+
+        class SlowRequestLogger(RequestHooks):
+            def after_request(self, trace):
+                if trace.duration > 1:
+                    logging.warning("%s to %s took %.1fs", trace.method, trace.url, trace.duration)
+
+        client = NimiqClient(hooks=SlowRequestLogger())
+    """
+
+    def capture_context(self):
+        """
+        Get the context of the calling thread, like its current span, when the client continues a
+        request in another thread, like the batches of iter_blocks or the hedged requests of
+        BalancedNimiqClient.
+
+        :return: The context, passed to attach_context in the other thread.
+        :rtype: object
+        """
+        return None
+
+    def attach_context(self, context):
+        """
+        Makes a context captured in another thread the current one in this thread.
+
+        :param context: The context returned by capture_context.
+        :type context: object
+        :return: Value passed to detach_context once the request finishes.
+        :rtype: object
+        """
+        return None
+
+    def detach_context(self, token):
+        """
+        Restores the context of this thread replaced by attach_context.
+
+        :param token: The value returned by attach_context.
+        :type token: object
+        """
+        pass
+
+    def before_request(self, trace):
+        """
+        Called before sending a request. A request rejected by an open circuit breaker is traced
+        without being sent, with the error "circuit_open" and no timings nor sizes.
+
+        :param trace: The request, with its method, id, url, start and request size.
+        :type trace: RequestTrace
+        """
+        pass
+
+    def after_request(self, trace):
+        """
+        Called once a request finishes, even if it failed.
+
+        :param trace: The request, with its timings, response size, status and error.
+        :type trace: RequestTrace
+        """
+        pass
+
+
+def _nanoseconds(timestamp):
+    return int(timestamp * 1e9)
+
+
+class OpenTelemetryHooks(RequestHooks):
+    """
+    Hooks recording each request as an OpenTelemetry client span, child of the current span,
+    with the attributes of the semantic conventions for JSON-RPC. The requests of a batch are
+    recorded as child spans of the batch span. Requires the opentelemetry-api package::
+
+        client = NimiqClient(hooks=OpenTelemetryHooks())
+
+    :param tracer: Tracer creating the spans, the one of the global tracer provider if None.
+    :type tracer: opentelemetry.trace.Tracer, optional
+    """
+
+    def __init__(self, tracer=None):
+        if otel_trace is None:
+            raise ImportError(
+                "OpenTelemetryHooks requires opentelemetry-api, install it with 'pip install nimiqclient[opentelemetry]'"
+            )
+        self.tracer = tracer if tracer is not None else otel_trace.get_tracer(__name__)
+
+    def _attributes(self, trace):
+        attributes = {"rpc.system": "jsonrpc", "rpc.jsonrpc.version": "2.0"}
+        if trace.method != "batch":
+            attributes["rpc.method"] = trace.method
+        if trace.id is not None:
+            attributes["rpc.jsonrpc.request_id"] = str(trace.id)
+        if trace.url is not None:
+            attributes["url.full"] = trace.url
+        if trace.request_size is not None:
+            attributes["http.request.body.size"] = trace.request_size
+        return attributes
+
+    def _set_error(self, span, error):
+        if error is None:
+            return
+        if type(error) is int:
+            span.set_attribute("rpc.jsonrpc.error_code", error)
+        else:
+            span.set_attribute("error.type", error)
+        span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR))
+
+    def capture_context(self):
+        return otel_context.get_current()
+
+    def attach_context(self, context):
+        return otel_context.attach(context)
+
+    def detach_context(self, token):
+        otel_context.detach(token)
+
+    def before_request(self, trace):
+        trace.context = self.tracer.start_span(
+            trace.method,
+            kind=otel_trace.SpanKind.CLIENT,
+            attributes=self._attributes(trace),
+            start_time=_nanoseconds(trace.start),
+        )
+
+    def after_request(self, trace):
+        span = trace.context
+        end_time = _nanoseconds(trace.start + trace.duration)
+        if trace.status is not None:
+            span.set_attribute("http.response.status_code", trace.status)
+        if trace.response_size is not None:
+            span.set_attribute("http.response.body.size", trace.response_size)
+        self._set_error(span, trace.error)
+        if trace.calls is not None:
+            context = otel_trace.set_span_in_context(span)
+            for call in trace.calls:
+                child = self.tracer.start_span(
+                    call.method,
+                    context=context,
+                    kind=otel_trace.SpanKind.CLIENT,
+                    attributes=self._attributes(call),
+                    start_time=_nanoseconds(trace.start),
+                )
+                self._set_error(child, call.error)
+                child.end(end_time=end_time)
+        span.end(end_time=end_time)
@@ -0,0 +1,267 @@
+__all__ = [
+    "RequestSample",
+    "Histogram",
+    "PrometheusMetrics",
+    "DEFAULT_LATENCY_BUCKETS",
+    "DEFAULT_SIZE_BUCKETS",
+]
+
+__metaclass__ = type
+
+import bisect
+import threading
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Upper bounds in seconds of the latency histogram buckets."""
+
+DEFAULT_SIZE_BUCKETS = (
+    100,
+    1000,
+    10000,
+    100000,
+    1000000,
+    10000000,
+)
+"""Upper bounds in bytes of the response size histogram buckets."""
+
+
+class RequestSample:
+    """
+    Measurements of a request, passed to the metrics function of the client once it finishes.
+    The phases not done by the request, like the network phase of a cached result, are None.
+
+    :param method: JSONRPC method, "batch" for a JSON-RPC 2.0 batch.
+    :type method: str
+    """
+
+    __slots__ = ("method", "total", "network", "decode", "model", "size", "error")
+
+    def __init__(self, method):
+        self.method = method
+        self.total = None
+        """Seconds taken by the whole request."""
+        self.network = None
+        """Seconds spent sending the request and receiving the response, including the retries."""
+        self.decode = None
+        """Seconds spent decoding the JSON of the response."""
+        self.model = None
+        """Seconds spent converting the result to model objects."""
+        self.size = None
+        """Bytes of the response bodies received."""
+        self.error = None
+        """Code of the RemoteErrorException, or "timeout", "circuit_open" or "internal" for the internal errors. None if it succeeded."""
+
+
+class Histogram:
+    """
+    Histogram of observed values with fixed buckets.
+
+    :param buckets: Upper bounds of the buckets in ascending order.
+    :type buckets: tuple of (float)
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        """Number of values of each bucket, not cumulative."""
+        self.sum = 0
+        """Sum of the values."""
+        self.count = 0
+        """Number of values, including the ones above the last bucket."""
+
+    def observe(self, value):
+        """
+        Adds a value to the histogram.
+
+        :param value: The value.
+        :type value: float
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _format_labels(labels):
+    return ",".join(
+        '{0}="{1}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in labels
+    )
+
+
+def _format_number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if type(value) is float else str(value)
+
+
+class PrometheusMetrics:
+    """
+    Metrics function aggregating the request samples by method, rendered in the Prometheus text
+    exposition format. Counts the requests and the errors by code, with histograms of the latency
+    of each phase and of the size of the responses::
+
+        metrics = PrometheusMetrics()
+        client = NimiqClient(metrics=metrics)
+        client.block_number()
+        print(metrics.render())
+
+    :param namespace: Prefix of the metric names.
+    :type namespace: str, optional
+    :param latency_buckets: Upper bounds in seconds of the latency histogram buckets.
+    :type latency_buckets: tuple of (float), optional
+    :param size_buckets: Upper bounds in bytes of the response size histogram buckets.
+    :type size_buckets: tuple of (int), optional
+    """
+
+    PHASES = ("total", "network", "decode", "model")
+    """Phases of the requests measured, as in RequestSample."""
+
+    def __init__(
+        self,
+        namespace="nimiq_client",
+        latency_buckets=DEFAULT_LATENCY_BUCKETS,
+        size_buckets=DEFAULT_SIZE_BUCKETS,
+    ):
+        self.namespace = namespace
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self.lock = threading.Lock()
+        self.requests = {}
+        """Number of requests by method."""
+        self.errors = {}
+        """Number of errors by method and error code."""
+        self.latencies = {}
+        """Latency histogram by method and phase."""
+        self.sizes = {}
+        """Response size histogram by method."""
+
+    def __call__(self, sample):
+        """
+        Adds a request sample.
+
+        :param sample: The measurements of the request.
+        :type sample: RequestSample
+        """
+        method = sample.method
+        with self.lock:
+            self.requests[method] = self.requests.get(method, 0) + 1
+            if sample.error is not None:
+                key = (method, sample.error)
+                self.errors[key] = self.errors.get(key, 0) + 1
+            for phase in self.PHASES:
+                value = getattr(sample, phase)
+                if value is not None:
+                    histogram = self.latencies.get((method, phase))
+                    if histogram is None:
+                        histogram = self.latencies[(method, phase)] = Histogram(
+                            self.latency_buckets
+                        )
+                    histogram.observe(value)
+            if sample.size is not None:
+                histogram = self.sizes.get(method)
+                if histogram is None:
+                    histogram = self.sizes[method] = Histogram(self.size_buckets)
+                histogram.observe(sample.size)
+
+    def _render_histogram(self, lines, name, labels, histogram):
+        cumulative = 0
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            cumulative += count
+            lines.append(
+                "{0}_bucket{{{1}}} {2}".format(
+                    name,
+                    _format_labels(labels + [("le", _format_number(bound))]),
+                    cumulative,
+                )
+            )
+        lines.append(
+            "{0}_bucket{{{1}}} {2}".format(
+                name, _format_labels(labels + [("le", "+Inf")]), histogram.count
+            )
+        )
+        lines.append(
+            "{0}_sum{{{1}}} {2}".format(
+                name, _format_labels(labels), _format_number(histogram.sum)
+            )
+        )
+        lines.append(
+            "{0}_count{{{1}}} {2}".format(name, _format_labels(labels), histogram.count)
+        )
+
+    def render(self):
+        """
+        Get the metrics in the Prometheus text exposition format.
+
+        :return: The metrics.
+        :rtype: str
+        """
+        prefix = self.namespace + "_" if self.namespace else ""
+        lines = []
+        with self.lock:
+            name = prefix + "requests_total"
+            lines.append("# HELP {0} JSONRPC requests by method.".format(name))
+            lines.append("# TYPE {0} counter".format(name))
+            for method, count in sorted(self.requests.items()):
+                lines.append(
+                    "{0}{{{1}}} {2}".format(
+                        name, _format_labels([("method", method)]), count
+                    )
+                )
+
+            name = prefix + "errors_total"
+            lines.append(
+                "# HELP {0} Failed JSONRPC requests by method and code.".format(name)
+            )
+            lines.append("# TYPE {0} counter".format(name))
+            for (method, code), count in sorted(
+                self.errors.items(), key=lambda item: (item[0][0], str(item[0][1]))
+            ):
+                lines.append(
+                    "{0}{{{1}}} {2}".format(
+                        name,
+                        _format_labels([("method", method), ("code", code)]),
+                        count,
+                    )
+                )
+
+            name = prefix + "request_duration_seconds"
+            lines.append(
+                "# HELP {0} Latency of the JSONRPC requests by method and phase.".format(
+                    name
+                )
+            )
+            lines.append("# TYPE {0} histogram".format(name))
+            for (method, phase), histogram in sorted(self.latencies.items()):
+                self._render_histogram(
+                    lines, name, [("method", method), ("phase", phase)], histogram
+                )
+
+            name = prefix + "response_size_bytes"
+            lines.append(
+                "# HELP {0} Size of the JSONRPC responses by method.".format(name)
+            )
+            lines.append("# TYPE {0} histogram".format(name))
+            for method, histogram in sorted(self.sizes.items()):
+                self._render_histogram(lines, name, [("method", method)], histogram)
+        return "\n".join(lines) + "\n"
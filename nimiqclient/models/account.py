@@ -32,6 +32,8 @@ class Account:
     :type type: AccountType
     """
 
+    __slots__ = ("id", "address", "balance", "type")
+
     def __init__(self, id, address, balance, type):
         self.id = id
         self.address = address
@@ -65,6 +67,15 @@ class VestingContract(Account):
     :type vestingTotalAmount: int
     """
 
+    __slots__ = (
+        "owner",
+        "ownerAddress",
+        "vestingStart",
+        "vestingStepBlocks",
+        "vestingStepAmount",
+        "vestingTotalAmount",
+    )
+
     def __init__(
         self,
         id,
@@ -119,6 +130,18 @@ class HTLC(Account):
     :type totalAmount: int
     """
 
+    __slots__ = (
+        "sender",
+        "senderAddress",
+        "recipient",
+        "recipientAddress",
+        "hashRoot",
+        "hashAlgorithm",
+        "hashCount",
+        "timeout",
+        "totalAmount",
+    )
+
     def __init__(
         self,
         id,
@@ -161,6 +184,8 @@ class Wallet:
     :type privateKey: str, optional
     """
 
+    __slots__ = ("id", "address", "publicKey", "privateKey")
+
     def __init__(self, id, address, publicKey, privateKey=None):
         self.id = id
         self.address = address
@@ -1,7 +1,73 @@
-__all__ = ["Block", "BlockTemplateHeader", "BlockTemplateBody", "BlockTemplate"]
+__all__ = [
+    "Block",
+    "BlockTemplateHeader",
+    "BlockTemplateBody",
+    "BlockTemplate",
+    "TransactionList",
+]
+
+__metaclass__ = type
 
 from .transaction import Transaction
 
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence
+
+try:
+    # the transaction hashes are unicode strings on Python 2
+    _HASH_TYPES = (str, unicode)
+except NameError:
+    _HASH_TYPES = (str,)
+
+
+class TransactionList(Sequence):
+    """
+    Transactions of a block, either represented by the transaction hash or a Transaction object.
+    The transaction objects are decoded from the data returned by the server when they are
+    accessed for the first time, one by one.
+
+    :param items: List of transaction hashes, Transaction objects or dictionaries containing the data.
+    :type items: list of (str or Transaction or dict)
+    """
+
+    __slots__ = ("items",)
+
+    def __init__(self, items):
+        self.items = items
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.items)))]
+        transaction = self.items[index]
+        if isinstance(transaction, dict):
+            transaction = self.items[index] = Transaction.from_dict(transaction)
+        elif not isinstance(transaction, _HASH_TYPES + (Transaction,)):
+            from ..nimiq_client import InternalErrorException
+
+            raise InternalErrorException(
+                "Couldn't parse Transaction {0}".format(transaction)
+            )
+        return transaction
+
+    def __eq__(self, other):
+        if isinstance(other, (list, TransactionList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
+
 
 class Block:
     """
@@ -36,9 +102,27 @@ class Block:
     :param size: Block size in byte.
     :type size: int
     :param transactions: List of transactions. Either represented by the transaction hash or a Transaction object.
-    :type transactions: list of (Transaction or str)
+    :type transactions: TransactionList or list of (Transaction or str or dict)
     """
 
+    __slots__ = (
+        "number",
+        "hash",
+        "pow",
+        "parentHash",
+        "nonce",
+        "bodyHash",
+        "accountsHash",
+        "difficulty",
+        "timestamp",
+        "confirmations",
+        "miner",
+        "minerAddress",
+        "extraData",
+        "size",
+        "transactions",
+    )
+
     def __init__(
         self,
         number,
@@ -71,17 +155,9 @@ class Block:
         self.minerAddress = minerAddress
         self.extraData = extraData
         self.size = size
-        for index, transaction in enumerate(transactions):
-            tt = type(transaction)
-            if tt is not str and tt is not Transaction:
-                if tt is dict:
-                    transactions[index] = Transaction(**transaction)
-                else:
-                    from ..nimiq_client import InternalErrorException
-
-                    raise InternalErrorException(
-                        "Couldn't parse Transaction {0}".format(transaction)
-                    )
+        # the transactions are only decoded when accessed
+        if type(transactions) is not TransactionList:
+            transactions = TransactionList(transactions)
         self.transactions = transactions
 
 
@@ -103,6 +179,15 @@ class BlockTemplateHeader:
     :type height: int
     """
 
+    __slots__ = (
+        "version",
+        "prevHash",
+        "interlinkHash",
+        "accountsHash",
+        "nBits",
+        "height",
+    )
+
     def __init__(self, version, prevHash, interlinkHash, accountsHash, nBits, height):
         self.version = version
         self.prevHash = prevHash
@@ -130,6 +215,15 @@ class BlockTemplateBody:
     :type merkleHashes: str
     """
 
+    __slots__ = (
+        "hash",
+        "minerAddr",
+        "extraData",
+        "transactions",
+        "prunedAccounts",
+        "merkleHashes",
+    )
+
     def __init__(
         self, hash, minerAddr, extraData, transactions, prunedAccounts, merkleHashes
     ):
@@ -155,6 +249,8 @@ class BlockTemplate:
     :type target: int
     """
 
+    __slots__ = ("header", "interlink", "body", "target")
+
     def __init__(self, header, interlink, body, target):
         self.header = header
         self.interlink = interlink
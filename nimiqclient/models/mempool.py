@@ -1,11 +1,15 @@
 __all__ = ["MempoolInfo"]
 
+__metaclass__ = type
+
 
 class MempoolInfo:
     """
     Mempool information returned by the server.
     """
 
+    __slots__ = ("total", "buckets", "transactionsPerBucket")
+
     def __init__(self, **kwargs):
         self.total = kwargs.pop("total")
         """Total number of pending transactions in mempool."""
@@ -1,5 +1,7 @@
 __all__ = ["PoolConnectionState", "WorkInstructions"]
 
+__metaclass__ = type
+
 from enum import Enum
 
 
@@ -32,6 +34,8 @@ class WorkInstructions:
     :type algorithm: str
     """
 
+    __slots__ = ("data", "suffix", "target", "algorithm")
+
     def __init__(self, data, suffix, target, algorithm):
         self.data = data
         self.suffix = suffix
@@ -1,5 +1,7 @@
 __all__ = ["ConsensusState", "SyncStatus", "LogLevel"]
 
+__metaclass__ = type
+
 from enum import Enum
 
 
@@ -31,6 +33,8 @@ class SyncStatus:
     :type highestBlock: int
     """
 
+    __slots__ = ("startingBlock", "currentBlock", "highestBlock")
+
     def __init__(self, startingBlock, currentBlock, highestBlock):
         self.startingBlock = startingBlock
         self.currentBlock = currentBlock
@@ -1,5 +1,7 @@
 __all__ = ["PeerAddressState", "PeerConnectionState", "PeerStateCommand", "Peer"]
 
+__metaclass__ = type
+
 from enum import Enum
 
 
@@ -83,6 +85,19 @@ class Peer:
     :type tx: int, optional
     """
 
+    __slots__ = (
+        "id",
+        "address",
+        "addressState",
+        "connectionState",
+        "version",
+        "timeOffset",
+        "headHash",
+        "latency",
+        "rx",
+        "tx",
+    )
+
     def __init__(
         self,
         id,
@@ -1,5 +1,7 @@
 __all__ = ["OutgoingTransaction", "Transaction", "TransactionReceipt"]
 
+__metaclass__ = type
+
 from .account import AccountType
 import json
 
@@ -9,20 +11,32 @@ class TXBase:
     Enables accessing the attribute 'from' from outside using 'from_'.
     """
 
-    def __getattr__(self, attr):
-        if attr == "from_":
-            return self.__dict__.__getitem__("from")
-        else:
-            return self.__dict__.__getitem__(attr)
+    __slots__ = ()
+
+    def _asdict(self):
+        """
+        Get the attributes of the transaction, with 'from_' named 'from' as in the JSONRPC API.
 
-    def __setattr__(self, attr, value):
-        if attr == "from_":
-            self.__dict__.__setitem__("from", value)
-        else:
-            self.__dict__.__setitem__(attr, value)
+        :return: The attributes by name.
+        :rtype: dict
+        """
+        return dict(
+            ("from" if name == "from_" else name, getattr(self, name))
+            for name in self.__slots__
+        )
 
     def __repr__(self):
-        return json.dumps(self.__dict__)
+        return json.dumps(self._asdict())
+
+
+# 'from' is a reserved word, the attribute can only be reached with getattr and setattr
+setattr(
+    TXBase,
+    "from",
+    property(
+        lambda self: self.from_, lambda self, value: setattr(self, "from_", value)
+    ),
+)
 
 
 def preprocess_args(func):
@@ -58,6 +72,8 @@ class OutgoingTransaction(TXBase):
     :type data: str, optional
     """
 
+    __slots__ = ("from_", "fromType", "to", "toType", "value", "fee", "data")
+
     def __init__(
         self,
         from_,
@@ -115,6 +131,25 @@ class Transaction(TXBase):
     :type inMempool: bool, optional
     """
 
+    __slots__ = (
+        "hash",
+        "blockHash",
+        "blockNumber",
+        "timestamp",
+        "confirmations",
+        "transactionIndex",
+        "from_",
+        "fromAddress",
+        "to",
+        "toAddress",
+        "value",
+        "fee",
+        "data",
+        "flags",
+        "valid",
+        "inMempool",
+    )
+
     @preprocess_args
     def __init__(
         self,
@@ -152,6 +187,37 @@ class Transaction(TXBase):
         self.valid = valid
         self.inMempool = inMempool
 
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Creates a transaction from the dictionary returned by the server in a single step,
+        without passing it as keyword arguments and renaming 'from'.
+
+        :param data: The dictionary containing the data.
+        :type data: dict
+        :return: The transaction.
+        :rtype: Transaction
+        """
+        transaction = cls.__new__(cls)
+        get = data.get
+        transaction.hash = data["hash"]
+        transaction.blockHash = get("blockHash")
+        transaction.blockNumber = get("blockNumber")
+        transaction.timestamp = get("timestamp")
+        transaction.confirmations = get("confirmations", 0)
+        transaction.transactionIndex = get("transactionIndex")
+        transaction.from_ = data["from"]
+        transaction.fromAddress = data["fromAddress"]
+        transaction.to = data["to"]
+        transaction.toAddress = data["toAddress"]
+        transaction.value = data["value"]
+        transaction.fee = data["fee"]
+        transaction.data = get("data")
+        transaction.flags = data["flags"]
+        transaction.valid = get("valid")
+        transaction.inMempool = get("inMempool")
+        return transaction
+
 
 class TransactionReceipt:
     """
@@ -171,6 +237,15 @@ class TransactionReceipt:
     :type timestamp: int
     """
 
+    __slots__ = (
+        "transactionHash",
+        "transactionIndex",
+        "blockHash",
+        "blockNumber",
+        "confirmations",
+        "timestamp",
+    )
+
     def __init__(
         self,
         transactionHash,
@@ -1,4 +1,13 @@
-__all__ = ["NimiqClient", "InternalErrorException", "RemoteErrorException"]
+__all__ = [
+    "NimiqClient",
+    "InternalErrorException",
+    "RemoteErrorException",
+    "TimeoutException",
+    "CircuitOpenException",
+    "ResponseMode",
+]
+
+__metaclass__ = type
 
 from .models.account import *
 from .models.block import *
@@ -7,10 +16,26 @@ from .models.miner import *
 from .models.node import *
 from .models.peer import *
 from .models.transaction import *
+from .codec import default_codec
+from .cache import ImmutableCache, VolatileCache
+from .retry import NON_IDEMPOTENT_METHODS
+from .single_flight import SingleFlight
+from .metrics import RequestSample
+from .hooks import RequestTrace
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from enum import Enum
+from collections import deque
+from multiprocessing.pool import ThreadPool
+import contextlib
+import copy
+import itertools
+import threading
+import time
+
+clock = getattr(time, "monotonic", time.time)
 
 
 class InternalErrorException(Exception):
@@ -21,6 +46,22 @@ class InternalErrorException(Exception):
     pass
 
 
+class TimeoutException(InternalErrorException):
+    """
+    Timeout or deadline exceeded during a JSON RPC request.
+    """
+
+    pass
+
+
+class CircuitOpenException(InternalErrorException):
+    """
+    JSON RPC request rejected without being sent because the circuit breaker of the server is open.
+    """
+
+    pass
+
+
 class RemoteErrorException(Exception):
     """
     Exception on the remote server.
@@ -28,11 +69,72 @@ class RemoteErrorException(Exception):
 
     def __init__(self, message, code):
         super(RemoteErrorException, self).__init__("{0} ({1})".format(message, code))
+        self.message = message
+        """Error message returned by the server."""
+        self.code = code
+        """Error code returned by the server."""
+
+
+class ResponseMode(str, Enum):
+    """
+    Representation of the results returned by the methods of the client.
+    """
+
+    MODELS = "models"
+    """Model objects, like Block or Transaction."""
+    JSON = "json"
+    """Decoded JSON results, made of dictionaries, lists and values."""
+    BYTES = "bytes"
+    """Bodies of the JSONRPC responses as received, only decoded to check for errors."""
+
+    def __str__(self):
+        return self.value
+
+
+class _RawCallObject(dict):
+    """
+    JSONRPC request object whose response body is returned without decoding.
+    """
+
+    pass
+
+
+def _error_code(error):
+    """
+    Get the code of the error of a request reported in the metrics: the code of a
+    RemoteErrorException, or "timeout", "circuit_open" or "internal". None if there is no error.
+    """
+    if error is None:
+        return None
+    if isinstance(error, RemoteErrorException):
+        return error.code
+    if isinstance(error, TimeoutException):
+        return "timeout"
+    if isinstance(error, CircuitOpenException):
+        return "circuit_open"
+    return "internal"
+
+
+def _timed_chunks(chunks, timings):
+    """
+    Yields the chunks of the body of a streamed response, adding the seconds spent receiving them
+    and their size in bytes to the timings list.
+    """
+    chunks = iter(chunks)
+    while True:
+        start = clock()
+        chunk = next(chunks, None)
+        timings[0] += clock() - start
+        if chunk is None:
+            return
+        timings[1] += len(chunk)
+        yield chunk
 
 
 class NimiqClient:
     """
     API client for the Nimiq JSON RPC server.
+    The client is safe to be shared between threads, the connections to the server are kept in a pool.
 
     :param scheme: Protocol squeme, "http" or "https".
     :type scheme: str, optional
@@ -44,59 +146,856 @@ class NimiqClient:
     :type host: str, optional
     :param port: Host port.
     :type port: int, optional
+    :param pool_connections: Number of connection pools to cache, one per host.
+    :type pool_connections: int, optional
+    :param pool_maxsize: Maximum number of connections to the server kept open in the pool.
+    :type pool_maxsize: int, optional
+    :param pool_block: If True, wait for a free connection when all of them are in use instead of opening a new one.
+    :type pool_block: bool, optional
+    :param keep_alive: If True, connections are kept open to be reused by the following requests.
+    :type keep_alive: bool, optional
+    :param codec: Codec used to encode the requests and decode the responses, the fastest one available if None.
+    :type codec: JSONCodec, optional
+    :param cache_size: Maximum number of immutable results (blocks by hash and mined transactions) kept in a cache, disabled if 0.
+    :type cache_size: int, optional
+    :param volatile_ttls: Time to live in seconds by JSONRPC method of the results of frequently polled requests kept in a cache, like DEFAULT_VOLATILE_TTLS. Disabled if None.
+    :type volatile_ttls: dict, optional
+    :param volatile_stale_ttls: Seconds the results of volatile_ttls can still be returned after their time to live while they are refreshed, by JSONRPC method. Defaults to the time to live.
+    :type volatile_stale_ttls: dict, optional
+    :param timeout: Seconds to wait for the server to accept the connection and to send data, or a (connect, read) tuple. Waits forever if None.
+    :type timeout: float or tuple, optional
+    :param retry_policy: Policy to retry the requests that failed before getting an answer. Not retried if None.
+    :type retry_policy: RetryPolicy, optional
+    :param circuit_breaker: Circuit breaker failing the requests immediately while the server is down. Disabled if None.
+    :type circuit_breaker: CircuitBreaker, optional
+    :param coalesce: If True, identical requests in flight at the same time from several threads share a single request and its result. The methods in NON_IDEMPOTENT_METHODS are never coalesced.
+    :type coalesce: bool, optional
+    :param response_mode: Representation of the results returned by the methods.
+    :type response_mode: ResponseMode, optional
+    :param metrics: Function called with a RequestSample after each request, like a PrometheusMetrics. Disabled if None.
+    :type metrics: function, optional
+    :param hooks: Hooks called around each HTTP request, like an OpenTelemetryHooks. Disabled if None.
+    :type hooks: RequestHooks, optional
     """
 
     def __init__(
-        self, scheme="http", user="", password="", host="127.0.0.1", port=8648
+        self,
+        scheme="http",
+        user="",
+        password="",
+        host="127.0.0.1",
+        port=8648,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        keep_alive=True,
+        codec=None,
+        cache_size=0,
+        volatile_ttls=None,
+        volatile_stale_ttls=None,
+        timeout=None,
+        retry_policy=None,
+        circuit_breaker=None,
+        coalesce=False,
+        response_mode=ResponseMode.MODELS,
+        metrics=None,
+        hooks=None,
     ):
         self.id = 0
+        self.id_lock = threading.Lock()
         self.url = "{0}://{1}:{2}".format(scheme, host, port)
         self.auth = HTTPBasicAuth(user, password)
-        self.session = requests.Session()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.codec = codec if codec is not None else default_codec()
+        self.cache = ImmutableCache(cache_size) if cache_size > 0 else None
+        self.volatile_cache = (
+            VolatileCache(volatile_ttls, volatile_stale_ttls)
+            if volatile_ttls is not None
+            else None
+        )
+        self.timeout = timeout
+        self.local = threading.local()
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.single_flight = (
+            SingleFlight(unshared=(TimeoutException,), timeout_error=TimeoutException)
+            if coalesce
+            else None
+        )
+        self.response_mode = ResponseMode(response_mode)
+        self.metrics = metrics
+        self.hooks = hooks
+        self.session = self._create_session()
 
-    def _call(self, method, *args):
+    def _create_session(self):
         """
-        Used in all JSONRPC requests to fetch the data.
+        Creates the HTTP session used to send the requests to the server.
+
+        :return: The HTTP session.
+        :rtype: requests.Session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Content-Type"] = "application/json"
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _next_id(self):
+        """
+        Increases the JSONRPC client request id atomically.
+
+        :return: The new request id.
+        :rtype: int
+        """
+        with self.id_lock:
+            self.id += 1
+            return self.id
+
+    def with_timeout(self, timeout):
+        """
+        Get a view of the client with another timeout, sharing its connections and caches::
+
+            block = client.with_timeout(0.5).get_block_by_number(1)
+
+        :param timeout: Seconds to wait for the server to accept the connection and to send data, or a (connect, read) tuple. Waits forever if None.
+        :type timeout: float or tuple
+        :return: The client with the new timeout.
+        :rtype: NimiqClient
+        """
+        client = copy.copy(self)
+        client.timeout = timeout
+        # the request ids keep increasing in the original client
+        client._next_id = self._next_id
+        return client
+
+    def with_response_mode(self, response_mode):
+        """
+        Get a view of the client returning another representation of the results, sharing its
+        connections and caches::
+
+            block = client.with_response_mode(ResponseMode.JSON).get_block_by_number(1)
+
+        :param response_mode: Representation of the results returned by the methods.
+        :type response_mode: ResponseMode
+        :return: The client with the new response mode.
+        :rtype: NimiqClient
+        """
+        client = copy.copy(self)
+        client.response_mode = ResponseMode(response_mode)
+        client._next_id = self._next_id
+        return client
+
+    @contextlib.contextmanager
+    def deadline(self, seconds):
+        """
+        Sets an overall deadline for the requests sent by the current thread inside a with block.
+        The timeout of each request is shortened to the time left, and the requests sent once the
+        deadline is exceeded fail without reaching the server::
+
+            with client.deadline(5):
+                block = client.get_block_by_number(client.block_number())
+
+        Nested deadlines can only shorten the outer one.
+
+        :param seconds: Seconds from now until the deadline.
+        :type seconds: float
+        """
+        previous = getattr(self.local, "deadline", None)
+        deadline = clock() + seconds
+        if previous is not None:
+            deadline = min(deadline, previous)
+        self.local.deadline = deadline
+        try:
+            yield
+        finally:
+            self.local.deadline = previous
+
+    def _capture_context(self):
+        """
+        Get the context of the calling thread applied to the requests it continues in other
+        threads: its deadline and the context of the hooks, like the current tracing span.
+
+        :return: The context, passed to _call_in_context.
+        :rtype: tuple
+        """
+        hooks_context = None
+        if self.hooks is not None:
+            hooks_context = self.hooks.capture_context()
+        return getattr(self.local, "deadline", None), hooks_context
+
+    def _call_in_context(self, context, function, *args):
+        """
+        Calls a function with the context of another thread.
+
+        :param context: The context, as returned by _capture_context.
+        :type context: tuple
+        :param function: The function.
+        :type function: function
+        :return: The result of the function.
+        :rtype: object
+        """
+        deadline, hooks_context = context
+        previous = getattr(self.local, "deadline", None)
+        self.local.deadline = deadline
+        token = None
+        if self.hooks is not None:
+            token = self.hooks.attach_context(hooks_context)
+        try:
+            return function(*args)
+        finally:
+            if self.hooks is not None:
+                self.hooks.detach_context(token)
+            self.local.deadline = previous
+
+    def _get_deadline(self):
+        """
+        Get the deadline of the requests sent by the current thread.
+
+        :return: The deadline as a clock() value, None if there is no deadline.
+        :rtype: float or None
+        """
+        return getattr(self.local, "deadline", None)
+
+    def _get_timeout(self):
+        """
+        Get the timeout of the next request sent by the current thread, shortened to its deadline.
+
+        :return: The timeout as accepted by requests.
+        :rtype: float or tuple or None
+        :raises TimeoutException: If the deadline was exceeded.
+        """
+        deadline = self._get_deadline()
+        if deadline is None:
+            return self.timeout
+        remaining = deadline - clock()
+        if remaining <= 0:
+            raise TimeoutException("Deadline exceeded")
+        if type(self.timeout) is tuple:
+            return tuple(
+                min(timeout, remaining) if timeout is not None else remaining
+                for timeout in self.timeout
+            )
+        if self.timeout is None:
+            return remaining
+        return min(self.timeout, remaining)
+
+    def _get_wait_timeout(self):
+        """
+        Get the seconds a coalesced request of the current thread waits for the identical request
+        in flight: its own timeout, or only the time left to its deadline if the requests are
+        retried or have a read timeout, which don't bound the time of a request.
+
+        :return: The seconds to wait, or None to wait forever.
+        :rtype: float or None
+        :raises TimeoutException: If the deadline was exceeded.
+        """
+        if self.retry_policy is None and type(self.timeout) is not tuple:
+            return self._get_timeout()
+        deadline = self._get_deadline()
+        if deadline is None:
+            return None
+        remaining = deadline - clock()
+        if remaining <= 0:
+            raise TimeoutException("Deadline exceeded")
+        return remaining
+
+    def _make_call_object(self, method, params):
+        """
+        Creates the JSONRPC request object with a new request id.
 
         :param method: JSONRPC method.
         :type method: str
         :param params: Parameters used by the request.
         :type params: list
-        :return: If succesfull, returns the model reperestation of the result, None otherwise.
+        :return: The JSONRPC request object.
         :rtype: dict
         """
 
-        # increase the JSONRPC client request id
-        self.id += 1
-
         # make JSON object to send to the server
-        call_object = {
+        return {
             "jsonrpc": "2.0",
             "method": method,
-            "params": list(args),
-            "id": self.id,
+            "params": list(params),
+            "id": self._next_id(),
         }
 
+    def _call(self, method, *args):
+        """
+        Used in all JSONRPC requests to fetch the data.
+
+        :param method: JSONRPC method.
+        :type method: str
+        :param params: Parameters used by the request.
+        :type params: list
+        :return: If succesfull, returns the model reperestation of the result, None otherwise.
+        :rtype: dict
+        """
+
+        if self.cache is not None:
+            result = self.cache.get(method, args)
+            if result is not None:
+                return result
+
+        if self.volatile_cache is not None and self.volatile_cache.caches(method):
+            return self.volatile_cache.get(
+                method, args, lambda: self._fetch(method, args)
+            )
+
+        return self._fetch(method, args)
+
+    def _fetch(self, method, args):
+        """
+        Sends a JSONRPC request to the server, bypassing the volatile cache.
+
+        :param method: JSONRPC method.
+        :type method: str
+        :param args: Parameters used by the request.
+        :type args: tuple
+        :return: The result of the request.
+        :rtype: object
+        """
+        call_object = self._make_call_object(method, args)
+        result = self._get_result(self._send(call_object))
+
+        if self.cache is not None:
+            self.cache.put(method, args, result)
+        return result
+
+    def _send(self, payload):
+        """
+        Sends a JSONRPC request object, or a list of them, retrying it according to the retry policy.
+
+        :param payload: The JSONRPC request object or list of request objects.
+        :type payload: dict or list of (dict)
+        :return: The JSONRPC response object or list of response objects.
+        :rtype: dict or list of (dict)
+        """
+        if self.retry_policy is None:
+            return self._post(payload)
+
+        self.retry_policy.record_request()
+        attempt = 1
+        while True:
+            try:
+                return self._post(payload)
+            except InternalErrorException as e:
+                delay = self._get_retry_delay(payload, attempt, e)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _get_retry_delay(self, payload, attempt, error):
+        """
+        Get the seconds to wait before retrying a failed request.
+
+        :param payload: The JSONRPC request object or list of request objects.
+        :type payload: dict or list of (dict)
+        :param attempt: Number of attempts done, starting at 1.
+        :type attempt: int
+        :param error: The error of the last attempt.
+        :type error: InternalErrorException
+        :return: The seconds to wait, or None if the request must not be retried.
+        :rtype: float or None
+        """
+        # fail fast while the circuit is open
+        if isinstance(error, CircuitOpenException):
+            return None
+        deadline = self._get_deadline()
+        remaining = deadline - clock() if deadline is not None else None
+        return self.retry_policy.next_delay(payload, attempt, remaining)
+
+    def _post(self, payload):
+        """
+        Sends a JSONRPC request object, or a list of them, to the server.
+
+        :param payload: The JSONRPC request object or list of request objects.
+        :type payload: dict or list of (dict)
+        :return: The JSONRPC response object or list of response objects.
+        :rtype: dict or list of (dict)
+        """
+        return self._post_to(
+            self.url, self.auth, payload, self._get_timeout(), self.circuit_breaker
+        )
+
+    def _post_to(self, url, auth, payload, timeout=None, circuit_breaker=None):
+        """
+        Sends a JSONRPC request object, or a list of them, to a server.
+
+        :param url: URL of the server.
+        :type url: str
+        :param auth: Authentication for the server.
+        :type auth: requests.auth.HTTPBasicAuth
+        :param payload: The JSONRPC request object or list of request objects.
+        :type payload: dict or list of (dict)
+        :param timeout: Seconds to wait for the server, or a (connect, read) tuple. Waits forever if None.
+        :type timeout: float or tuple, optional
+        :param circuit_breaker: Circuit breaker of the server.
+        :type circuit_breaker: CircuitBreaker, optional
+        :return: The JSONRPC response object or list of response objects.
+        :rtype: dict or list of (dict)
+        :raises TimeoutException: If the server didn't answer in time.
+        :raises CircuitOpenException: If the circuit breaker of the server is open.
+        """
+        trace = None
+        if self.hooks is not None:
+            trace = self._make_trace(url, payload)
+
+        if circuit_breaker is not None and not circuit_breaker.allow():
+            error = CircuitOpenException("Circuit open for {0}".format(url))
+            if trace is not None:
+                trace.start = time.time()
+                self.hooks.before_request(trace)
+                self._finish_trace(trace, None, error)
+            raise error
+
+        # the request being measured in this thread, if any
+        sample = (
+            getattr(self.local, "sample", None) if self.metrics is not None else None
+        )
+
         # make request
         req_error = None
+        resp_object = None
         try:
-            resp_object = self.session.post(
-                self.url, json=call_object, auth=self.auth
-            ).json()
+            if sample is None and trace is None:
+                response = self.session.post(
+                    url, data=self.codec.dumps(payload), auth=auth, timeout=timeout
+                )
+                resp_object = self._decode_response(payload, response.content)
+            else:
+                resp_object = self._post_measured(
+                    sample, trace, url, auth, payload, timeout
+                )
 
         except Exception as e:
             req_error = e
 
+        if circuit_breaker is not None:
+            if req_error is None:
+                circuit_breaker.record_success()
+            else:
+                circuit_breaker.record_failure()
+
+        if isinstance(req_error, requests.exceptions.Timeout):
+            req_error = TimeoutException(req_error)
+        elif req_error is not None:
+            req_error = InternalErrorException(req_error)
+
+        if trace is not None and trace.start is not None:
+            self._finish_trace(trace, resp_object, req_error)
+
         # raise if there was any error
         if req_error is not None:
-            raise InternalErrorException(req_error)
-
+            raise req_error
+
+        return resp_object
+
+    def _make_trace(self, url, payload):
+        """
+        Creates the trace of a request passed to the hooks.
+
+        :param url: URL of the server.
+        :type url: str
+        :param payload: The JSONRPC request object or list of request objects.
+        :type payload: dict or list of (dict)
+        :return: The trace of the request.
+        :rtype: RequestTrace
+        """
+        if type(payload) is list:
+            trace = RequestTrace("batch", None, url)
+            trace.calls = [
+                RequestTrace(call_object["method"], call_object["id"], url)
+                for call_object in payload
+            ]
+            return trace
+        return RequestTrace(payload["method"], payload["id"], url)
+
+    def _finish_trace(self, trace, resp_object, error):
+        """
+        Completes the trace of a request with its result and passes it to the after hook.
+
+        :param trace: The trace of the request.
+        :type trace: RequestTrace
+        :param resp_object: The JSONRPC response object or list of response objects, None if it failed or was streamed.
+        :type resp_object: dict or list of (dict) or None
+        :param error: The error of the request, None if it succeeded.
+        :type error: Exception or None
+        """
+        trace.duration = (trace.network or 0) + (trace.decode or 0)
+        if isinstance(error, RemoteErrorException):
+            # the error of a streamed response is raised while it's decoded
+            trace.error = error.code
+        elif isinstance(error, TimeoutException):
+            trace.error = "timeout"
+        elif isinstance(error, CircuitOpenException):
+            trace.error = "circuit_open"
+        elif error is not None:
+            trace.error = "internal"
+        elif trace.calls is not None:
+            calls = dict((call.id, call) for call in trace.calls)
+            for response in resp_object:
+                call = calls.get(response.get("id"))
+                if call is not None and response.get("error") is not None:
+                    call.error = response["error"].get("code")
+        elif resp_object is not None and resp_object.get("error") is not None:
+            trace.error = resp_object["error"].get("code")
+        self.hooks.after_request(trace)
+
+    def _post_measured(self, sample, trace, url, auth, payload, timeout):
+        """
+        Sends a JSONRPC request object, or a list of them, adding the time spent in the network and
+        decoding the response to a request sample and to the trace passed to the hooks.
+
+        :param sample: The measurements of the request, None if it is not measured.
+        :type sample: RequestSample or None
+        :param trace: The trace of the request, None if there are no hooks.
+        :type trace: RequestTrace or None
+        :return: The JSONRPC response object or list of response objects.
+        :rtype: dict or list of (dict)
+        """
+        data = self.codec.dumps(payload)
+        if trace is not None:
+            trace.request_size = len(data)
+            trace.start = time.time()
+            self.hooks.before_request(trace)
+        start = clock()
+        try:
+            response = self.session.post(url, data=data, auth=auth, timeout=timeout)
+            content = response.content
+        finally:
+            network = clock() - start
+            if sample is not None:
+                sample.network = (sample.network or 0) + network
+            if trace is not None:
+                trace.network = network
+        if sample is not None:
+            sample.size = (sample.size or 0) + len(content)
+        if trace is not None:
+            trace.status = response.status_code
+            trace.response_size = len(content)
+        start = clock()
+        try:
+            return self._decode_response(payload, content)
+        finally:
+            decode = clock() - start
+            if sample is not None:
+                sample.decode = (sample.decode or 0) + decode
+            if trace is not None:
+                trace.decode = decode
+
+    def _decode_response(self, payload, content):
+        """
+        Decodes the body of a response, unless it answers a request in bytes mode without an error.
+
+        :param payload: The JSONRPC request object or list of request objects.
+        :type payload: dict or list of (dict)
+        :param content: The body of the response.
+        :type content: bytes
+        :return: The JSONRPC response object or list of response objects.
+        :rtype: dict or list of (dict)
+        """
+        raw = type(payload) is _RawCallObject
+        # a response without the key "error" can be returned without decoding it
+        if raw and b'"error"' not in content:
+            return {"result": content}
+        resp_object = self.codec.loads(content)
+        if raw and resp_object.get("error") is None:
+            return {"result": content}
+        return resp_object
+
+    def _get_result(self, resp_object):
+        """
+        Get the result from a JSONRPC response object.
+
+        :param resp_object: The JSONRPC response object.
+        :type resp_object: dict
+        :return: The result of the request.
+        :rtype: object
+        """
         error = resp_object.get("error")
         if error is not None:
             raise RemoteErrorException(error.get("message"), error.get("code"))
 
         return resp_object.get("result")
 
+    def _request(self, decoder, method, *args):
+        """
+        Performs a JSONRPC request and converts the result to its model representation.
+
+        :param decoder: Function used to convert the result, or None to return it as is.
+        :type decoder: function or None
+        :param method: JSONRPC method.
+        :type method: str
+        :param params: Parameters used by the request.
+        :type params: list
+        :return: The result converted by the decoder.
+        :rtype: object
+        """
+        if self.single_flight is not None and method not in NON_IDEMPOTENT_METHODS:
+            # the decoder is the same for the same method, parameters and response mode
+            return self.single_flight.do(
+                (self.response_mode, method, args),
+                self._call_and_decode,
+                decoder,
+                method,
+                timeout=self._get_wait_timeout(),
+                *args
+            )
+        return self._call_and_decode(decoder, method, *args)
+
+    def _call_and_decode(self, decoder, method, *args):
+        if self.metrics is not None and getattr(self.local, "sample", None) is None:
+            return self._measure(method, self._call_and_decode, decoder, method, *args)
+        if self.response_mode == ResponseMode.BYTES:
+            # the caches hold decoded results, so they are skipped
+            call_object = _RawCallObject(self._make_call_object(method, args))
+            return self._get_result(self._send(call_object))
+        result = self._call(method, *args)
+        if decoder is None or self.response_mode == ResponseMode.JSON:
+            return result
+        if self.metrics is None:
+            return decoder(result)
+        start = clock()
+        result = decoder(result)
+        self.local.sample.model = clock() - start
+        return result
+
+    def _measure(self, method, function, *args):
+        """
+        Calls a function performing a request, measuring it with a RequestSample passed to the
+        metrics function once it finishes.
+
+        :param method: JSONRPC method.
+        :type method: str
+        :param function: The function performing the request.
+        :type function: function
+        :param args: Arguments of the function.
+        :return: The result of the function.
+        :rtype: object
+        """
+        sample = RequestSample(method)
+        self.local.sample = sample
+        start = clock()
+        try:
+            return function(*args)
+        except RemoteErrorException as e:
+            sample.error = e.code
+            raise
+        except TimeoutException:
+            sample.error = "timeout"
+            raise
+        except CircuitOpenException:
+            sample.error = "circuit_open"
+            raise
+        except InternalErrorException:
+            sample.error = "internal"
+            raise
+        finally:
+            sample.total = clock() - start
+            self.local.sample = None
+            self.metrics(sample)
+
+    def _stream(self, decoder, method, *args):
+        """
+        Performs a JSONRPC request with an array result, and decodes the elements of the result
+        one at a time as the body of the response arrives, instead of buffering the whole body.
+        The request is not cached nor retried, and the elements are returned as decoded JSON by a
+        client in JSON or bytes mode. It is passed to the hooks, and its sample passed to the
+        metrics function only counts the time spent by the client, not the time the caller takes
+        between the elements.
+
+        :param decoder: Function used to convert each element, or None to return them as is.
+        :type decoder: function or None
+        :param method: JSONRPC method.
+        :type method: str
+        :param params: Parameters used by the request.
+        :type params: list
+        :return: Generator of the elements converted by the decoder.
+        :rtype: generator of (object)
+        """
+        return self._stream_from(
+            self.url, self.auth, self.circuit_breaker, decoder, method, args
+        )
+
+    def _stream_from(self, url, auth, circuit_breaker, decoder, method, args):
+        """
+        Performs a JSONRPC request with an array result on a server, decoding the elements of the
+        result as the body of the response arrives.
+
+        :param url: URL of the server.
+        :type url: str
+        :param auth: Authentication for the server.
+        :type auth: requests.auth.HTTPBasicAuth
+        :param circuit_breaker: Circuit breaker of the server.
+        :type circuit_breaker: CircuitBreaker or None
+        :param decoder: Function used to convert each element, or None to return them as is.
+        :type decoder: function or None
+        :param method: JSONRPC method.
+        :type method: str
+        :param args: Parameters used by the request.
+        :type args: tuple
+        :return: Generator of the elements converted by the decoder.
+        :rtype: generator of (object)
+        :raises CircuitOpenException: If the circuit breaker of the server is open.
+        """
+        from .stream import CHUNK_SIZE, iter_result
+
+        if self.response_mode != ResponseMode.MODELS:
+            decoder = None
+        call_object = self._make_call_object(method, args)
+        sample = RequestSample(method) if self.metrics is not None else None
+        trace = None
+        if self.hooks is not None:
+            trace = self._make_trace(url, call_object)
+        if circuit_breaker is not None and not circuit_breaker.allow():
+            error = CircuitOpenException("Circuit open for {0}".format(url))
+            if sample is not None:
+                sample.total = 0.0
+                sample.error = _error_code(error)
+                self.metrics(sample)
+            if trace is not None:
+                trace.start = time.time()
+                self.hooks.before_request(trace)
+                self._finish_trace(trace, None, error)
+            raise error
+
+        response = None
+        failed = False
+        error = None
+        # seconds spent receiving the body and its size, the time spent posting the request,
+        # parsing the body, including receiving it, and converting the elements
+        timings = [0.0, 0]
+        post = parse = model = 0.0
+        try:
+            data = self.codec.dumps(call_object)
+            timeout = self._get_timeout()
+            if trace is not None:
+                trace.request_size = len(data)
+                trace.start = time.time()
+                self.hooks.before_request(trace)
+            start = clock()
+            response = self.session.post(
+                url, data=data, auth=auth, timeout=timeout, stream=True
+            )
+            post = clock() - start
+            if trace is not None:
+                trace.status = response.status_code
+            chunks = response.iter_content(CHUNK_SIZE)
+            if sample is None and trace is None:
+                for item in iter_result(chunks):
+                    yield decoder(item) if decoder is not None else item
+            else:
+                items = iter_result(_timed_chunks(chunks, timings))
+                end = object()
+                while True:
+                    start = clock()
+                    item = next(items, end)
+                    parse += clock() - start
+                    if item is end:
+                        break
+                    if decoder is not None:
+                        start = clock()
+                        item = decoder(item)
+                        model += clock() - start
+                    yield item
+        except RemoteErrorException as e:
+            error = e
+            raise
+        except InternalErrorException as e:
+            failed = True
+            error = e
+            raise
+        except requests.exceptions.Timeout as e:
+            failed = True
+            error = TimeoutException(e)
+            raise error
+        except Exception as e:
+            failed = True
+            error = InternalErrorException(e)
+            raise error
+        finally:
+            # releases the connection if the generator is closed before the end
+            if response is not None:
+                response.close()
+            if circuit_breaker is not None:
+                if failed:
+                    circuit_breaker.record_failure()
+                else:
+                    circuit_breaker.record_success()
+            if sample is not None:
+                sample.network = post + timings[0]
+                sample.decode = parse - timings[0]
+                if decoder is not None:
+                    sample.model = model
+                sample.size = timings[1]
+                sample.total = sample.network + sample.decode + model
+                sample.error = _error_code(error)
+                self.metrics(sample)
+            if trace is not None and trace.start is not None:
+                trace.network = post + timings[0]
+                trace.decode = parse - timings[0]
+                trace.response_size = timings[1]
+                self._finish_trace(trace, None, error)
+
+    def batch(self, max_size=None):
+        """
+        Creates a batch to send several JSONRPC requests to the server in a single round trip.
+        The batch provides the same methods as the client, but each of them returns a BatchEntry
+        which is resolved once the batch is sent. The results of a client in bytes mode are
+        returned as decoded JSON.
+
+        :param max_size: Maximum number of requests per HTTP request, the whole batch is sent at once if None.
+        :type max_size: int, optional
+        :return: A new empty batch.
+        :rtype: NimiqBatch
+        """
+        from .batch import NimiqBatch
+
+        return NimiqBatch(self, max_size)
+
+    def _call_batch(self, call_objects):
+        """
+        Sends a list of JSONRPC request objects as a single JSON-RPC 2.0 batch.
+
+        :param call_objects: JSONRPC request objects.
+        :type call_objects: list of (dict)
+        :return: Response objects indexed by their request id.
+        :rtype: dict
+        """
+        if self.metrics is not None and getattr(self.local, "sample", None) is None:
+            return self._measure("batch", self._call_batch, call_objects)
+        return self._get_batch_results(self._send(call_objects))
+
+    def _get_batch_results(self, resp_objects):
+        """
+        Get the response objects of a JSON-RPC 2.0 batch indexed by their request id.
+
+        :param resp_objects: The JSONRPC response objects.
+        :type resp_objects: list of (dict) or dict
+        :return: Response objects indexed by their request id.
+        :rtype: dict
+        """
+
+        # the server answers with a single error object if the batch itself is invalid
+        if type(resp_objects) is dict:
+            error = resp_objects.get("error") or {}
+            raise RemoteErrorException(error.get("message"), error.get("code"))
+
+        return dict(
+            (resp_object.get("id"), resp_object) for resp_object in resp_objects
+        )
+
     def _get_account(self, data):
         """
         Get the specific account type from the dictionary data.
@@ -114,6 +1013,90 @@ class NimiqClient:
         else:
             return Account(**data)
 
+    def _get_accounts(self, data):
+        """
+        Get the list of specific account types from the list of dictionaries.
+
+        :param data: The list of dictionaries containing the data.
+        :type data: list of (dict)
+        :return: List of account objects.
+        :rtype: list of (Account or VestingContract or HTLC)
+        """
+        return [self._get_account(account) for account in data]
+
+    def _get_block(self, data):
+        """
+        Get the block from the dictionary data.
+
+        :param data: The dictionary containing the data.
+        :type data: dict or None
+        :return: Block object or None when no block was found.
+        :rtype: Block or None
+        """
+        return Block(**data) if data is not None else None
+
+    def _get_block_template(self, data):
+        """
+        Get the block template from the dictionary data.
+
+        :param data: The dictionary containing the data.
+        :type data: dict
+        :return: Block template object.
+        :rtype: BlockTemplate
+        """
+        return BlockTemplate(
+            BlockTemplateHeader(**data.get("header")),
+            data.get("interlink"),
+            BlockTemplateBody(**data.get("body")),
+            data.get("target"),
+        )
+
+    def _get_transaction(self, data):
+        """
+        Get the transaction from the dictionary data.
+
+        :param data: The dictionary containing the data.
+        :type data: dict or None
+        :return: Transaction object or None when no transaction was found.
+        :rtype: Transaction or None
+        """
+        return Transaction.from_dict(data) if data is not None else None
+
+    def _get_transactions(self, data):
+        """
+        Get the list of transactions from the list of dictionaries or transaction hashes.
+
+        :param data: The list containing the data.
+        :type data: list of (dict or str)
+        :return: List of transactions (either represented by the transaction hash or a transaction object).
+        :rtype: list of (Transaction or str)
+        """
+        return [
+            Transaction.from_dict(tx) if isinstance(tx, dict) else tx for tx in data
+        ]
+
+    def _get_transaction_receipt(self, data):
+        """
+        Get the transaction receipt from the dictionary data.
+
+        :param data: The dictionary containing the data.
+        :type data: dict or None
+        :return: Transaction receipt object or None when no receipt was found.
+        :rtype: TransactionReceipt or None
+        """
+        return TransactionReceipt(**data) if data is not None else None
+
+    def _get_sync_status(self, data):
+        """
+        Get the sync status from the data.
+
+        :param data: The dictionary containing the data or False when not syncing.
+        :type data: dict or bool
+        :return: An object with sync status data or False, when not syncing.
+        :rtype: SyncStatus or bool
+        """
+        return SyncStatus(**data) if type(data) is not bool else data
+
     def accounts(self):
         """
         Returns a list of addresses owned by client.
@@ -121,7 +1104,7 @@ class NimiqClient:
         :return: List of Accounts owned by the client.
         :rtype: list of (Account or VestingContract or HTLC)
         """
-        return [self._get_account(account) for account in self._call("accounts")]
+        return self._request(self._get_accounts, "accounts")
 
     def block_number(self):
         """
@@ -130,7 +1113,7 @@ class NimiqClient:
         :return: The current block height the client is on.
         :rtype: int
         """
-        return self._call("blockNumber")
+        return self._request(None, "blockNumber")
 
     def consensus(self):
         """
@@ -139,7 +1122,7 @@ class NimiqClient:
         :return: Consensus state. "established" is the value for a good state, other values indicate bad.
         :rtype: ConsensusState
         """
-        return ConsensusState(self._call("consensus"))
+        return self._request(ConsensusState, "consensus")
 
     def constant(self, constant):
         """
@@ -150,7 +1133,7 @@ class NimiqClient:
         :return: The value of the constant.
         :rtype: int
         """
-        return self._call("constant", constant)
+        return self._request(None, "constant", constant)
 
     def set_constant(self, constant, value=None):
         """
@@ -163,7 +1146,7 @@ class NimiqClient:
         :return: The new value of the constant.
         :rtype: int
         """
-        return self._call("constant", constant, value)
+        return self._request(None, "constant", constant, value)
 
     def create_account(self):
         """
@@ -172,7 +1155,7 @@ class NimiqClient:
         :return: Information on the wallet that was created using the command.
         :rtype: Wallet
         """
-        return Wallet(**self._call("createAccount"))
+        return self._request(lambda data: Wallet(**data), "createAccount")
 
     def create_raw_transaction(self, transaction):
         """
@@ -183,7 +1166,7 @@ class NimiqClient:
         :return: Hex-encoded transaction.
         :rtype: str
         """
-        return self._call("createRawTransaction", transaction)
+        return self._request(None, "createRawTransaction", transaction)
 
     def get_account(self, address):
         """
@@ -194,7 +1177,7 @@ class NimiqClient:
         :return: Details about the account. Returns the default empty basic account for non-existing accounts.
         :rtype: Account or VestingContract or HTLC
         """
-        return self._get_account(self._call("getAccount", address))
+        return self._request(self._get_account, "getAccount", address)
 
     def get_balance(self, address):
         """
@@ -205,7 +1188,7 @@ class NimiqClient:
         :return: The current balance at the specified address (in smalest unit).
         :rtype: int
         """
-        return self._call("getBalance", address)
+        return self._request(None, "getBalance", address)
 
     def get_block_by_hash(self, hash, include_transactions=None):
         """
@@ -218,12 +1201,12 @@ class NimiqClient:
         :return: A block object or None when no block was found.
         :rtype: Block or None
         """
-        result = None
         if include_transactions is not None:
-            result = self._call("getBlockByHash", hash, include_transactions)
+            return self._request(
+                self._get_block, "getBlockByHash", hash, include_transactions
+            )
         else:
-            result = self._call("getBlockByHash", hash)
-        return Block(**result) if result is not None else None
+            return self._request(self._get_block, "getBlockByHash", hash)
 
     def get_block_by_number(self, height, include_transactions=None):
         """
@@ -236,12 +1219,90 @@ class NimiqClient:
         :return: A block object or None when no block was found.
         :rtype: Block or None
         """
-        result = None
         if include_transactions is not None:
-            result = self._call("getBlockByNumber", height, include_transactions)
+            return self._request(
+                self._get_block, "getBlockByNumber", height, include_transactions
+            )
         else:
-            result = self._call("getBlockByNumber", height)
-        return Block(**result) if result is not None else None
+            return self._request(self._get_block, "getBlockByNumber", height)
+
+    def iter_blocks(
+        self, start, stop=None, include_transactions=None, batch_size=100, prefetch=4
+    ):
+        """
+        Iterates over the blocks in a range of heights. The blocks are requested in batches, several
+        of them in flight at the same time, while only a bounded number of blocks is kept in memory.
+
+        :param start: Height of the first block.
+        :type start: int
+        :param stop: Height after the last block, iterates until the latest block if None.
+        :type stop: int, optional
+        :param include_transactions: If True it returns the full transaction objects, if False only the hashes of the transactions.
+        :type include_transactions: bool, optional
+        :param batch_size: Number of blocks requested in each batch.
+        :type batch_size: int, optional
+        :param prefetch: Maximum number of batches requested ahead of the block being returned.
+        :type prefetch: int, optional
+        :return: Generator of blocks in height order, it stops at the first block not found.
+        :rtype: generator of (Block)
+        """
+        if stop is None:
+            starts = itertools.count(start, batch_size)
+        else:
+            starts = iter(range(start, stop, batch_size))
+        pool = ThreadPool(prefetch)
+        try:
+            pending = deque()
+            while True:
+                for batch_start in starts:
+                    batch_stop = batch_start + batch_size
+                    if stop is not None:
+                        batch_stop = min(batch_stop, stop)
+                    # the deadline and tracing context of the calling thread also
+                    # apply to the pool threads
+                    pending.append(
+                        pool.apply_async(
+                            self._call_in_context,
+                            (
+                                self._capture_context(),
+                                self._get_blocks,
+                                batch_start,
+                                batch_stop,
+                                include_transactions,
+                            ),
+                        )
+                    )
+                    if len(pending) >= prefetch:
+                        break
+                if not pending:
+                    return
+                for block in pending.popleft().get():
+                    if block is None:
+                        return
+                    yield block
+        finally:
+            pool.terminate()
+
+    def _get_blocks(self, start, stop, include_transactions):
+        """
+        Get the blocks in a range of heights with a single batch.
+
+        :param start: Height of the first block.
+        :type start: int
+        :param stop: Height after the last block.
+        :type stop: int
+        :param include_transactions: If True it returns the full transaction objects, if False only the hashes of the transactions.
+        :type include_transactions: bool or None
+        :return: List of blocks, None for the blocks not found.
+        :rtype: list of (Block or None)
+        """
+        batch = self.batch()
+        entries = [
+            batch.get_block_by_number(height, include_transactions)
+            for height in range(start, stop)
+        ]
+        batch.send()
+        return [entry.result() for entry in entries]
 
     def get_block_template(self, address=None, extra_data=""):
         """
@@ -255,17 +1316,12 @@ class NimiqClient:
         :return: A block template object.
         :rtype: BlockTemplate
         """
-        result = None
         if address is not None:
-            result = self._call("getBlockTemplate", address, extra_data)
+            return self._request(
+                self._get_block_template, "getBlockTemplate", address, extra_data
+            )
         else:
-            result = self._call("getBlockTemplate")
-        return BlockTemplate(
-            BlockTemplateHeader(**result.get("header")),
-            result.get("interlink"),
-            BlockTemplateBody(**result.get("body")),
-            result.get("target"),
-        )
+            return self._request(self._get_block_template, "getBlockTemplate")
 
     def get_block_transaction_count_by_hash(self, hash):
         """
@@ -276,7 +1332,7 @@ class NimiqClient:
         :return: Number of transactions in the block found, or None, when no block was found.
         :rtype: int or None
         """
-        return self._call("getBlockTransactionCountByHash", hash)
+        return self._request(None, "getBlockTransactionCountByHash", hash)
 
     def get_block_transaction_count_by_number(self, height):
         """
@@ -287,7 +1343,7 @@ class NimiqClient:
         :return: Number of transactions in the block found, or None, when no block was found.
         :rtype: int or None
         """
-        return self._call("getBlockTransactionCountByNumber", height)
+        return self._request(None, "getBlockTransactionCountByNumber", height)
 
     def get_transaction_by_block_hash_and_index(self, hash, index):
         """
@@ -300,11 +1356,9 @@ class NimiqClient:
         :return: A transaction object or None when no transaction was found.
         :rtype: Transaction or None
         """
-        result = self._call("getTransactionByBlockHashAndIndex", hash, index)
-        if result is not None:
-            return Transaction(**result)
-        else:
-            return None
+        return self._request(
+            self._get_transaction, "getTransactionByBlockHashAndIndex", hash, index
+        )
 
     def get_transaction_by_block_number_and_index(self, height, index):
         """
@@ -317,11 +1371,9 @@ class NimiqClient:
         :return: A transaction object or None when no transaction was found.
         :rtype: Transaction or None
         """
-        result = self._call("getTransactionByBlockNumberAndIndex", height, index)
-        if result is not None:
-            return Transaction(**result)
-        else:
-            return None
+        return self._request(
+            self._get_transaction, "getTransactionByBlockNumberAndIndex", height, index
+        )
 
     def get_transaction_by_hash(self, hash):
         """
@@ -332,11 +1384,7 @@ class NimiqClient:
         :return: A transaction object or None when no transaction was found.
         :rtype: Transaction or None
         """
-        result = self._call("getTransactionByHash", hash)
-        if result is not None:
-            return Transaction(**result)
-        else:
-            return None
+        return self._request(self._get_transaction, "getTransactionByHash", hash)
 
     def get_transaction_receipt(self, hash):
         """
@@ -347,11 +1395,9 @@ class NimiqClient:
         :return: A transaction receipt object, or None when no receipt was found.
         :rtype: TransactionReceipt or None
         """
-        result = self._call("getTransactionReceipt", hash)
-        if result is not None:
-            return TransactionReceipt(**result)
-        else:
-            return None
+        return self._request(
+            self._get_transaction_receipt, "getTransactionReceipt", hash
+        )
 
     def get_transactions_by_address(self, address, number_of_transactions=None):
         """
@@ -365,14 +1411,42 @@ class NimiqClient:
         :return: List of transactions linked to the requested address.
         :rtype: list of (Transaction)
         """
-        result = None
         if number_of_transactions is not None:
-            result = self._call(
-                "getTransactionsByAddress", address, number_of_transactions
+            return self._request(
+                self._get_transactions,
+                "getTransactionsByAddress",
+                address,
+                number_of_transactions,
+            )
+        else:
+            return self._request(
+                self._get_transactions, "getTransactionsByAddress", address
+            )
+
+    def iter_transactions_by_address(self, address, number_of_transactions=None):
+        """
+        Iterates over the latest transactions successfully performed by or for an address, as
+        get_transactions_by_address, decoding them one at a time as the response arrives.
+        The request is not cached nor retried.
+
+        :param address: Address of which transactions should be gathered.
+        :type address: str
+        :param number_of_transactions: Number of transactions that shall be returned.
+        :type number_of_transactions: int, optional
+        :return: Generator of the transactions linked to the requested address.
+        :rtype: generator of (Transaction)
+        """
+        if number_of_transactions is not None:
+            return self._stream(
+                Transaction.from_dict,
+                "getTransactionsByAddress",
+                address,
+                number_of_transactions,
             )
         else:
-            result = self._call("getTransactionsByAddress", address)
-        return [Transaction(**tx) for tx in result]
+            return self._stream(
+                Transaction.from_dict, "getTransactionsByAddress", address
+            )
 
     def get_work(self, address=None, extra_data=""):
         """
@@ -385,12 +1459,11 @@ class NimiqClient:
         :return: Mining work instructions.
         :rtype: WorkInstructions
         """
-        result = None
+        decoder = lambda data: WorkInstructions(**data)
         if address is not None:
-            result = self._call("getWork", address, extra_data)
+            return self._request(decoder, "getWork", address, extra_data)
         else:
-            result = self._call("getWork")
-        return WorkInstructions(**result)
+            return self._request(decoder, "getWork")
 
     def hashrate(self):
         """
@@ -399,7 +1472,7 @@ class NimiqClient:
         :return: Number of hashes per second.
         :rtype: float
         """
-        return self._call("hashrate")
+        return self._request(None, "hashrate")
 
     def set_log(self, tag, level):
         """
@@ -412,7 +1485,7 @@ class NimiqClient:
         :return: True if the log level was changed, False otherwise.
         :rtype: bool
         """
-        return self._call("log", tag, level)
+        return self._request(None, "log", tag, level)
 
     def mempool(self):
         """
@@ -421,8 +1494,7 @@ class NimiqClient:
         :return: Mempool information.
         :rtype: MempoolInfo
         """
-        result = self._call("mempool")
-        return MempoolInfo(**result)
+        return self._request(lambda data: MempoolInfo(**data), "mempool")
 
     def mempool_content(self, include_transactions=None):
         """
@@ -433,12 +1505,28 @@ class NimiqClient:
         :return: List of transactions (either represented by the transaction hash or a transaction object).
         :rtype: list of (Transaction or str)
         """
-        result = None
         if include_transactions is not None:
-            result = self._call("mempoolContent", include_transactions)
+            return self._request(
+                self._get_transactions, "mempoolContent", include_transactions
+            )
+        else:
+            return self._request(self._get_transactions, "mempoolContent")
+
+    def iter_mempool_content(self, include_transactions=None):
+        """
+        Iterates over the transactions that are currently in the mempool, as mempool_content,
+        decoding them one at a time as the response arrives. The request is not cached nor retried.
+
+        :param include_transactions: If True includes full transactions, if False includes only transaction hashes.
+        :type include_transactions: bool, optional
+        :return: Generator of transactions (either represented by the transaction hash or a transaction object).
+        :rtype: generator of (Transaction or str)
+        """
+        decoder = lambda tx: Transaction.from_dict(tx) if isinstance(tx, dict) else tx
+        if include_transactions is not None:
+            return self._stream(decoder, "mempoolContent", include_transactions)
         else:
-            result = self._call("mempoolContent")
-        return [tx if type(tx) is str else Transaction(**tx) for tx in result]
+            return self._stream(decoder, "mempoolContent")
 
     def miner_address(self):
         """
@@ -447,7 +1535,7 @@ class NimiqClient:
         :return: The miner address configured on the node.
         :rtype: str
         """
-        return self._call("minerAddress")
+        return self._request(None, "minerAddress")
 
     def miner_threads(self):
         """
@@ -456,7 +1544,7 @@ class NimiqClient:
         :return: The number of threads allocated for mining.
         :rtype: int
         """
-        return self._call("minerThreads")
+        return self._request(None, "minerThreads")
 
     def set_miner_threads(self, threads=None):
         """
@@ -467,7 +1555,7 @@ class NimiqClient:
         :return: The new number of threads allocated for mining.
         :rtype: int
         """
-        return self._call("minerThreads", threads)
+        return self._request(None, "minerThreads", threads)
 
     def min_fee_per_byte(self):
         """
@@ -476,7 +1564,7 @@ class NimiqClient:
         :return: The new minimum fee per byte.
         :rtype: int
         """
-        return self._call("minFeePerByte")
+        return self._request(None, "minFeePerByte")
 
     def set_min_fee_per_byte(self, fee=None):
         """
@@ -487,7 +1575,7 @@ class NimiqClient:
         :return: The new minimum fee per byte.
         :rtype: int
         """
-        return self._call("minFeePerByte", fee)
+        return self._request(None, "minFeePerByte", fee)
 
     def is_mining(self):
         """
@@ -496,7 +1584,7 @@ class NimiqClient:
         :return: True if the client is mining, otherwise False.
         :rtype: bool
         """
-        return self._call("mining")
+        return self._request(None, "mining")
 
     def set_mining(self, state=None):
         """
@@ -507,7 +1595,7 @@ class NimiqClient:
         :return: True if the client is mining, otherwise False.
         :rtype: bool
         """
-        return self._call("mining", state)
+        return self._request(None, "mining", state)
 
     def peer_count(self):
         """
@@ -516,7 +1604,7 @@ class NimiqClient:
         :return: Number of connected peers.
         :rtype: int
         """
-        return self._call("peerCount")
+        return self._request(None, "peerCount")
 
     def peer_list(self):
         """
@@ -525,7 +1613,7 @@ class NimiqClient:
         :return: The list of peers.
         :rtype: list of (Peer)
         """
-        return [Peer(**peer) for peer in self._call("peerList")]
+        return self._request(lambda data: [Peer(**peer) for peer in data], "peerList")
 
     def peer_state(self, address):
         """
@@ -536,7 +1624,7 @@ class NimiqClient:
         :return: The current state of the peer.
         :rtype: Peer
         """
-        return Peer(**self._call("peerState", address))
+        return self._request(lambda data: Peer(**data), "peerState", address)
 
     def set_peer_state(self, address, command=None):
         """
@@ -549,7 +1637,7 @@ class NimiqClient:
         :return: The new state of the peer.
         :rtype: Peer
         """
-        return Peer(**self._call("peerState", address, command))
+        return self._request(lambda data: Peer(**data), "peerState", address, command)
 
     def pool(self):
         """
@@ -558,7 +1646,7 @@ class NimiqClient:
         :return: The mining pool connection string, or None if not enabled.
         :rtype: str or None
         """
-        return self._call("pool")
+        return self._request(None, "pool")
 
     def set_pool(self, address=None):
         """
@@ -569,7 +1657,7 @@ class NimiqClient:
         :return: The new mining pool connection string, or None if not enabled.
         :rtype: str or None
         """
-        return self._call("pool", address)
+        return self._request(None, "pool", address)
 
     def pool_confirmed_balance(self):
         """
@@ -578,7 +1666,7 @@ class NimiqClient:
         :return: The confirmed mining pool balance (in smallest unit).
         :rtype: int
         """
-        return self._call("poolConfirmedBalance")
+        return self._request(None, "poolConfirmedBalance")
 
     def pool_connection_state(self):
         """
@@ -587,7 +1675,7 @@ class NimiqClient:
         :return: The mining pool connection state.
         :rtype: PoolConnectionState
         """
-        return PoolConnectionState(self._call("poolConnectionState"))
+        return self._request(PoolConnectionState, "poolConnectionState")
 
     def send_raw_transaction(self, transaction):
         """
@@ -598,7 +1686,7 @@ class NimiqClient:
         :return: The Hex-encoded transaction hash.
         :rtype: str
         """
-        return self._call("sendRawTransaction", transaction)
+        return self._request(None, "sendRawTransaction", transaction)
 
     def send_transaction(self, transaction):
         """
@@ -609,7 +1697,7 @@ class NimiqClient:
         :return: The Hex-encoded transaction hash.
         :rtype: str
         """
-        return self._call("sendTransaction", transaction)
+        return self._request(None, "sendTransaction", transaction)
 
     def submit_block(self, block):
         """
@@ -618,7 +1706,7 @@ class NimiqClient:
         :param block: Hex-encoded full block (including header, interlink and body). When submitting work from getWork, remember to include the suffix.
         :type block: Block
         """
-        self._call("submitBlock", block)
+        return self._request(None, "submitBlock", block)
 
     def syncing(self):
         """
@@ -627,11 +1715,7 @@ class NimiqClient:
         :return: An object with sync status data or False, when not syncing.
         :rtype: SyncStatus
         """
-        result = self._call("syncing")
-        if type(result) is not bool:
-            return SyncStatus(**result)
-        else:
-            return result
+        return self._request(self._get_sync_status, "syncing")
 
     def get_raw_transaction_info(self, transaction):
         """
@@ -642,7 +1726,9 @@ class NimiqClient:
         :return: The transaction object.
         :rtype: Transaction
         """
-        return Transaction(**self._call("getRawTransactionInfo", transaction))
+        return self._request(
+            Transaction.from_dict, "getRawTransactionInfo", transaction
+        )
 
     def reset_constant(self, constant):
         """
@@ -653,4 +1739,4 @@ class NimiqClient:
         :return: The new value of the constant.
         :rtype: int
         """
-        return self._call("constant", constant, "reset")
+        return self._request(None, "constant", constant, "reset")
@@ -0,0 +1,375 @@
+__all__ = [
+    "Cassette",
+    "CassetteEntry",
+    "RecordingSession",
+    "ReplaySession",
+    "replay",
+]
+
+__metaclass__ = type
+
+from .nimiq_client import InternalErrorException, RemoteErrorException
+
+import gzip
+import io
+import json
+import re
+import threading
+import time
+
+clock = getattr(time, "monotonic", time.time)
+
+CASSETTE_VERSION = 1
+
+
+class CassetteEntry:
+    """
+    HTTP request recorded in a cassette.
+
+    :param start: Seconds since the start of the recording when the request was sent.
+    :type start: float
+    :param duration: Seconds taken by the server to answer.
+    :type duration: float
+    :param status: HTTP status code of the response.
+    :type status: int
+    :param request: Body of the request, a JSONRPC request object or list of them.
+    :type request: bytes
+    :param response: Body of the response.
+    :type response: bytes
+    """
+
+    __slots__ = ("start", "duration", "status", "request", "response")
+
+    def __init__(self, start, duration, status, request, response):
+        self.start = start
+        self.duration = duration
+        self.status = status
+        self.request = request
+        self.response = response
+
+    def calls(self):
+        """
+        Get the JSONRPC requests of the entry.
+
+        :return: The method and parameters of each request, and whether they were sent in a batch.
+        :rtype: tuple of (list of (tuple of (str, list)), bool)
+        """
+        request = json.loads(self.request.decode("utf-8"))
+        if type(request) is list:
+            return [(r["method"], r.get("params") or []) for r in request], True
+        return [(request["method"], request.get("params") or [])], False
+
+
+def _key(request):
+    """
+    Get the key matching a request body with the recorded ones, ignoring the request ids.
+    """
+    if type(request) is list:
+        return json.dumps(
+            [[r.get("method"), r.get("params") or []] for r in request], sort_keys=True
+        )
+    return json.dumps(
+        [request.get("method"), request.get("params") or []], sort_keys=True
+    )
+
+
+def _open(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode)
+    return io.open(path, mode)
+
+
+class Cassette:
+    """
+    HTTP requests sent to a node and their responses, with their timing, saved as JSON lines,
+    gzip-compressed if the file name ends with ".gz". The lines after the header hold the start
+    and duration in seconds, the HTTP status code and the request and response bodies of each entry.
+
+    :param entries: The recorded requests.
+    :type entries: list of (CassetteEntry), optional
+    """
+
+    def __init__(self, entries=None):
+        self.entries = entries if entries is not None else []
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def append(self, entry):
+        """
+        Adds a recorded request.
+
+        :param entry: The recorded request.
+        :type entry: CassetteEntry
+        """
+        with self.lock:
+            self.entries.append(entry)
+
+    def save(self, path):
+        """
+        Writes the cassette to a file.
+
+        :param path: Path of the file, gzip-compressed if it ends with ".gz".
+        :type path: str
+        """
+        with self.lock:
+            entries = sorted(self.entries, key=lambda entry: entry.start)
+        with _open(path, "wb") as f:
+            f.write(json.dumps({"version": CASSETTE_VERSION}).encode("utf-8") + b"\n")
+            for entry in entries:
+                line = json.dumps(
+                    {
+                        "start": round(entry.start, 6),
+                        "duration": round(entry.duration, 6),
+                        "status": entry.status,
+                        "request": entry.request.decode("utf-8"),
+                        "response": entry.response.decode("utf-8"),
+                    },
+                    separators=(",", ":"),
+                )
+                f.write(line.encode("utf-8") + b"\n")
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a cassette from a file.
+
+        :param path: Path of the file, gzip-compressed if it ends with ".gz".
+        :type path: str
+        :return: The cassette.
+        :rtype: Cassette
+        :raises InternalErrorException: If the file is not a cassette of a supported version.
+        """
+        with _open(path, "rb") as f:
+            lines = iter(f)
+            header = json.loads(next(lines, b"{}").decode("utf-8"))
+            if header.get("version") != CASSETTE_VERSION:
+                raise InternalErrorException(
+                    "Unsupported cassette version {0}".format(header.get("version"))
+                )
+            entries = []
+            for line in lines:
+                data = json.loads(line.decode("utf-8"))
+                entries.append(
+                    CassetteEntry(
+                        data["start"],
+                        data["duration"],
+                        data["status"],
+                        data["request"].encode("utf-8"),
+                        data["response"].encode("utf-8"),
+                    )
+                )
+        return cls(entries)
+
+
+class RecordingSession:
+    """
+    Session recording the requests sent by a client, and the responses of the server, in a cassette::
+
+        client.session = RecordingSession(client.session)
+        client.get_block_by_number(1)
+        client.session.cassette.save("traffic.jsonl.gz")
+
+    The streamed responses are read completely to record them.
+
+    :param session: The session sending the requests.
+    :type session: requests.Session
+    :param cassette: The cassette the requests are added to, a new one if None.
+    :type cassette: Cassette, optional
+    """
+
+    def __init__(self, session, cassette=None):
+        self.session = session
+        self.cassette = cassette if cassette is not None else Cassette()
+        self.origin = clock()
+
+    def post(self, url, data, auth, timeout=None, stream=False):
+        start = clock()
+        response = self.session.post(
+            url, data=data, auth=auth, timeout=timeout, stream=stream
+        )
+        content = response.content
+        self.cassette.append(
+            CassetteEntry(
+                start - self.origin,
+                clock() - start,
+                response.status_code,
+                data,
+                content,
+            )
+        )
+        return response
+
+    def close(self):
+        self.session.close()
+
+
+class _ReplayResponse:
+    """
+    Response of a ReplaySession.
+    """
+
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+    def close(self):
+        pass
+
+
+class ReplaySession:
+    """
+    Session answering the requests of a client with the responses recorded in a cassette, without
+    any network access. The requests are matched with the recorded ones by their methods and
+    parameters, the repeated ones get the recorded responses in order, the last one once all of them
+    were used. The responses to a batch get the ids of the requests, the other responses are returned
+    as recorded::
+
+        client.session = ReplaySession(Cassette.load("traffic.jsonl.gz"), speed=None)
+
+    :param cassette: The cassette with the recorded requests.
+    :type cassette: Cassette
+    :param speed: Speed of the recorded server, it answers after the recorded duration divided by the speed. Answers immediately if None.
+    :type speed: float, optional
+    """
+
+    def __init__(self, cassette, speed=1.0):
+        self.speed = speed
+        self.lock = threading.Lock()
+        self.entries = {}
+        for entry in cassette:
+            key = _key(json.loads(entry.request.decode("utf-8")))
+            self.entries.setdefault(key, []).append(entry)
+        self.positions = dict((key, 0) for key in self.entries)
+        self.misses = 0
+        """Number of requests not found in the cassette."""
+
+    def answer(self, data):
+        """
+        Get the recorded response to a request body.
+
+        :param data: Body of the request.
+        :type data: bytes
+        :return: The HTTP status code and the body of the response.
+        :rtype: tuple of (int, bytes)
+        """
+        request = json.loads(data.decode("utf-8"))
+        key = _key(request)
+        with self.lock:
+            entries = self.entries.get(key)
+            if entries is None:
+                self.misses += 1
+                entry = None
+            else:
+                position = self.positions[key]
+                entry = entries[min(position, len(entries) - 1)]
+                self.positions[key] = position + 1
+        if entry is None:
+            error = {"code": -32601, "message": "Request not found in the cassette"}
+            if type(request) is list:
+                response = [
+                    {"jsonrpc": "2.0", "error": error, "id": r.get("id")}
+                    for r in request
+                ]
+            else:
+                response = {"jsonrpc": "2.0", "error": error, "id": request.get("id")}
+            return 200, json.dumps(response).encode("utf-8")
+        if self.speed:
+            time.sleep(entry.duration / self.speed)
+        content = entry.response
+        if type(request) is list:
+            content = self._rewrite_ids(entry, request, content)
+        return entry.status, content
+
+    def _rewrite_ids(self, entry, request, content):
+        """
+        Replaces the ids of the recorded responses to a batch with the ids of the new requests.
+        """
+        recorded = json.loads(entry.request.decode("utf-8"))
+        ids = dict((old["id"], new["id"]) for old, new in zip(recorded, request))
+        try:
+            responses = json.loads(content.decode("utf-8"))
+        except ValueError:
+            return content
+        if type(responses) is not list:
+            return content
+        for response in responses:
+            response["id"] = ids.get(response.get("id"), response.get("id"))
+        return json.dumps(responses).encode("utf-8")
+
+    def post(self, url, data, auth, timeout=None, stream=False):
+        status, content = self.answer(data)
+        return _ReplayResponse(status, content)
+
+    def close(self):
+        pass
+
+
+def _function_name(method):
+    return re.sub("([A-Z])", lambda match: "_" + match.group(1).lower(), method)
+
+
+def _call(client, method, params):
+    """
+    Sends a recorded request with the method of the client named after it, so its result is
+    converted to the model objects, or as is if the client has no such method.
+    """
+    function = getattr(client, _function_name(method), None)
+    code = getattr(function, "__code__", None)
+    # methods like minFeePerByte are setters with parameters, sent as is
+    if code is None or code.co_argcount - 1 < len(params):
+        return client._request(None, method, *params)
+    return function(*params)
+
+
+def replay(client, cassette, speed=1.0):
+    """
+    Sends the requests recorded in a cassette through the methods of a client, in the recorded
+    order, and measures them. The batches are sent in batches. With a speed the requests are sent
+    at the recorded times divided by the speed, and as fast as possible if None.
+    The client should answer from a ReplaySession or a stand-in node replaying the same cassette::
+
+        cassette = Cassette.load("traffic.jsonl.gz")
+        client = NimiqClient(cache_size=1000)
+        client.session = ReplaySession(cassette, speed=None)
+        for method, seconds, error in replay(client, cassette, speed=None):
+            print(method, seconds)
+
+    :param client: The client sending the requests.
+    :type client: NimiqClient
+    :param cassette: The cassette with the recorded requests.
+    :type cassette: Cassette
+    :param speed: Speed of the replay, 2 sends the requests twice as fast as recorded.
+    :type speed: float, optional
+    :return: The method, the seconds taken and the error if any of each entry, "batch" for the batches.
+    :rtype: list of (tuple of (str, float, Exception or None))
+    """
+    results = []
+    origin = clock()
+    for entry in sorted(cassette, key=lambda entry: entry.start):
+        if speed:
+            delay = origin + entry.start / speed - clock()
+            if delay > 0:
+                time.sleep(delay)
+        calls, batched = entry.calls()
+        error = None
+        start = clock()
+        try:
+            if batched:
+                with client.batch() as batch:
+                    for method, params in calls:
+                        _call(batch, method, params)
+            else:
+                _call(client, calls[0][0], calls[0][1])
+        except (InternalErrorException, RemoteErrorException) as e:
+            error = e
+        results.append(("batch" if batched else calls[0][0], clock() - start, error))
+    return results
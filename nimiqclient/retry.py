@@ -0,0 +1,232 @@
+__all__ = ["RetryPolicy", "CircuitState", "CircuitBreaker", "NON_IDEMPOTENT_METHODS"]
+
+__metaclass__ = type
+
+from enum import Enum
+import random
+import threading
+import time
+
+NON_IDEMPOTENT_METHODS = frozenset(
+    ["sendTransaction", "sendRawTransaction", "submitBlock", "createAccount"]
+)
+"""JSONRPC methods that are not retried unless the retry policy allows it."""
+
+
+class RetryPolicy:
+    """
+    Policy to retry the requests that failed before getting an answer from the server, like
+    connection resets or timeouts. The retries wait an exponential backoff with full jitter, and
+    they are limited by a budget: each request adds budget_ratio retries to the budget, up to
+    budget retries, so retries can't multiply the load of a server that is already failing.
+
+    :param max_attempts: Maximum number of attempts of a request, including the first one.
+    :type max_attempts: int, optional
+    :param backoff: Seconds to wait before the first retry, doubled for every following retry.
+    :type backoff: float, optional
+    :param max_backoff: Maximum number of seconds to wait before a retry.
+    :type max_backoff: float, optional
+    :param jitter: If True, the waits are randomized between 0 and the backoff.
+    :type jitter: bool, optional
+    :param retry_writes: If True, the methods in NON_IDEMPOTENT_METHODS are also retried.
+    :type retry_writes: bool, optional
+    :param budget: Maximum number of retries available in the budget, also the initial number.
+    :type budget: float, optional
+    :param budget_ratio: Retries added to the budget by each request.
+    :type budget_ratio: float, optional
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff=0.05,
+        max_backoff=1.0,
+        jitter=True,
+        retry_writes=False,
+        budget=10,
+        budget_ratio=0.1,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_writes = retry_writes
+        self.budget = budget
+        self.budget_ratio = budget_ratio
+        self.tokens = float(budget)
+        """Retries available in the budget."""
+        self.lock = threading.Lock()
+        self.requests = 0
+        """Number of requests sent with the policy."""
+        self.retries = 0
+        """Number of retries."""
+        self.exhausted = 0
+        """Number of requests that failed after their last attempt."""
+        self.budget_exceeded = 0
+        """Number of retries not done because the budget was empty."""
+
+    def is_retryable(self, payload):
+        """
+        Check if a JSONRPC request object, or a list of them, can be retried.
+
+        :param payload: The JSONRPC request object or list of request objects.
+        :type payload: dict or list of (dict)
+        :return: True if the request can be retried.
+        :rtype: bool
+        """
+        if self.retry_writes:
+            return True
+        call_objects = payload if type(payload) is list else [payload]
+        return not any(
+            call_object.get("method") in NON_IDEMPOTENT_METHODS
+            for call_object in call_objects
+        )
+
+    def record_request(self):
+        """
+        Registers a new request, adding budget_ratio retries to the budget.
+        """
+        with self.lock:
+            self.requests += 1
+            self.tokens = min(self.tokens + self.budget_ratio, self.budget)
+
+    def next_delay(self, payload, attempt, remaining=None):
+        """
+        Get the seconds to wait before retrying a failed request, taking the retry from the budget.
+
+        :param payload: The JSONRPC request object or list of request objects.
+        :type payload: dict or list of (dict)
+        :param attempt: Number of attempts done, starting at 1.
+        :type attempt: int
+        :param remaining: Seconds until the deadline of the request, None if it has no deadline.
+        :type remaining: float, optional
+        :return: The seconds to wait, or None if the request must not be retried.
+        :rtype: float or None
+        """
+        if not self.is_retryable(payload):
+            return None
+        delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        with self.lock:
+            if attempt >= self.max_attempts or (
+                remaining is not None and delay >= remaining
+            ):
+                self.exhausted += 1
+                return None
+            if self.tokens < 1:
+                self.budget_exceeded += 1
+                self.exhausted += 1
+                return None
+            self.tokens -= 1
+            self.retries += 1
+        return delay
+
+
+class CircuitState(str, Enum):
+    """
+    State of a circuit breaker.
+    """
+
+    CLOSED = "closed"
+    """Requests are sent."""
+    OPEN = "open"
+    """Requests fail without being sent."""
+    HALF_OPEN = "half_open"
+    """A single trial request is sent, the circuit closes if it succeeds and opens again otherwise."""
+
+    def __str__(self):
+        return self.value
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of a server. After failure_threshold consecutive requests fail, the circuit
+    opens and the requests fail immediately, instead of waiting for a server that is down.
+    After reset_timeout seconds a trial request is sent to check if the server recovered.
+
+    :param failure_threshold: Number of consecutive failures that opens the circuit.
+    :type failure_threshold: int, optional
+    :param reset_timeout: Seconds the circuit stays open before a trial request.
+    :type reset_timeout: float, optional
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=10.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.state = CircuitState.CLOSED
+        """State of the circuit."""
+        self.failures = 0
+        """Number of consecutive failures."""
+        self.opened_at = None
+        self.trial = False
+        self.opened = 0
+        """Number of times the circuit opened."""
+        self.rejected = 0
+        """Number of requests rejected while the circuit was open."""
+        self.clock = getattr(time, "monotonic", time.time)
+
+    @property
+    def available(self):
+        """False if a request would be rejected."""
+        with self.lock:
+            if self.state == CircuitState.CLOSED:
+                return True
+            if self.state == CircuitState.HALF_OPEN:
+                return not self.trial
+            return self.clock() - self.opened_at >= self.reset_timeout
+
+    def allow(self):
+        """
+        Check if a request can be sent, claiming the trial request if the circuit is half open.
+
+        :return: True if the request can be sent.
+        :rtype: bool
+        """
+        with self.lock:
+            if self.state == CircuitState.OPEN:
+                if self.clock() - self.opened_at >= self.reset_timeout:
+                    self.state = CircuitState.HALF_OPEN
+                    self.trial = False
+            if self.state == CircuitState.CLOSED:
+                return True
+            if self.state == CircuitState.HALF_OPEN and not self.trial:
+                self.trial = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        """
+        Registers a request that got an answer from the server, closing the circuit.
+        """
+        with self.lock:
+            self.failures = 0
+            self.trial = False
+            self.state = CircuitState.CLOSED
+
+    def record_cancel(self):
+        """
+        Registers a request abandoned before getting an answer, like a cancelled task. It doesn't
+        count as a failure, but it releases the trial request so another one can be sent.
+        """
+        with self.lock:
+            self.trial = False
+
+    def record_failure(self):
+        """
+        Registers a request that failed, opening the circuit if the failure threshold is reached
+        or the trial request failed.
+        """
+        with self.lock:
+            self.failures += 1
+            self.trial = False
+            if (
+                self.state == CircuitState.HALF_OPEN
+                or self.failures >= self.failure_threshold
+            ):
+                if self.state != CircuitState.OPEN:
+                    self.opened += 1
+                self.state = CircuitState.OPEN
+                self.opened_at = self.clock()
@@ -0,0 +1,86 @@
+__all__ = ["SingleFlight"]
+
+__metaclass__ = type
+
+import threading
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical calls in flight at the same time: while a call is running, the threads
+    doing the same call wait for it and share its result or its exception, instead of repeating
+    the work. Once the call finishes, the next identical call runs again, no result is kept.
+
+    :param unshared: Exception types that depend on the call that raised them, like timeouts. They are not shared, the waiting calls run on their own instead.
+    :type unshared: tuple of (type), optional
+    :param timeout_error: Exception type raised by a call that stops waiting for the identical call in flight after its timeout.
+    :type timeout_error: type, optional
+    """
+
+    def __init__(self, unshared=(), timeout_error=RuntimeError):
+        self.lock = threading.Lock()
+        self.flights = {}
+        self.unshared = tuple(unshared)
+        self.timeout_error = timeout_error
+        self.coalesced = 0
+        """Number of calls that waited for an identical call instead of running."""
+
+    def do(self, key, function, *args, **kwargs):
+        """
+        Runs a function, or waits for the call with the same key already in flight.
+
+        :param key: Key identifying identical calls, calls with unhashable keys are not coalesced.
+        :type key: object
+        :param function: The function.
+        :type function: function
+        :param args: Arguments of the function.
+        :param timeout: Seconds to wait for the identical call in flight, forever if None.
+        :type timeout: float, optional
+        :return: The result of the function.
+        :rtype: object
+        :raises timeout_error: If the identical call in flight didn't finish in time.
+        """
+        timeout = kwargs.pop("timeout", None)
+        if kwargs:
+            raise TypeError("Unexpected arguments {0}".format(", ".join(kwargs)))
+        try:
+            hash(key)
+        except TypeError:
+            return function(*args)
+
+        with self.lock:
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            if not flight.done.wait(timeout):
+                raise self.timeout_error(
+                    "Timed out waiting for the identical call in flight"
+                )
+            if flight.error is None:
+                return flight.value
+            if not isinstance(flight.error, self.unshared):
+                raise flight.error
+            return function(*args)
+
+        try:
+            flight.value = function(*args)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.flights[key]
+            flight.done.set()
+        return flight.value
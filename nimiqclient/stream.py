@@ -0,0 +1,255 @@
+__all__ = ["iter_result", "ResultParser", "NeedMoreData", "CHUNK_SIZE"]
+
+__metaclass__ = type
+
+from .nimiq_client import InternalErrorException, RemoteErrorException
+
+import codecs
+import json
+
+CHUNK_SIZE = 65536
+"""Bytes read from the socket at a time by the streamed requests."""
+
+_WHITESPACE = " \t\n\r"
+
+
+class NeedMoreData(Exception):
+    """
+    Raised by a ResultParser fed with push when the chunks received so far don't complete the
+    next value. Nothing is consumed, the parsing is resumed once more chunks are pushed.
+
+    :param size: Number of characters not consumed yet the parser needs to continue.
+    :type size: int
+    """
+
+    def __init__(self, size):
+        super(NeedMoreData, self).__init__(size)
+        self.size = size
+
+
+class _Reader:
+    """
+    Reads JSON values from chunks of text as they arrive, only keeping the text not consumed yet.
+    The chunks are read from an iterable, or pushed with push if it is None.
+
+    :param chunks: The chunks of the body.
+    :type chunks: iterable of (bytes) or None
+    """
+
+    def __init__(self, chunks=None):
+        self.chunks = iter(chunks) if chunks is not None else None
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def push(self, chunk):
+        """
+        Adds a chunk of the body, or marks its end.
+
+        :param chunk: The chunk, or an empty bytes object at the end of the body.
+        :type chunk: bytes
+        """
+        if self.pos > 0:
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        if chunk:
+            self.buffer += self.text_decoder.decode(chunk)
+        else:
+            self.eof = True
+            self.buffer += self.text_decoder.decode(b"", True)
+
+    def available(self):
+        """
+        Get the number of characters not consumed yet.
+
+        :rtype: int
+        """
+        return len(self.buffer) - self.pos
+
+    def _fill(self, size):
+        """
+        Reads chunks until the text not consumed has at least size characters or the body ends.
+
+        :param size: Number of characters.
+        :type size: int
+        :raises NeedMoreData: If the chunks are pushed and there are not enough of them yet.
+        """
+        if self.pos > 0:
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        if self.chunks is None:
+            if len(self.buffer) < size and not self.eof:
+                raise NeedMoreData(size)
+            return
+        while len(self.buffer) < size and not self.eof:
+            self.push(next(self.chunks, b""))
+
+    def peek(self):
+        """
+        Skips the whitespace and get the next character without consuming it.
+
+        :return: The character, or an empty string at the end of the body.
+        :rtype: str
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos : self.pos + 1]
+            self._fill(1)
+
+    def expect(self, characters):
+        """
+        Consumes the next character, which must be one of the characters.
+
+        :param characters: The characters expected.
+        :type characters: str
+        :return: The character.
+        :rtype: str
+        """
+        character = self.peek()
+        if not character or character not in characters:
+            raise InternalErrorException(
+                "Invalid JSON in response, expected one of '{0}' at '{1}'".format(
+                    characters, self.buffer[self.pos : self.pos + 20]
+                )
+            )
+        self.pos += 1
+        return character
+
+    def value(self):
+        """
+        Consumes the next JSON value.
+
+        :return: The decoded value.
+        :rtype: object
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # a number at the end of the text could continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except ValueError as e:
+                if self.eof:
+                    raise InternalErrorException(
+                        "Invalid JSON in response: {0}".format(e)
+                    )
+            # doubling the text read keeps the decoding of a large value linear
+            self._fill(2 * (len(self.buffer) - self.pos) + 1)
+
+
+_END = object()
+
+
+class ResultParser:
+    """
+    Parses the array result of a JSONRPC response one element at a time. Each step only consumes
+    the text once it is complete, so with pushed chunks the parsing can be resumed after a
+    NeedMoreData::
+
+        parser = ResultParser()
+        parser.reader.push(chunk)
+        element = parser.next()
+
+    :param chunks: The chunks of the body, or None to push them to parser.reader.
+    :type chunks: iterable of (bytes), optional
+    """
+
+    def __init__(self, chunks=None):
+        self.reader = _Reader(chunks)
+        self.state = "start"
+        self.key = None
+
+    def next(self):
+        """
+        Get the next element of the result.
+
+        :return: The decoded element, or ResultParser.END at the end of the response.
+        :rtype: object
+        :raises RemoteErrorException: If the response is an error.
+        :raises InternalErrorException: If the response is invalid or its result is not an array.
+        :raises NeedMoreData: If the chunks are pushed and more of them are needed.
+        """
+        reader = self.reader
+        while True:
+            state = self.state
+            if state == "start":
+                reader.expect("{")
+                self.state = "first_key"
+            elif state == "first_key":
+                if reader.peek() == "}":
+                    reader.expect("}")
+                    self.state = "end"
+                else:
+                    self.state = "key"
+            elif state == "key":
+                self.key = reader.value()
+                self.state = "colon"
+            elif state == "colon":
+                reader.expect(":")
+                self.state = "result" if self.key == "result" else "value"
+            elif state == "result":
+                if reader.peek() == "[":
+                    reader.expect("[")
+                    self.state = "first_element"
+                else:
+                    self.state = "value"
+            elif state == "first_element":
+                if reader.peek() == "]":
+                    reader.expect("]")
+                    self.state = "after_member"
+                else:
+                    self.state = "element"
+            elif state == "element":
+                element = reader.value()
+                self.state = "after_element"
+                return element
+            elif state == "after_element":
+                if reader.expect(",]") == ",":
+                    self.state = "element"
+                else:
+                    self.state = "after_member"
+            elif state == "value":
+                value = reader.value()
+                self.state = "after_member"
+                if self.key == "error" and value is not None:
+                    raise RemoteErrorException(value.get("message"), value.get("code"))
+                if self.key == "result" and value is not None:
+                    raise InternalErrorException(
+                        "Expected an array result, got {0}".format(value)
+                    )
+            elif state == "after_member":
+                if reader.expect(",}") == ",":
+                    self.state = "key"
+                else:
+                    self.state = "end"
+            else:
+                return self.END
+
+    END = _END
+    """Returned by next at the end of the response."""
+
+
+def iter_result(chunks):
+    """
+    Iterates over the elements of the array result of a JSONRPC response, decoding them as the
+    chunks of the body arrive, so only one element is kept in memory at a time.
+
+    :param chunks: The chunks of the body of the response, like requests.Response.iter_content().
+    :type chunks: iterable of (bytes)
+    :return: Generator of the decoded elements of the result, none if the result is null.
+    :rtype: generator of (object)
+    :raises RemoteErrorException: If the response is an error.
+    :raises InternalErrorException: If the response is invalid or its result is not an array.
+    """
+    parser = ResultParser(chunks)
+    while True:
+        element = parser.next()
+        if element is ResultParser.END:
+            return
+        yield element
@@ -0,0 +1,178 @@
+__all__ = ["TransactionTable", "TRANSACTION_COLUMNS"]
+
+__metaclass__ = type
+
+from .models.block import Block, TransactionList
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+TRANSACTION_COLUMNS = [
+    ("hash", "S64", b""),
+    ("blockHash", "S64", b""),
+    ("blockNumber", "i8", -1),
+    ("timestamp", "i8", -1),
+    ("confirmations", "i8", 0),
+    ("transactionIndex", "i4", -1),
+    ("from", "S40", b""),
+    ("to", "S40", b""),
+    ("value", "i8", 0),
+    ("fee", "i8", 0),
+    ("flags", "u1", 0),
+]
+"""Name, NumPy type and value used when missing, of the columns of a TransactionTable."""
+
+
+class TransactionTable:
+    """
+    Columnar table of transactions backed by NumPy arrays, one per column in TRANSACTION_COLUMNS,
+    named as in the JSONRPC API. Hashes and addresses are stored as hex-encoded fixed-width bytes,
+    and missing numbers, like the block number of the transactions in the mempool, as -1.
+    Requires the numpy package.
+
+    The tables are filled from transaction objects or from the decoded JSON results of a client in
+    JSON response mode, without creating the transaction objects::
+
+        client = client.with_response_mode(ResponseMode.JSON)
+        table = TransactionTable.from_transactions(client.get_transactions_by_address(address))
+        print(table["value"].sum(), table.filter(table["fee"] > 0).group_sum("from", "fee"))
+
+    :param columns: Array of each column by name, all of them with the same length.
+    :type columns: dict
+    """
+
+    def __init__(self, columns):
+        if numpy is None:
+            raise ImportError(
+                "TransactionTable requires numpy, install it with 'pip install nimiqclient[numpy]'"
+            )
+        self.columns = dict(
+            (name, numpy.asarray(columns[name], dtype=dtype))
+            for name, dtype, missing in TRANSACTION_COLUMNS
+        )
+        """Array of each column by name."""
+        lengths = set(len(column) for column in self.columns.values())
+        if len(lengths) > 1:
+            raise ValueError("All the columns must have the same length")
+
+    def __len__(self):
+        return len(self.columns["hash"])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __repr__(self):
+        return "TransactionTable({0} transactions)".format(len(self))
+
+    @classmethod
+    def from_transactions(cls, transactions):
+        """
+        Creates a table from transactions.
+
+        :param transactions: Transaction objects or dictionaries containing the data, like the results of get_transactions_by_address or mempool_content(True).
+        :type transactions: iterable of (Transaction or dict)
+        :return: The table.
+        :rtype: TransactionTable
+        """
+        rows = []
+        for transaction in transactions:
+            if type(transaction) is not dict:
+                try:
+                    transaction = transaction._asdict()
+                except AttributeError:
+                    raise ValueError(
+                        "Only full transactions can be added to a table, not {0}".format(
+                            transaction
+                        )
+                    )
+            rows.append(transaction)
+        columns = {}
+        for name, dtype, missing in TRANSACTION_COLUMNS:
+            values = [row.get(name) for row in rows]
+            columns[name] = [
+                value if value is not None else missing for value in values
+            ]
+        return cls(columns)
+
+    @classmethod
+    def from_blocks(cls, blocks):
+        """
+        Creates a table from the transactions of blocks requested with their full transactions,
+        without decoding the transactions that were not accessed yet.
+
+        :param blocks: Block objects or dictionaries containing the data, like the results of iter_blocks.
+        :type blocks: iterable of (Block or dict)
+        :return: The table.
+        :rtype: TransactionTable
+        """
+
+        def transactions():
+            for block in blocks:
+                if type(block) is Block:
+                    items = block.transactions
+                    if type(items) is TransactionList:
+                        items = items.items
+                else:
+                    items = block["transactions"]
+                for transaction in items:
+                    yield transaction
+
+        return cls.from_transactions(transactions())
+
+    @classmethod
+    def concatenate(cls, tables):
+        """
+        Creates a table with the transactions of several tables.
+
+        :param tables: The tables.
+        :type tables: iterable of (TransactionTable)
+        :return: The table.
+        :rtype: TransactionTable
+        """
+        tables = list(tables)
+        if not tables:
+            return cls.from_transactions([])
+        return cls(
+            dict(
+                (name, numpy.concatenate([table.columns[name] for table in tables]))
+                for name, dtype, missing in TRANSACTION_COLUMNS
+            )
+        )
+
+    def filter(self, mask):
+        """
+        Get the transactions selected by a mask.
+
+        :param mask: Boolean array with the length of the table, or array of indices.
+        :type mask: numpy.ndarray
+        :return: A new table with the selected transactions.
+        :rtype: TransactionTable
+        """
+        return TransactionTable(
+            dict((name, column[mask]) for name, column in self.columns.items())
+        )
+
+    def group_sum(self, key, column):
+        """
+        Sums a column by the distinct values of another column.
+
+        :param key: Name of the column to group by.
+        :type key: str
+        :param column: Name of the column to sum.
+        :type column: str
+        :return: The distinct values of the key in ascending order, and the sum of each of them.
+        :rtype: tuple of (numpy.ndarray, numpy.ndarray)
+        """
+        keys = self.columns[key]
+        values = self.columns[column]
+        if values.dtype.kind in "iub":
+            # the sums of small integers like the flags could overflow their type
+            values = values.astype(numpy.int64)
+        if len(keys) == 0:
+            return keys, values
+        order = numpy.argsort(keys, kind="mergesort")
+        keys = keys[order]
+        starts = numpy.flatnonzero(numpy.concatenate(([True], keys[1:] != keys[:-1])))
+        return keys[starts], numpy.add.reduceat(values[order], starts)
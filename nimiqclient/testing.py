@@ -0,0 +1,433 @@
+"""
+Local stand-in for a Nimiq node, serving JSONRPC requests over HTTP from a synthetic chain, to
+test and benchmark the clients without a live node::
+
+    python -m nimiqclient.testing --port 8648 --height 100000 --transactions 10 --latency 0.005
+"""
+
+__all__ = ["StandInNode", "StandInServer"]
+
+__metaclass__ = type
+
+from .compact import to_user_friendly_address
+from .recording import Cassette, ReplaySession
+
+import argparse
+import binascii
+import json
+import random
+import sys
+import threading
+import time
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+
+class StandInNode:
+    """
+    Answers JSONRPC requests, single or batched, like a Nimiq node. The blocks and their
+    transactions are generated from their height, so chains of any height use no memory, and the
+    mempool holds the transactions of the next block. The other methods are answered with the
+    results in fixtures.
+
+    :param height: Height of the chain.
+    :type height: int, optional
+    :param transactions: Number of transactions of each block.
+    :type transactions: int, optional
+    :param accounts: Number of accounts sending and receiving the transactions.
+    :type accounts: int, optional
+    :param latency: Seconds waited before answering each HTTP request.
+    :type latency: float, optional
+    :param error_rate: Fraction of the HTTP requests answered with a 500 status code and no body.
+    :type error_rate: float, optional
+    :param replay: Session answering the requests with the responses recorded in a cassette instead.
+    :type replay: ReplaySession, optional
+    :param fixtures: Result of each JSONRPC method not answered from the chain, or a function of its params returning it.
+    :type fixtures: dict, optional
+    """
+
+    def __init__(
+        self,
+        height=1000,
+        transactions=0,
+        accounts=100,
+        latency=0,
+        error_rate=0,
+        replay=None,
+        fixtures=None,
+    ):
+        self.height = height
+        self.transactions = transactions
+        self.accounts = accounts
+        self.latency = latency
+        self.error_rate = error_rate
+        self.replay = replay
+        self.fixtures = fixtures if fixtures is not None else {}
+        self.lock = threading.Lock()
+        self.requests = 0
+        """Number of HTTP requests received."""
+        self.calls = 0
+        """Number of JSONRPC requests received, counting each request of a batch."""
+        self.addresses = ["{0:040x}".format(index + 1) for index in range(accounts)]
+        self.friendly_addresses = [
+            to_user_friendly_address(binascii.unhexlify(address))
+            for address in self.addresses
+        ]
+
+    def block_hash(self, number):
+        return "{0:064x}".format(number)
+
+    def transaction(self, number, index, include_transactions):
+        """
+        Get a transaction of the chain, or of the mempool if number is the height of the next block.
+
+        :param number: Height of the block.
+        :type number: int
+        :param index: Index of the transaction in the block.
+        :type index: int
+        :param include_transactions: If False only the hash of the transaction is returned.
+        :type include_transactions: bool
+        :return: The transaction or its hash.
+        :rtype: dict or str
+        """
+        hash = "{0:032x}{1:032x}".format(number, index)
+        if not include_transactions:
+            return hash
+        sender = (number + index) % self.accounts
+        recipient = (sender + 1) % self.accounts
+        if number > self.height:
+            return {
+                "hash": hash,
+                "from": self.addresses[sender],
+                "fromAddress": self.friendly_addresses[sender],
+                "to": self.addresses[recipient],
+                "toAddress": self.friendly_addresses[recipient],
+                "value": 100000 + number,
+                "fee": index % 2 * 138,
+                "data": None,
+                "flags": 0,
+            }
+        return {
+            "hash": hash,
+            "blockHash": self.block_hash(number),
+            "blockNumber": number,
+            "timestamp": 1523412456 + number * 60,
+            "confirmations": self.height - number + 1,
+            "transactionIndex": index,
+            "from": self.addresses[sender],
+            "fromAddress": self.friendly_addresses[sender],
+            "to": self.addresses[recipient],
+            "toAddress": self.friendly_addresses[recipient],
+            "value": 100000 + number,
+            "fee": index % 2 * 138,
+            "data": None,
+            "flags": 0,
+        }
+
+    def block(self, number, include_transactions=False):
+        """
+        Get a block of the chain.
+
+        :param number: Height of the block.
+        :type number: int
+        :param include_transactions: If True the block includes the full transaction objects.
+        :type include_transactions: bool, optional
+        :return: The block, None if it's not in the chain.
+        :rtype: dict or None
+        """
+        if type(number) is not int or not 1 <= number <= self.height:
+            return None
+        return {
+            "number": number,
+            "hash": self.block_hash(number),
+            "pow": "00" * 32,
+            "parentHash": self.block_hash(number - 1),
+            "nonce": 0,
+            "bodyHash": "00" * 32,
+            "accountsHash": "00" * 32,
+            "difficulty": "1",
+            "timestamp": 1523412456 + number * 60,
+            "confirmations": self.height - number + 1,
+            "miner": self.addresses[number % self.accounts],
+            "minerAddress": self.friendly_addresses[number % self.accounts],
+            "extraData": "",
+            "size": 200 + 138 * self.transactions,
+            "transactions": [
+                self.transaction(number, index, include_transactions)
+                for index in range(self.transactions)
+            ],
+        }
+
+    def block_by_hash(self, hash, include_transactions=False):
+        try:
+            number = int(hash, 16)
+        except (TypeError, ValueError):
+            return None
+        return self.block(number, include_transactions)
+
+    def transaction_by_hash(self, hash):
+        try:
+            number, index = int(hash[:32], 16), int(hash[32:], 16)
+        except (TypeError, ValueError):
+            return None
+        return self.transaction_by_number(number, index)
+
+    def transaction_by_number(self, number, index):
+        if type(number) is not int or not 1 <= number <= self.height:
+            return None
+        if type(index) is not int or not 0 <= index < self.transactions:
+            return None
+        return self.transaction(number, index, True)
+
+    def transactions_by_address(self, address, limit=1000):
+        """
+        Get the latest transactions of the chain sent from or to an address.
+
+        :param address: The address, user friendly or hex encoded.
+        :type address: str
+        :param limit: Maximum number of transactions.
+        :type limit: int, optional
+        :return: The transactions, latest first.
+        :rtype: list of (dict)
+        """
+        if address in self.friendly_addresses:
+            account = self.friendly_addresses.index(address)
+        elif address in self.addresses:
+            account = self.addresses.index(address)
+        else:
+            return []
+        result = []
+        for number in range(self.height, 0, -1):
+            for index in range(self.transactions - 1, -1, -1):
+                sender = (number + index) % self.accounts
+                if account in (sender, (sender + 1) % self.accounts):
+                    if len(result) == limit:
+                        return result
+                    result.append(self.transaction(number, index, True))
+        return result
+
+    def answer(self, request):
+        """
+        Answers a JSONRPC request object.
+
+        :param request: The JSONRPC request object.
+        :type request: dict
+        :return: The JSONRPC response object.
+        :rtype: dict
+        """
+        method, params = request.get("method"), request.get("params") or []
+        if method == "blockNumber":
+            result = self.height
+        elif method == "getBlockByNumber":
+            result = self.block(*params[:2])
+        elif method == "getBlockByHash":
+            result = self.block_by_hash(*params[:2])
+        elif method in (
+            "getBlockTransactionCountByNumber",
+            "getBlockTransactionCountByHash",
+        ):
+            block = (
+                self.block(*params[:1])
+                if method.endswith("Number")
+                else self.block_by_hash(*params[:1])
+            )
+            result = len(block["transactions"]) if block is not None else None
+        elif method == "getTransactionByHash":
+            result = self.transaction_by_hash(*params[:1])
+        elif method == "getTransactionByBlockHashAndIndex":
+            block = self.block_by_hash(*params[:1])
+            result = (
+                self.transaction_by_number(block["number"], *params[1:2])
+                if block is not None
+                else None
+            )
+        elif method == "getTransactionByBlockNumberAndIndex":
+            result = self.transaction_by_number(*params[:2])
+        elif method == "getTransactionsByAddress":
+            result = self.transactions_by_address(*params[:2])
+        elif method == "mempoolContent":
+            include_transactions = bool(params and params[0])
+            result = [
+                self.transaction(self.height + 1, index, include_transactions)
+                for index in range(self.transactions)
+            ]
+        elif method in self.fixtures:
+            result = self.fixtures[method]
+            if callable(result):
+                result = result(params)
+        else:
+            return {
+                "jsonrpc": "2.0",
+                "error": {"code": -32601, "message": "Method not found"},
+                "id": request.get("id"),
+            }
+        return {"jsonrpc": "2.0", "result": result, "id": request.get("id")}
+
+    def handle(self, body):
+        """
+        Answers the body of an HTTP request.
+
+        :param body: The body of the request.
+        :type body: bytes
+        :return: The status code and the body of the response.
+        :rtype: tuple of (int, bytes)
+        """
+        with self.lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if self.error_rate and random.random() < self.error_rate:
+            return 500, b""
+        if self.replay is not None:
+            return self.replay.answer(body)
+        try:
+            request = json.loads(body.decode("utf-8"))
+        except ValueError:
+            response = {
+                "jsonrpc": "2.0",
+                "error": {"code": -32700, "message": "Parse error"},
+                "id": None,
+            }
+        else:
+            if type(request) is list:
+                with self.lock:
+                    self.calls += len(request)
+                response = [self.answer(r) for r in request]
+            else:
+                with self.lock:
+                    self.calls += 1
+                response = self.answer(request)
+        return 200, json.dumps(response).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # keeps the connections open, as a node does
+    protocol_version = "HTTP/1.1"
+    # the headers and the body are sent separately, Nagle's algorithm would delay the body
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        status, content = self.server.node.handle(body)
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+        except (IOError, OSError):
+            # the client gave up waiting, like after a timeout
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _HTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class StandInServer:
+    """
+    HTTP server answering JSONRPC requests with a StandInNode, in a background thread::
+
+        with StandInServer(height=10000, transactions=5) as server:
+            client = NimiqClient(port=server.port)
+
+    :param node: The node answering the requests, created with the keyword arguments if None.
+    :type node: StandInNode, optional
+    :param host: Host IP address.
+    :type host: str, optional
+    :param port: Port, a free one is chosen if 0.
+    :type port: int, optional
+    """
+
+    def __init__(self, node=None, host="127.0.0.1", port=0, **kwargs):
+        self.node = node if node is not None else StandInNode(**kwargs)
+        self.server = _HTTPServer((host, port), _Handler)
+        self.server.node = self.node
+        self.thread = None
+
+    @property
+    def port(self):
+        """Port the server is listening on."""
+        return self.server.server_address[1]
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,))
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="host IP address")
+    parser.add_argument(
+        "--port", type=int, default=8648, help="port, a free one is chosen if 0"
+    )
+    parser.add_argument("--height", type=int, default=1000, help="height of the chain")
+    parser.add_argument(
+        "--transactions", type=int, default=0, help="transactions per block"
+    )
+    parser.add_argument(
+        "--accounts", type=int, default=100, help="accounts of the transactions"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0, help="seconds before each answer"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0, help="fraction of requests failed"
+    )
+    parser.add_argument(
+        "--cassette", help="answer with the responses recorded in a cassette"
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="speed of the recorded responses, 0 answers immediately",
+    )
+    args = parser.parse_args()
+
+    replay = None
+    if args.cassette:
+        replay = ReplaySession(Cassette.load(args.cassette), speed=args.speed or None)
+    server = StandInServer(
+        host=args.host,
+        port=args.port,
+        height=args.height,
+        transactions=args.transactions,
+        accounts=args.accounts,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        replay=replay,
+    )
+    print("Serving on http://{0}:{1}".format(args.host, server.port))
+    sys.stdout.flush()
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
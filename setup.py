@@ -16,6 +16,12 @@ setup(
     packages=["nimiqclient", "nimiqclient.models"],
     zip_safe=True,
     install_requires=["requests", "enum34"],
+    extras_require={
+        "async": ["aiohttp"],
+        "numpy": ["numpy"],
+        "arrow": ["pyarrow"],
+        "opentelemetry": ["opentelemetry-api"],
+    },
     python_requires=">=2.4",
     test_suite="test",
 )
@@ -1 +1,14 @@
 from .test_nimiq_client import *
+from .test_codec import *
+from .test_chain_follower import *
+from .test_balanced_nimiq_client import *
+from .test_retry import *
+from .test_metrics import *
+from .test_hooks import *
+from .test_stream import *
+from .test_compact import *
+from .test_recording import *
+from .test_server import *
+from .test_table import *
+from .test_export import *
+from .test_async_nimiq_client import *
@@ -0,0 +1,342 @@
+from nimiqclient import *
+from .fixtures.account import *
+from .fixtures.block import *
+from .fixtures.mempool import *
+from .fixtures.peer import *
+from .fixtures.transaction import *
+from .async_session_stub import AsyncSessionStub, AsyncChainSessionStub
+from .session_stub import SessionStub
+from nimiqclient.testing import StandInServer
+
+import asyncio
+import inspect
+import unittest
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class TestAsyncNimiqClientMethods(unittest.TestCase):
+    client = None
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.client = AsyncNimiqClient(
+            scheme="http", user="", password="", host="127.0.0.1", port=8648
+        )
+        self.client.session = AsyncSessionStub()
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.client.close())
+        self.loop.close()
+
+    def run_async(self, awaitable):
+        return self.loop.run_until_complete(awaitable)
+
+    def test_methodParity(self):
+        for name, method in inspect.getmembers(NimiqClient, inspect.isfunction):
+            if not name.startswith("_"):
+                self.assertTrue(hasattr(self.client, name), name)
+
+    def test_blockNumber(self):
+        SessionStub.test_data = BlockFixtures.block_number()
+
+        result = self.run_async(self.client.block_number())
+
+        self.assertEqual("blockNumber", SessionStub.latest_request_method)
+
+        self.assertEqual(748883, result)
+
+    def test_getBlockByNumberWithTransactions(self):
+        SessionStub.test_data = BlockFixtures.get_block_with_transactions()
+
+        result = self.run_async(self.client.get_block_by_number(11608, True))
+
+        self.assertEqual("getBlockByNumber", SessionStub.latest_request_method)
+        self.assertEqual(11608, SessionStub.latest_request_params[0])
+        self.assertEqual(True, SessionStub.latest_request_params[1])
+
+        self.assertTrue(isinstance(result, Block))
+        self.assertEqual(11608, result.number)
+        self.assertEqual(2, len(result.transactions))
+        self.assertTrue(isinstance(result.transactions[0], Transaction))
+
+    def test_getTransactionReceipt(self):
+        SessionStub.test_data = TransactionFixtures.get_transaction_receipt_found()
+
+        result = self.run_async(
+            self.client.get_transaction_receipt(
+                "fd8e46ae55c5b8cd7cb086cf8d6c81f941a516d6148021d55f912fb2ca75cc8e"
+            )
+        )
+
+        self.assertEqual("getTransactionReceipt", SessionStub.latest_request_method)
+
+        self.assertTrue(isinstance(result, TransactionReceipt))
+        self.assertEqual(
+            "fd8e46ae55c5b8cd7cb086cf8d6c81f941a516d6148021d55f912fb2ca75cc8e",
+            result.transactionHash,
+        )
+
+    def test_mempoolContentFullTransactions(self):
+        SessionStub.test_data = MemPoolFixtures.mempool_content_full_transactions()
+
+        result = self.run_async(self.client.mempool_content(True))
+
+        self.assertEqual("mempoolContent", SessionStub.latest_request_method)
+        self.assertEqual(True, SessionStub.latest_request_params[0])
+
+        self.assertEqual(3, len(result))
+        self.assertTrue(isinstance(result[0], Transaction))
+
+    def test_getAccountForVestingContract(self):
+        SessionStub.test_data = AccountFixtures.get_account_vesting()
+
+        result = self.run_async(
+            self.client.get_account("NQ09 VF5Y 1PKV MRM4 5LE1 55KV P6R2 GXYJ XYQF")
+        )
+
+        self.assertTrue(isinstance(result, VestingContract))
+
+    def test_peerError(self):
+        SessionStub.test_data = PeerFixtures.peer_state_error()
+
+        self.assertRaises(
+            RemoteErrorException, self.run_async, self.client.peer_state("unknown")
+        )
+
+    def test_concurrentRequests(self):
+        SessionStub.test_data = BlockFixtures.block_number()
+
+        async def gather():
+            return await asyncio.gather(
+                *[self.client.block_number() for i in range(10)]
+            )
+
+        self.assertEqual([748883] * 10, self.run_async(gather()))
+        self.assertEqual(10, self.client.id)
+
+    def test_batch(self):
+        balance = AccountFixtures.get_balance()
+        balance["id"] = 1
+        error = PeerFixtures.peer_state_error()
+        error["id"] = 2
+        SessionStub.test_data = [error, balance]
+
+        async def send():
+            async with self.client.batch() as batch:
+                entries = [batch.get_balance("NQ46"), batch.peer_state("unknown")]
+            return entries
+
+        entries = self.run_async(send())
+
+        self.assertEqual(2, len(SessionStub.latest_request))
+        self.assertEqual(1200000, entries[0].result())
+        self.assertRaises(RemoteErrorException, entries[1].result)
+
+    def test_iterBlocks(self):
+        self.client.session = AsyncChainSessionStub(95)
+
+        async def collect():
+            numbers = []
+            async for block in self.client.iter_blocks(3, batch_size=10, prefetch=3):
+                numbers.append(block.number)
+            return numbers
+
+        self.assertEqual(list(range(3, 96)), self.run_async(collect()))
+
+    def test_timeout(self):
+        SessionStub.test_data = BlockFixtures.block_number()
+        self.client.timeout = 2.5
+
+        self.run_async(self.client.block_number())
+
+        self.assertEqual(2.5, SessionStub.latest_request_timeout.total)
+
+    def test_deadline(self):
+        SessionStub.test_data = BlockFixtures.block_number()
+        self.client.timeout = 2.5
+
+        async def request():
+            with self.client.deadline(1):
+                await asyncio.gather(self.client.block_number())
+                timeout = SessionStub.latest_request_timeout.total
+                with self.client.deadline(-1):
+                    with self.assertRaises(TimeoutException):
+                        await self.client.block_number()
+            return timeout
+
+        timeout = self.run_async(request())
+
+        self.assertTrue(0 < timeout <= 1)
+        self.assertIsNone(self.client._get_deadline())
+
+    def test_coalesce(self):
+        client = AsyncNimiqClient(coalesce=True)
+        client.session = AsyncChainSessionStub(10)
+        client.session.delay = 0.05
+
+        async def request():
+            return await asyncio.gather(
+                *[client.get_block_by_number(5) for i in range(5)]
+            )
+
+        blocks = self.run_async(request())
+
+        self.assertEqual(1, client.session.requests)
+        self.assertEqual(4, client.single_flight.coalesced)
+        self.assertTrue(all(block is blocks[0] for block in blocks))
+        self.assertEqual({}, client.flights)
+
+    def test_coalesceDeadline(self):
+        client = AsyncNimiqClient(coalesce=True)
+        client.session = AsyncChainSessionStub(10)
+        client.session.delay = 0.3
+
+        async def follow():
+            await asyncio.sleep(0.05)
+            with client.deadline(0.1):
+                with self.assertRaises(TimeoutException):
+                    await client.get_block_by_number(5)
+            return self.loop.time()
+
+        async def request():
+            start = self.loop.time()
+            block, stopped = await asyncio.gather(
+                client.get_block_by_number(5), follow()
+            )
+            return block, stopped - start
+
+        block, elapsed = self.run_async(request())
+
+        # the waiting request stops at its own deadline, the one in flight goes on
+        self.assertEqual(5, block.number)
+        self.assertTrue(elapsed < 0.25)
+        self.assertEqual(1, client.session.requests)
+        self.run_async(client.close())
+
+    def test_responseModeJson(self):
+        SessionStub.test_data = BlockFixtures.get_block_with_transactions()
+        client = self.client.with_response_mode(ResponseMode.JSON)
+
+        result = self.run_async(client.get_block_by_number(11608, True))
+
+        self.assertEqual(BlockFixtures.get_block_with_transactions()["result"], result)
+
+    def collect(self, iterator):
+        async def collect():
+            return [element async for element in iterator]
+
+        return self.run_async(collect())
+
+    def test_iterMempoolContent(self):
+        SessionStub.test_data = MemPoolFixtures.mempool_content_full_transactions()
+
+        result = self.collect(self.client.iter_mempool_content(True))
+
+        self.assertEqual("mempoolContent", SessionStub.latest_request_method)
+        self.assertEqual([True], SessionStub.latest_request_params)
+        self.assertEqual(
+            [
+                tx["hash"]
+                for tx in MemPoolFixtures.mempool_content_full_transactions()["result"]
+            ],
+            [tx.hash for tx in result],
+        )
+
+    def test_iterTransactionsByAddress(self):
+        SessionStub.test_data = TransactionFixtures.get_transactions_found()
+
+        result = self.collect(
+            self.client.with_response_mode(
+                ResponseMode.JSON
+            ).iter_transactions_by_address(
+                "NQ05 9VGU 0TYE NXBH MVLR E4JY UG6N 5701 MX9F", 3
+            )
+        )
+
+        self.assertEqual(
+            ["NQ05 9VGU 0TYE NXBH MVLR E4JY UG6N 5701 MX9F", 3],
+            SessionStub.latest_request_params,
+        )
+        self.assertEqual(TransactionFixtures.get_transactions_found()["result"], result)
+
+    def test_iterTransactionsByAddressError(self):
+        SessionStub.test_data = {
+            "jsonrpc": "2.0",
+            "error": {"code": -32602, "message": "Invalid address"},
+            "id": 1,
+        }
+        breaker = CircuitBreaker(failure_threshold=1)
+        self.client.circuit_breaker = breaker
+
+        self.assertRaises(
+            RemoteErrorException,
+            self.collect,
+            self.client.iter_transactions_by_address("invalid"),
+        )
+        # the server answered, so the circuit stays closed
+        self.assertTrue(breaker.allow())
+
+    def test_circuitBreakerCancelled(self):
+        SessionStub.test_data = MemPoolFixtures.mempool_content_hashes_only()
+        self.client.session.delay = 1
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        self.client.circuit_breaker = breaker
+
+        async def cancel(awaitable):
+            task = asyncio.ensure_future(awaitable)
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        # the trial request of the half open circuit is released by the cancelled requests
+        self.run_async(cancel(self.client.mempool_content()))
+        self.assertTrue(breaker.available)
+        self.run_async(cancel(self.client.iter_mempool_content().__anext__()))
+        self.assertTrue(breaker.available)
+        self.assertEqual(CircuitState.HALF_OPEN, breaker.state)
+
+    def test_iterMempoolContentClose(self):
+        SessionStub.test_data = MemPoolFixtures.mempool_content_hashes_only()
+        iterator = self.client.iter_mempool_content()
+
+        first = self.run_async(iterator.__anext__())
+        iterator.close()
+
+        self.assertEqual(
+            MemPoolFixtures.mempool_content_hashes_only()["result"][0], first
+        )
+        self.assertTrue(iterator.response.closed)
+        self.assertEqual([], self.collect(iterator))
+
+    def test_iterStandInServer(self):
+        async def transactions(port):
+            async with AsyncNimiqClient(port=port) as client:
+                return [tx async for tx in client.iter_mempool_content(True)]
+
+        with StandInServer(transactions=3) as server:
+            transactions = self.run_async(transactions(server.port))
+
+        self.assertEqual(3, len(transactions))
+
+    def test_standInServer(self):
+        async def blocks(port):
+            async with AsyncNimiqClient(port=port) as client:
+                return await asyncio.gather(
+                    *[client.get_block_by_number(n, True) for n in range(1, 11)]
+                )
+
+        with StandInServer(height=50, transactions=3) as server:
+            blocks = self.run_async(blocks(server.port))
+
+        self.assertEqual(list(range(1, 11)), [block.number for block in blocks])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+from .session_stub import SessionStub, ChainSessionStub
+
+import asyncio
+
+
+class AsyncSessionStub(SessionStub):
+    delay = 0
+
+    def post(self, url, data, headers, timeout=None):
+        SessionStub.post(self, url, data, None, timeout)
+        return AsyncResponseStub(self, self.delay)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def read(self):
+        return self.content
+
+    async def close(self):
+        pass
+
+
+class AsyncStreamReaderStub:
+    """
+    Returns the body of a response in chunks of at most chunk_size bytes, like aiohttp.StreamReader.
+    """
+
+    chunk_size = 7
+
+    def __init__(self, response, delay=0):
+        self.response = response
+        self.delay = delay
+        self.body = None
+
+    async def read(self, n=-1):
+        if self.body is None:
+            await asyncio.sleep(self.delay)
+            self.body = self.response.content
+        size = min(n, self.chunk_size) if n >= 0 else len(self.body)
+        chunk, self.body = self.body[:size], self.body[size:]
+        return chunk
+
+
+class AsyncResponseStub:
+    def __init__(self, response, delay):
+        self.response = response
+        self.delay = delay
+        self.content = AsyncStreamReaderStub(response, delay)
+        self.closed = False
+
+    def __await__(self):
+        return self.__aenter__().__await__()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def read(self):
+        await asyncio.sleep(self.delay)
+        return self.response.content
+
+    def close(self):
+        self.closed = True
+
+
+class AsyncChainSessionStub(ChainSessionStub):
+    delay = 0
+
+    def post(self, url, data, headers, timeout=None):
+        response = ChainSessionStub.post(self, url, data, None, timeout)
+        return AsyncResponseStub(response, self.delay)
+
+    async def close(self):
+        pass
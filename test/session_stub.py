@@ -1,14 +1,185 @@
+import json
+import requests
+import time
+
+
 class SessionStub:
+    status_code = 200
     test_data = None
     latest_request = None
     latest_request_method = None
     latest_request_params = None
+    latest_request_timeout = None
 
-    def post(self, url, json, auth):
-        SessionStub.latest_request = json
-        SessionStub.latest_request_method = json.get("method")
-        SessionStub.latest_request_params = json.get("params")
+    def post(self, url, data, auth, timeout=None, stream=False):
+        SessionStub.latest_request = json.loads(data)
+        SessionStub.latest_request_timeout = timeout
+        if type(SessionStub.latest_request) is dict:
+            SessionStub.latest_request_method = SessionStub.latest_request.get("method")
+            SessionStub.latest_request_params = SessionStub.latest_request.get("params")
         return self
 
-    def json(self):
-        return SessionStub.test_data
+    @property
+    def content(self):
+        return json.dumps(SessionStub.test_data).encode("utf-8")
+
+    def iter_content(self, chunk_size=1):
+        content = self.content
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
+    def close(self):
+        pass
+
+
+class ResponseStub:
+    status_code = 200
+
+    def __init__(self, response):
+        self.content = json.dumps(response).encode("utf-8")
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+    def close(self):
+        pass
+
+
+class ChainSessionStub:
+    """
+    Answers blockNumber, getBlockByNumber and getBlockByHash requests, single or batched, from a generated chain.
+    """
+
+    def __init__(self, height):
+        self.blocks = {}
+        self.requests = 0
+        self.grow(height)
+
+    @property
+    def height(self):
+        return len(self.blocks)
+
+    def grow(self, height, fork=0):
+        while self.height < height:
+            number = self.height + 1
+            parent = self.blocks.get(number - 1)
+            self.blocks[number] = {
+                "number": number,
+                "hash": "{0:02x}{1:062x}".format(fork, number),
+                "pow": "00" * 32,
+                "parentHash": parent["hash"] if parent is not None else "00" * 32,
+                "nonce": 0,
+                "bodyHash": "00" * 32,
+                "accountsHash": "00" * 32,
+                "difficulty": "1",
+                "timestamp": 1523412456 + number * 60,
+                "miner": "00" * 20,
+                "minerAddress": "NQ07 0000 0000 0000 0000 0000 0000 0000 0000",
+                "extraData": "",
+                "size": 200,
+                "transactions": [],
+            }
+
+    def reorg(self, height, new_height, fork):
+        for number in range(height + 1, self.height + 1):
+            del self.blocks[number]
+        self.grow(new_height, fork)
+
+    def answer(self, request):
+        method, params = request.get("method"), request.get("params")
+        if method == "blockNumber":
+            result = self.height
+        elif method == "getBlockByNumber":
+            result = self.blocks.get(params[0])
+        elif method == "getBlockByHash":
+            matches = [b for b in self.blocks.values() if b["hash"] == params[0]]
+            result = matches[0] if matches else None
+        else:
+            return {
+                "jsonrpc": "2.0",
+                "error": {"code": -32601, "message": "Method not found"},
+                "id": request.get("id"),
+            }
+        if result is not None and type(result) is dict:
+            result = dict(result, confirmations=self.height - result["number"])
+        return {"jsonrpc": "2.0", "result": result, "id": request.get("id")}
+
+    def post(self, url, data, auth, timeout=None, stream=False):
+        request = json.loads(data)
+        self.requests += 1
+        if type(request) is list:
+            return ResponseStub([self.answer(r) for r in request])
+        return ResponseStub(self.answer(request))
+
+
+class TimeoutSessionStub:
+    """
+    Fails all the requests with a timeout.
+    """
+
+    def post(self, url, data, auth, timeout=None, stream=False):
+        raise requests.exceptions.ReadTimeout("Read timed out")
+
+
+class FlakySessionStub:
+    """
+    Fails the first requests with a connection error, and answers the following ones with the result.
+    """
+
+    def __init__(self, failures, result=None):
+        self.failures = failures
+        self.result = result
+        self.requests = []
+
+    def post(self, url, data, auth, timeout=None, stream=False):
+        request = json.loads(data)
+        self.requests.append(request)
+        if len(self.requests) <= self.failures:
+            raise requests.exceptions.ConnectionError("Connection reset by peer")
+        if type(request) is list:
+            return ResponseStub(
+                [
+                    {"jsonrpc": "2.0", "result": self.result, "id": r["id"]}
+                    for r in request
+                ]
+            )
+        return ResponseStub(
+            {"jsonrpc": "2.0", "result": self.result, "id": request["id"]}
+        )
+
+
+class EndpointsSessionStub:
+    """
+    Answers the requests sent to several servers with the results by URL and method,
+    after the delay in seconds by URL if any, or times out if the delay is longer than the timeout.
+    """
+
+    def __init__(self, results):
+        self.results = results
+        self.delays = {}
+        self.requests = dict((url, []) for url in results)
+        self.timeouts = dict((url, []) for url in results)
+
+    def answer(self, url, request):
+        results = self.results[url]
+        if results is None:
+            raise IOError("Connection refused")
+        return {
+            "jsonrpc": "2.0",
+            "result": results.get(request.get("method")),
+            "id": request.get("id"),
+        }
+
+    def post(self, url, data, auth, timeout=None, stream=False):
+        request = json.loads(data)
+        self.requests[url].append(request)
+        self.timeouts[url].append(timeout)
+        delay = self.delays.get(url, 0)
+        if type(timeout) in (int, float) and delay > timeout:
+            time.sleep(timeout)
+            raise requests.exceptions.Timeout("Read timed out")
+        time.sleep(delay)
+        if type(request) is list:
+            return ResponseStub([self.answer(url, r) for r in request])
+        return ResponseStub(self.answer(url, request))
@@ -0,0 +1,5 @@
+import sys
+
+# the tests use the async syntax of Python 3.5, they are kept in a module only imported there
+if sys.version_info >= (3, 5):
+    from .async_nimiq_client_tests import *
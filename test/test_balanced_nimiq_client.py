@@ -0,0 +1,224 @@
+from nimiqclient import *
+from .session_stub import EndpointsSessionStub
+
+import threading
+import time
+import unittest
+
+
+class TestBalancedNimiqClient(unittest.TestCase):
+    def setUp(self):
+        self.endpoints = [Endpoint(host="10.0.0.{0}".format(i)) for i in range(1, 4)]
+        self.writer = Endpoint(host="10.0.0.10")
+        self.client = BalancedNimiqClient(self.endpoints, write_endpoints=[self.writer])
+        self.session = EndpointsSessionStub(
+            dict(
+                (endpoint.url, {"consensus": "established", "blockNumber": 100})
+                for endpoint in self.endpoints + [self.writer]
+            )
+        )
+        self.client.session = self.session
+
+    def test_leastOutstanding(self):
+        self.endpoints[0].start()
+        self.endpoints[1].latency = 0.5
+        self.endpoints[2].latency = 0.1
+
+        self.client.block_number()
+
+        self.assertEqual(1, len(self.session.requests[self.endpoints[2].url]))
+        self.assertEqual(1, self.endpoints[0].outstanding)
+        self.assertEqual(0, self.endpoints[2].outstanding)
+        self.assertTrue(self.endpoints[2].latency < 0.1)
+
+    def test_ewma(self):
+        self.client.strategy = BalancingStrategy.EWMA
+        self.endpoints[0].latency = 0.01
+        self.endpoints[0].outstanding = 5
+        self.endpoints[1].latency = 0.02
+        self.endpoints[2].latency = 0.2
+
+        self.client.block_number()
+
+        self.assertEqual(1, len(self.session.requests[self.endpoints[1].url]))
+
+    def test_writeEndpoints(self):
+        self.client.send_raw_transaction("00")
+        self.client.block_number()
+
+        self.assertEqual(1, len(self.session.requests[self.writer.url]))
+        self.assertEqual(
+            "sendRawTransaction", self.session.requests[self.writer.url][0]["method"]
+        )
+
+    def test_spreadReads(self):
+        chosen = []
+        for i in range(3):
+            endpoint = self.client._choose_endpoint({"method": "blockNumber"})
+            endpoint.start()
+            chosen.append(endpoint)
+
+        self.assertEqual(set(self.endpoints), set(chosen))
+
+    def test_checkHealth(self):
+        self.session.results[self.endpoints[0].url]["consensus"] = "syncing"
+        self.session.results[self.endpoints[1].url]["blockNumber"] = 90
+        self.session.results[self.writer.url]["blockNumber"] = 50
+        self.session.results[self.writer.url]["sendRawTransaction"] = "00"
+
+        healthy = self.client.check_health()
+
+        self.assertEqual([self.endpoints[2]], healthy)
+        self.assertFalse(self.endpoints[1].healthy)
+        self.assertFalse(self.writer.healthy)
+        self.assertEqual(90, self.endpoints[1].block_number)
+        self.assertEqual(ConsensusState.SYNCING, self.endpoints[0].consensus)
+
+        for i in range(3):
+            self.client.block_number()
+        self.assertEqual(4, len(self.session.requests[self.endpoints[2].url]))
+
+        # requests still go to an unhealthy endpoint if all of them are unhealthy
+        self.assertEqual("00", self.client.send_raw_transaction("00"))
+
+    def test_unreachableEndpoint(self):
+        self.session.results[self.endpoints[1].url] = None
+
+        self.client.check_health()
+
+        self.assertFalse(self.endpoints[1].healthy)
+        self.assertEqual(None, self.endpoints[1].consensus)
+        self.assertEqual(0, self.endpoints[1].outstanding)
+        self.assertTrue(self.endpoints[0].healthy)
+
+    def test_retryOtherEndpoint(self):
+        self.client.retry_policy = RetryPolicy(max_attempts=3, backoff=0, jitter=False)
+        self.session.results[self.endpoints[0].url] = None
+
+        self.assertEqual(100, self.client.block_number())
+
+        self.assertEqual(
+            [1, 1, 0], [len(self.session.requests[e.url]) for e in self.endpoints]
+        )
+
+    def test_retryAllEndpointsFailed(self):
+        self.client.retry_policy = RetryPolicy(max_attempts=4, backoff=0, jitter=False)
+        for endpoint in self.endpoints:
+            self.session.results[endpoint.url] = None
+
+        self.assertRaises(InternalErrorException, self.client.block_number)
+
+        # each endpoint is tried once before any of them is tried again
+        self.assertEqual(
+            [2, 1, 1], [len(self.session.requests[e.url]) for e in self.endpoints]
+        )
+
+    def test_streamBalanced(self):
+        for endpoint in self.endpoints:
+            endpoint.circuit_breaker = CircuitBreaker(failure_threshold=1)
+            self.session.results[endpoint.url]["mempoolContent"] = ["aa", "bb"]
+        self.endpoints[0].start()
+        self.endpoints[2].healthy = False
+
+        self.assertEqual(["aa", "bb"], list(self.client.iter_mempool_content()))
+        self.assertEqual(1, len(self.session.requests[self.endpoints[1].url]))
+        self.assertEqual(0, self.endpoints[1].outstanding)
+
+        # the failure opens the circuit of the endpoint used
+        self.session.results[self.endpoints[1].url] = None
+        self.assertRaises(
+            InternalErrorException, list, self.client.iter_mempool_content()
+        )
+        self.assertEqual(CircuitState.OPEN, self.endpoints[1].circuit_breaker.state)
+        self.assertEqual(CircuitState.CLOSED, self.endpoints[0].circuit_breaker.state)
+
+    def test_healthCheckInterval(self):
+        self.client.health_check_interval = 0
+        self.session.results[self.endpoints[0].url]["consensus"] = "connecting"
+
+        self.client.block_number()
+        thread = self.client.health_check_thread
+        self.assertIsNotNone(thread)
+        thread.join()
+
+        self.assertFalse(self.endpoints[0].healthy)
+        self.assertTrue(self.endpoints[1].healthy)
+
+    def test_healthCheckBackground(self):
+        self.client.health_check_interval = 0
+        release = threading.Event()
+        post = self.session.post
+
+        def hang(url, data, auth, timeout=None, stream=False):
+            if url == self.endpoints[0].url and b"consensus" in data:
+                release.wait(5)
+            return post(url, data, auth, timeout, stream)
+
+        self.session.post = hang
+        start = time.time()
+        self.client.block_number()
+        self.client.block_number()
+
+        # the requests don't wait for the hung node, and a single check runs
+        self.assertTrue(time.time() - start < 1)
+        thread = self.client.health_check_thread
+        self.assertTrue(thread.is_alive())
+        release.set()
+        thread.join()
+        self.assertEqual(
+            1,
+            sum(type(r) is list for r in self.session.requests[self.endpoints[1].url]),
+        )
+
+    def test_timeout(self):
+        self.client.timeout = 3
+        self.client.health_check_timeout = 2
+        self.client.block_number()
+        self.client.check_health()
+
+        timeouts = [
+            timeout
+            for endpoint in self.endpoints
+            for timeout in self.session.timeouts[endpoint.url]
+        ]
+        self.assertEqual([3, 2, 2, 2], timeouts)
+
+    def test_hedgedRequest(self):
+        self.client.hedge_percentile = 0.95
+        for i, endpoint in enumerate(self.endpoints):
+            endpoint.latency = 0.001 * (i + 1)
+            endpoint.latencies.extend([0.01] * 10)
+        self.session.delays[self.endpoints[0].url] = 1.0
+
+        start = time.time()
+        self.assertEqual(100, self.client.block_number())
+
+        self.assertTrue(time.time() - start < 0.5)
+        self.assertEqual(1, len(self.session.requests[self.endpoints[0].url]))
+        self.assertEqual(1, len(self.session.requests[self.endpoints[1].url]))
+
+    def test_hedgeNotNeeded(self):
+        self.client.hedge_percentile = 0.95
+        for endpoint in self.endpoints:
+            endpoint.latencies.extend([1.0] * 10)
+
+        self.client.block_number()
+
+        requests = [len(self.session.requests[e.url]) for e in self.endpoints]
+        self.assertEqual(1, sum(requests))
+
+    def test_percentile(self):
+        endpoint = Endpoint()
+        for i in range(9):
+            endpoint.start()
+            endpoint.finish(i * 0.1)
+        self.assertEqual(None, endpoint.percentile(0.95))
+
+        endpoint.start()
+        endpoint.finish(0.9)
+        self.assertAlmostEqual(0.9, endpoint.percentile(0.95))
+        self.assertAlmostEqual(0.5, endpoint.percentile(0.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
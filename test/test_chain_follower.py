@@ -0,0 +1,105 @@
+from nimiqclient import *
+from .session_stub import ChainSessionStub
+
+import unittest
+
+
+class TestChainFollower(unittest.TestCase):
+    def setUp(self):
+        self.client = NimiqClient()
+        self.client.session = ChainSessionStub(10)
+
+    def events(self, follower):
+        return [(str(event.type), event.block.number) for event in follower.poll()]
+
+    def test_connectFromStart(self):
+        follower = ChainFollower(self.client, start=3)
+
+        self.assertEqual(
+            [("connected", number) for number in range(3, 11)], self.events(follower)
+        )
+        self.assertEqual(10, follower.tip.number)
+        self.assertEqual([], self.events(follower))
+
+    def test_connectFromLatest(self):
+        follower = ChainFollower(self.client)
+
+        self.assertEqual([("connected", 10)], self.events(follower))
+
+        self.client.session.grow(13)
+
+        self.assertEqual(
+            [("connected", 11), ("connected", 12), ("connected", 13)],
+            self.events(follower),
+        )
+
+    def test_catchUpInBatches(self):
+        follower = ChainFollower(self.client, batch_size=20)
+        self.events(follower)
+        self.client.session.grow(110)
+        self.client.session.requests = 0
+
+        events = self.events(follower)
+
+        self.assertEqual(list(range(11, 111)), [number for type, number in events])
+        self.assertEqual(110, follower.tip.number)
+        self.assertTrue(self.client.session.requests <= 7)
+
+    def test_reorg(self):
+        follower = ChainFollower(self.client, start=1)
+        self.events(follower)
+
+        self.client.session.reorg(7, 12, fork=1)
+
+        self.assertEqual(
+            [
+                ("disconnected", 10),
+                ("disconnected", 9),
+                ("disconnected", 8),
+                ("connected", 8),
+                ("connected", 9),
+                ("connected", 10),
+                ("connected", 11),
+                ("connected", 12),
+            ],
+            self.events(follower),
+        )
+        self.assertEqual(self.client.session.blocks[12]["hash"], follower.tip.hash)
+
+    def test_reorgSameHeight(self):
+        follower = ChainFollower(self.client, start=1)
+        self.events(follower)
+
+        self.client.session.reorg(9, 10, fork=1)
+
+        self.assertEqual(
+            [("disconnected", 10), ("connected", 10)], self.events(follower)
+        )
+
+    def test_reorgToShorterChain(self):
+        follower = ChainFollower(self.client, start=1)
+        self.events(follower)
+
+        self.client.session.reorg(6, 8, fork=1)
+
+        self.assertEqual(
+            [
+                ("disconnected", 10),
+                ("disconnected", 9),
+                ("disconnected", 8),
+                ("disconnected", 7),
+                ("connected", 7),
+                ("connected", 8),
+            ],
+            self.events(follower),
+        )
+
+    def test_window(self):
+        follower = ChainFollower(self.client, start=1, window=5)
+        self.events(follower)
+
+        self.assertEqual([6, 7, 8, 9, 10], [block.number for block in follower.blocks])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+from nimiqclient import *
+from .fixtures.block import *
+from .fixtures.mempool import *
+from .session_stub import SessionStub
+
+import unittest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class TestCodecs(unittest.TestCase):
+    def assertRoundTrip(self, codec):
+        transaction = OutgoingTransaction(
+            from_="NQ39 NY67 X0F0 UTQE 0YER 4JEU B67L UPP8 G0FM",
+            to="NQ16 61ET MB3M 2JG6 TBLK BR0D B6EA X6XQ L91U",
+            value=100000,
+            fee=1,
+        )
+        data = codec.dumps({"params": [transaction, LogLevel.VERBOSE]})
+
+        self.assertTrue(isinstance(data, bytes))
+        params = codec.loads(data)["params"]
+        self.assertEqual(
+            "NQ39 NY67 X0F0 UTQE 0YER 4JEU B67L UPP8 G0FM", params[0]["from"]
+        )
+        self.assertEqual(AccountType.BASIC, params[0]["fromType"])
+        self.assertEqual("verbose", params[1])
+
+        response = MemPoolFixtures.mempool_content_full_transactions()
+        self.assertEqual(response, codec.loads(JSONCodec().dumps(response)))
+
+    def test_jsonCodec(self):
+        self.assertRoundTrip(JSONCodec())
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjsonCodec(self):
+        self.assertRoundTrip(OrjsonCodec())
+
+    @unittest.skipIf(ujson is None, "ujson is not installed")
+    def test_ujsonCodec(self):
+        self.assertRoundTrip(UjsonCodec())
+
+    def test_clientCodec(self):
+        codec = JSONCodec()
+        client = NimiqClient(codec=codec)
+        client.session = SessionStub()
+        SessionStub.test_data = BlockFixtures.get_block_with_transactions()
+
+        result = client.get_block_by_number(11608, True)
+
+        self.assertTrue(client.codec is codec)
+        self.assertEqual(11608, result.number)
+        self.assertEqual(2, len(result.transactions))
+
+    def test_defaultCodec(self):
+        codec = default_codec()
+
+        if orjson is not None:
+            self.assertEqual("orjson", codec.name)
+        elif ujson is not None:
+            self.assertEqual("ujson", codec.name)
+        else:
+            self.assertEqual("json", codec.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
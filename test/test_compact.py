@@ -0,0 +1,88 @@
+from nimiqclient import *
+from .fixtures import *
+
+import binascii
+import json
+import unittest
+
+
+class TestCompact(unittest.TestCase):
+    def test_userFriendlyAddress(self):
+        for tx in TransactionFixtures.get_transactions_found()["result"]:
+            self.assertEqual(
+                tx["fromAddress"],
+                to_user_friendly_address(binascii.unhexlify(tx["from"])),
+            )
+            self.assertEqual(
+                tx["toAddress"], to_user_friendly_address(binascii.unhexlify(tx["to"]))
+            )
+
+    def test_transactionFromDict(self):
+        data = TransactionFixtures.get_transaction_full()["result"]
+
+        tx = CompactTransaction.from_dict(data)
+
+        self.assertEqual(32, len(tx.hash))
+        self.assertEqual(data["hash"], binascii.hexlify(tx.hash).decode("ascii"))
+        self.assertEqual(20, len(getattr(tx, "from")))
+        self.assertEqual(data["fromAddress"], tx.fromAddress)
+        self.assertEqual(data["toAddress"], tx.toAddress)
+        self.assertEqual(data["value"], tx.value)
+        self.assertEqual(
+            data, dict((k, v) for k, v in tx._asdict().items() if k in data)
+        )
+
+    def test_transactionFromTransaction(self):
+        data = TransactionFixtures.get_transaction_full()["result"]
+
+        tx = CompactTransaction.from_dict(Transaction.from_dict(data))
+
+        self.assertEqual(
+            Transaction.from_dict(data)._asdict(),
+            Transaction.from_dict(tx._asdict())._asdict(),
+        )
+        self.assertEqual(tx._asdict(), json.loads(repr(tx)))
+
+    def test_internPool(self):
+        pool = InternPool()
+        data = TransactionFixtures.get_transactions_found()["result"]
+
+        transactions = [CompactTransaction.from_dict(tx, pool) for tx in data]
+
+        self.assertTrue(transactions[0].from_ is transactions[1].from_)
+        self.assertTrue(transactions[0].to is transactions[2].to)
+        self.assertEqual(
+            len(set(tx["from"] for tx in data) | set(tx["to"] for tx in data))
+            + len(set(tx["blockHash"] for tx in data)),
+            len(pool),
+        )
+
+    def test_blockFromDict(self):
+        pool = InternPool()
+        data = BlockFixtures.get_block_with_transactions()["result"]
+
+        block = CompactBlock.from_dict(data, pool)
+
+        self.assertEqual(data["number"], block.number)
+        self.assertEqual(32, len(block.hash))
+        self.assertEqual(data["minerAddress"], block.minerAddress)
+        self.assertEqual(2, len(block.transactions))
+        self.assertTrue(block.transactions[0].blockHash is block.hash)
+        self.assertEqual(
+            data["transactions"][1]["fromAddress"], block.transactions[1].fromAddress
+        )
+        result = block._asdict()
+        for tx in result["transactions"]:
+            del tx["valid"], tx["inMempool"]
+        self.assertEqual(data, result)
+
+    def test_blockFromBlock(self):
+        data = BlockFixtures.get_block_found()["result"]
+
+        block = CompactBlock.from_dict(Block(**data))
+
+        self.assertEqual(
+            data["transactions"],
+            [binascii.hexlify(tx).decode("ascii") for tx in block.transactions],
+        )
+        self.assertEqual(data["parentHash"], block._asdict()["parentHash"])
@@ -0,0 +1,122 @@
+from nimiqclient import *
+from .fixtures import *
+from .session_stub import ChainSessionStub
+
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+@unittest.skipIf(pyarrow is None, "requires pyarrow")
+class TestChainExporter(unittest.TestCase):
+    def setUp(self):
+        self.client = NimiqClient()
+        self.client.session = ChainSessionStub(25)
+        transactions = BlockFixtures.get_block_with_transactions()["result"][
+            "transactions"
+        ]
+        self.client.session.blocks[3]["transactions"] = transactions
+        self.directory = tempfile.mkdtemp()
+        self.exporter = ChainExporter(
+            self.client, self.directory, chunk_size=10, batch_size=4
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read(self, table):
+        directory = os.path.join(self.directory, table)
+        return [
+            pyarrow.parquet.read_table(os.path.join(directory, name))
+            for name in sorted(os.listdir(directory))
+        ]
+
+    def test_recordBatches(self):
+        batches = list(self.exporter.record_batches(1, 10))
+
+        self.assertEqual([4, 4, 1], [blocks.num_rows for blocks, txs in batches])
+        self.assertEqual([2, 0, 0], [txs.num_rows for blocks, txs in batches])
+        blocks, transactions = batches[0]
+        self.assertEqual(self.exporter.block_schema, blocks.schema)
+        self.assertEqual(
+            [name for name, alias in ARROW_BLOCK_COLUMNS], blocks.schema.names
+        )
+        self.assertEqual([1, 2, 3, 4], blocks.column(0).to_pylist())
+        self.assertEqual(
+            [0, 0, 2, 0],
+            blocks.column(blocks.schema.names.index("transactionCount")).to_pylist(),
+        )
+        self.assertEqual(
+            [
+                "355b4fe2304a9c818b9f0c3c1aaaf4ad4f6a0279",
+                "0e229e99c9af35f040fc38aa5f722a78ce88c15b",
+            ],
+            transactions.column(transactions.schema.names.index("from")).to_pylist(),
+        )
+        self.assertEqual(
+            [None, None],
+            transactions.column(transactions.schema.names.index("data")).to_pylist(),
+        )
+
+    def test_export(self):
+        self.assertEqual([0, 10, 20], self.exporter.export(1))
+
+        blocks = self.read("blocks")
+        self.assertEqual([9, 10, 6], [table.num_rows for table in blocks])
+        self.assertEqual(list(range(20, 26)), blocks[2].column("number").to_pylist())
+        transactions = self.read("transactions")
+        self.assertEqual([2, 0, 0], [table.num_rows for table in transactions])
+        self.assertEqual(
+            [2636710000, 2860228000], transactions[0].column("value").to_pylist()
+        )
+        self.assertFalse(
+            any(name.endswith(".tmp") for name in os.listdir(self.directory))
+        )
+
+    def test_resume(self):
+        self.assertEqual([0, 10, 20], self.exporter.export(1))
+        requests = self.client.session.requests
+
+        self.assertEqual([], self.exporter.export(1))
+        # only the latest block number was requested
+        self.assertEqual(requests + 1, self.client.session.requests)
+
+        self.client.session.grow(32)
+
+        # the last chunk is completed and the next one started
+        self.assertEqual([20, 30], self.exporter.export(1))
+        self.assertEqual(
+            [9, 10, 10, 3], [table.num_rows for table in self.read("blocks")]
+        )
+
+    def test_resumeNextHeight(self):
+        self.assertEqual([0, 10, 20], self.exporter.export(1))
+        self.client.session.grow(45)
+
+        # the blocks after the previous tip are added to its chunk
+        self.assertEqual([20, 30, 40], self.exporter.export(26))
+        blocks = self.read("blocks")
+        self.assertEqual(list(range(20, 30)), blocks[2].column("number").to_pylist())
+        self.assertEqual([9, 10, 10, 10, 6], [table.num_rows for table in blocks])
+
+    def test_exportRange(self):
+        self.assertEqual([10], self.exporter.export(12, 18))
+
+        self.assertEqual(
+            list(range(12, 18)), self.read("blocks")[0].column("number").to_pylist()
+        )
+        # the chunk is completed by an export starting lower
+        self.assertEqual([10], self.exporter.export(10, 20))
+        self.assertEqual(10, self.read("blocks")[0].num_rows)
+
+    def test_exportPastTip(self):
+        self.assertEqual([20], self.exporter.export(20, 40))
+
+        self.assertEqual([6], [table.num_rows for table in self.read("blocks")])
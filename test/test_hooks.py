@@ -0,0 +1,291 @@
+from nimiqclient import *
+from .fixtures import *
+from .session_stub import (
+    SessionStub,
+    ChainSessionStub,
+    EndpointsSessionStub,
+    TimeoutSessionStub,
+    FlakySessionStub,
+)
+
+import threading
+import unittest
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+    from opentelemetry.trace import SpanKind, StatusCode, use_span
+except ImportError:
+    TracerProvider = None
+
+
+class RecordingHooks(RequestHooks):
+    def __init__(self):
+        self.events = []
+
+    def before_request(self, trace):
+        self.events.append(("before", trace.method, trace.duration))
+        trace.context = len(self.events)
+
+    def after_request(self, trace):
+        self.events.append(("after", trace.method, trace.context))
+        self.trace = trace
+
+
+class ContextHooks(RequestHooks):
+    def __init__(self):
+        self.local = threading.local()
+        self.local.context = "caller"
+        self.contexts = []
+
+    def capture_context(self):
+        return getattr(self.local, "context", None)
+
+    def attach_context(self, context):
+        previous = getattr(self.local, "context", None)
+        self.local.context = context
+        return previous
+
+    def detach_context(self, token):
+        self.local.context = token
+
+    def before_request(self, trace):
+        self.contexts.append(getattr(self.local, "context", None))
+
+
+class TestRequestHooks(unittest.TestCase):
+    def setUp(self):
+        self.hooks = RecordingHooks()
+        self.client = NimiqClient(hooks=self.hooks)
+        self.client.session = SessionStub()
+
+    def otel_client(self):
+        self.exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        client = NimiqClient(hooks=OpenTelemetryHooks(provider.get_tracer("test")))
+        client.session = SessionStub()
+        return client
+
+    def test_hooks(self):
+        SessionStub.test_data = BlockFixtures.get_block_found()
+
+        self.client.get_block_by_number(1)
+
+        self.assertEqual(
+            [
+                ("before", "getBlockByNumber", None),
+                ("after", "getBlockByNumber", 1),
+            ],
+            self.hooks.events,
+        )
+        trace = self.hooks.trace
+        self.assertEqual(SessionStub.latest_request["id"], trace.id)
+        self.assertEqual("http://127.0.0.1:8648", trace.url)
+        self.assertEqual(200, trace.status)
+        self.assertEqual(None, trace.error)
+        self.assertEqual(len(SessionStub().content), trace.response_size)
+        self.assertEqual(
+            len(self.client.codec.dumps(SessionStub.latest_request)),
+            trace.request_size,
+        )
+        self.assertTrue(trace.start > 0)
+        self.assertTrue(0 <= trace.network <= trace.duration)
+        self.assertTrue(0 <= trace.decode <= trace.duration)
+
+    def test_hooksRemoteError(self):
+        SessionStub.test_data = {
+            "jsonrpc": "2.0",
+            "error": {"code": -32602, "message": "Invalid address"},
+            "id": 1,
+        }
+
+        self.assertRaises(RemoteErrorException, self.client.get_account, "invalid")
+
+        self.assertEqual(-32602, self.hooks.trace.error)
+
+    def test_hooksStream(self):
+        SessionStub.test_data = MemPoolFixtures.mempool_content_full_transactions()
+
+        list(self.client.iter_mempool_content(True))
+
+        self.assertEqual(
+            [
+                ("before", "mempoolContent", None),
+                ("after", "mempoolContent", 1),
+            ],
+            self.hooks.events,
+        )
+        trace = self.hooks.trace
+        self.assertEqual(200, trace.status)
+        self.assertEqual(None, trace.error)
+        self.assertEqual(len(SessionStub().content), trace.response_size)
+        self.assertTrue(0 <= trace.network <= trace.duration)
+
+    def test_hooksStreamRemoteError(self):
+        SessionStub.test_data = {
+            "jsonrpc": "2.0",
+            "error": {"code": -32602, "message": "Invalid params"},
+            "id": 1,
+        }
+
+        self.assertRaises(
+            RemoteErrorException, list, self.client.iter_mempool_content(True)
+        )
+
+        self.assertEqual(2, len(self.hooks.events))
+        self.assertEqual(-32602, self.hooks.trace.error)
+
+    def test_hooksTimeout(self):
+        self.client.session = TimeoutSessionStub()
+
+        self.assertRaises(TimeoutException, self.client.block_number)
+
+        self.assertEqual("timeout", self.hooks.trace.error)
+        self.assertEqual(None, self.hooks.trace.status)
+
+    def test_hooksRetries(self):
+        self.client.retry_policy = RetryPolicy(backoff=0, jitter=False)
+        self.client.session = FlakySessionStub(2, 100)
+
+        self.assertEqual(100, self.client.block_number())
+
+        # each attempt is traced
+        self.assertEqual(6, len(self.hooks.events))
+        self.assertEqual(None, self.hooks.trace.error)
+
+    def test_hooksCached(self):
+        SessionStub.test_data = BlockFixtures.get_block_found()
+        self.client.cache = ImmutableCache(10)
+        hash = BlockFixtures.get_block_found()["result"]["hash"]
+
+        self.client.get_block_by_hash(hash)
+        self.client.get_block_by_hash(hash)
+
+        self.assertEqual(2, len(self.hooks.events))
+
+    def test_hooksBatch(self):
+        self.client.session = ChainSessionStub(10)
+
+        with self.client.batch() as batch:
+            batch.block_number()
+            batch.get_block_by_number(3)
+            batch.get_block_by_hash("invalid")
+
+        trace = self.hooks.trace
+        self.assertEqual("batch", trace.method)
+        self.assertEqual(None, trace.id)
+        self.assertEqual(
+            ["blockNumber", "getBlockByNumber", "getBlockByHash"],
+            [call.method for call in trace.calls],
+        )
+        self.assertEqual(3, len(set(call.id for call in trace.calls)))
+        self.assertEqual(2, len(self.hooks.events))
+
+    def test_hooksCircuitOpen(self):
+        self.client.circuit_breaker = CircuitBreaker(failure_threshold=1)
+        self.client.session = TimeoutSessionStub()
+        self.assertRaises(TimeoutException, self.client.block_number)
+
+        self.assertRaises(CircuitOpenException, self.client.block_number)
+
+        self.assertEqual(4, len(self.hooks.events))
+        trace = self.hooks.trace
+        self.assertEqual("circuit_open", trace.error)
+        self.assertEqual(None, trace.request_size)
+        self.assertEqual(0, trace.duration)
+
+    def test_hooksContext(self):
+        hooks = ContextHooks()
+        client = NimiqClient(hooks=hooks)
+        client.session = ChainSessionStub(20)
+
+        blocks = list(client.iter_blocks(1, 21, batch_size=5))
+
+        self.assertEqual(20, len(blocks))
+        # the batches sent by the pool threads get the context of the caller
+        self.assertEqual(["caller"] * 4, hooks.contexts)
+
+    def test_hooksContextHedged(self):
+        hooks = ContextHooks()
+        endpoints = [Endpoint(host="10.0.0.1"), Endpoint(host="10.0.0.2")]
+        client = BalancedNimiqClient(endpoints, hedge_percentile=0.95, hooks=hooks)
+        client.session = EndpointsSessionStub(
+            dict((endpoint.url, {"blockNumber": 100}) for endpoint in endpoints)
+        )
+
+        self.assertEqual(100, client.block_number())
+
+        self.assertEqual(["caller"], hooks.contexts)
+
+    @unittest.skipIf(TracerProvider is None, "requires opentelemetry-sdk")
+    def test_openTelemetryContext(self):
+        client = self.otel_client()
+        client.session = ChainSessionStub(20)
+        tracer = client.hooks.tracer
+
+        with tracer.start_as_current_span("app") as span:
+            blocks = list(client.iter_blocks(1, 21, batch_size=5))
+
+        self.assertEqual(20, len(blocks))
+        batches = [s for s in self.exporter.get_finished_spans() if s.name == "batch"]
+        self.assertEqual(4, len(batches))
+        for batch in batches:
+            self.assertEqual(span.get_span_context().span_id, batch.parent.span_id)
+            self.assertEqual(span.get_span_context().trace_id, batch.context.trace_id)
+
+    @unittest.skipIf(TracerProvider is None, "requires opentelemetry-sdk")
+    def test_openTelemetry(self):
+        client = self.otel_client()
+        SessionStub.test_data = BlockFixtures.block_number()
+
+        client.block_number()
+
+        (span,) = self.exporter.get_finished_spans()
+        self.assertEqual("blockNumber", span.name)
+        self.assertEqual(SpanKind.CLIENT, span.kind)
+        self.assertEqual("jsonrpc", span.attributes["rpc.system"])
+        self.assertEqual("blockNumber", span.attributes["rpc.method"])
+        self.assertEqual(
+            str(SessionStub.latest_request["id"]),
+            span.attributes["rpc.jsonrpc.request_id"],
+        )
+        self.assertEqual("http://127.0.0.1:8648", span.attributes["url.full"])
+        self.assertEqual(200, span.attributes["http.response.status_code"])
+        self.assertEqual(StatusCode.UNSET, span.status.status_code)
+        self.assertTrue(span.start_time <= span.end_time)
+
+    @unittest.skipIf(TracerProvider is None, "requires opentelemetry-sdk")
+    def test_openTelemetryError(self):
+        client = self.otel_client()
+        SessionStub.test_data = {
+            "jsonrpc": "2.0",
+            "error": {"code": -32601, "message": "Method not found"},
+            "id": 1,
+        }
+
+        self.assertRaises(RemoteErrorException, client.block_number)
+
+        (span,) = self.exporter.get_finished_spans()
+        self.assertEqual(StatusCode.ERROR, span.status.status_code)
+        self.assertEqual(-32601, span.attributes["rpc.jsonrpc.error_code"])
+
+    @unittest.skipIf(TracerProvider is None, "requires opentelemetry-sdk")
+    def test_openTelemetryBatch(self):
+        client = self.otel_client()
+        client.session = ChainSessionStub(10)
+
+        blocks = list(client.iter_blocks(1, 4, batch_size=3))
+
+        self.assertEqual(3, len(blocks))
+        spans = self.exporter.get_finished_spans()
+        parent = spans[-1]
+        self.assertEqual("batch", parent.name)
+        self.assertEqual(4, len(spans))
+        for child in spans[:-1]:
+            self.assertEqual("getBlockByNumber", child.name)
+            self.assertEqual(parent.context.span_id, child.parent.span_id)
+            self.assertEqual(parent.context.trace_id, child.context.trace_id)
@@ -0,0 +1,178 @@
+from nimiqclient import *
+from .fixtures import *
+from .session_stub import (
+    SessionStub,
+    ChainSessionStub,
+    TimeoutSessionStub,
+    FlakySessionStub,
+)
+
+import json
+import unittest
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.samples = []
+        self.client = NimiqClient(metrics=self.samples.append)
+        self.client.session = SessionStub()
+
+    def test_sample(self):
+        SessionStub.test_data = BlockFixtures.get_block_found()
+
+        self.client.get_block_by_number(1)
+
+        self.assertEqual(1, len(self.samples))
+        sample = self.samples[0]
+        self.assertEqual("getBlockByNumber", sample.method)
+        self.assertEqual(len(SessionStub().content), sample.size)
+        self.assertEqual(None, sample.error)
+        for phase in ("network", "decode", "model"):
+            self.assertTrue(0 <= getattr(sample, phase) <= sample.total)
+        self.assertEqual(None, getattr(self.client.local, "sample"))
+
+    def test_sampleJsonMode(self):
+        SessionStub.test_data = BlockFixtures.get_block_found()
+
+        self.client.with_response_mode(ResponseMode.JSON).get_block_by_number(1)
+
+        self.assertEqual(None, self.samples[0].model)
+        self.assertTrue(self.samples[0].network is not None)
+
+    def test_sampleCached(self):
+        SessionStub.test_data = BlockFixtures.get_block_found()
+        self.client.cache = ImmutableCache(10)
+        hash = BlockFixtures.get_block_found()["result"]["hash"]
+
+        self.client.get_block_by_hash(hash)
+        self.client.get_block_by_hash(hash)
+
+        self.assertEqual(2, len(self.samples))
+        self.assertEqual(None, self.samples[1].network)
+        self.assertEqual(None, self.samples[1].size)
+        self.assertTrue(self.samples[1].model is not None)
+
+    def test_sampleRemoteError(self):
+        SessionStub.test_data = {
+            "jsonrpc": "2.0",
+            "error": {"code": -32602, "message": "Invalid address"},
+            "id": 1,
+        }
+
+        self.assertRaises(RemoteErrorException, self.client.get_account, "invalid")
+
+        self.assertEqual(-32602, self.samples[0].error)
+        self.assertEqual(None, self.samples[0].model)
+
+    def test_sampleTimeout(self):
+        self.client.session = TimeoutSessionStub()
+
+        self.assertRaises(TimeoutException, self.client.block_number)
+
+        self.assertEqual("timeout", self.samples[0].error)
+        self.assertTrue(self.samples[0].network is not None)
+
+    def test_sampleRetries(self):
+        self.client.retry_policy = RetryPolicy(backoff=0, jitter=False)
+        self.client.session = FlakySessionStub(2, 100)
+
+        self.assertEqual(100, self.client.block_number())
+
+        # the attempts are measured as a single request
+        self.assertEqual(1, len(self.samples))
+        self.assertEqual(None, self.samples[0].error)
+
+    def test_sampleBatch(self):
+        self.client.session = ChainSessionStub(10)
+
+        blocks = list(self.client.iter_blocks(1, 11, batch_size=5))
+
+        self.assertEqual(10, len(blocks))
+        self.assertEqual(["batch", "batch"], [s.method for s in self.samples])
+        self.assertTrue(all(s.size > 0 for s in self.samples))
+
+    def test_sampleStream(self):
+        SessionStub.test_data = MemPoolFixtures.mempool_content_full_transactions()
+
+        transactions = list(self.client.iter_mempool_content(True))
+
+        self.assertEqual(1, len(self.samples))
+        sample = self.samples[0]
+        self.assertEqual("mempoolContent", sample.method)
+        self.assertEqual(len(SessionStub().content), sample.size)
+        self.assertEqual(None, sample.error)
+        for phase in ("network", "decode", "model"):
+            self.assertTrue(0 <= getattr(sample, phase) <= sample.total)
+
+    def test_sampleStreamError(self):
+        SessionStub.test_data = {
+            "jsonrpc": "2.0",
+            "error": {"code": -32602, "message": "Invalid address"},
+            "id": 1,
+        }
+
+        self.assertRaises(
+            RemoteErrorException, list, self.client.iter_transactions_by_address("x")
+        )
+
+        self.assertEqual(-32602, self.samples[0].error)
+
+    def test_disabled(self):
+        client = NimiqClient()
+        client.session = SessionStub()
+        SessionStub.test_data = BlockFixtures.block_number()
+
+        client.block_number()
+
+        self.assertEqual(None, client.metrics)
+        self.assertFalse(hasattr(client.local, "sample"))
+
+    def test_prometheus(self):
+        metrics = PrometheusMetrics(latency_buckets=(0.5, 1), size_buckets=(100,))
+        client = NimiqClient(metrics=metrics)
+        client.session = SessionStub()
+        SessionStub.test_data = BlockFixtures.block_number()
+        client.block_number()
+        client.block_number()
+        SessionStub.test_data = {
+            "jsonrpc": "2.0",
+            "error": {"code": -32601, "message": "Method not found"},
+            "id": 1,
+        }
+        self.assertRaises(RemoteErrorException, client.block_number)
+
+        text = metrics.render()
+
+        lines = text.splitlines()
+        self.assertIn("# TYPE nimiq_client_requests_total counter", lines)
+        self.assertIn('nimiq_client_requests_total{method="blockNumber"} 3', lines)
+        self.assertIn(
+            'nimiq_client_errors_total{method="blockNumber",code="-32601"} 1', lines
+        )
+        self.assertIn(
+            'nimiq_client_request_duration_seconds_bucket{method="blockNumber",phase="network",le="0.5"} 3',
+            lines,
+        )
+        self.assertIn(
+            'nimiq_client_request_duration_seconds_count{method="blockNumber",phase="total"} 3',
+            lines,
+        )
+        self.assertIn(
+            'nimiq_client_response_size_bytes_bucket{method="blockNumber",le="100"} 3',
+            lines,
+        )
+        self.assertIn(
+            'nimiq_client_response_size_bytes_bucket{method="blockNumber",le="+Inf"} 3',
+            lines,
+        )
+        self.assertTrue(text.endswith("\n"))
+
+    def test_histogram(self):
+        histogram = Histogram((1, 10))
+
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+
+        self.assertEqual([2, 1], histogram.counts)
+        self.assertEqual(4, histogram.count)
+        self.assertEqual(56.5, histogram.sum)
@@ -6,8 +6,18 @@ from .fixtures.miner import *
 from .fixtures.node import *
 from .fixtures.peer import *
 from .fixtures.transaction import *
-from .session_stub import SessionStub
-
+from .session_stub import (
+    SessionStub,
+    ChainSessionStub,
+    TimeoutSessionStub,
+    EndpointsSessionStub,
+)
+
+import copy
+import json
+import pickle
+import threading
+import time
 import unittest
 
 
@@ -207,7 +217,7 @@ class TestNimiqClientMethods(unittest.TestCase):
 
         param = SessionStub.latest_request_params[0]
         self.assertEqual(
-            param.__dict__,
+            param,
             {
                 "from": "NQ39 NY67 X0F0 UTQE 0YER 4JEU B67L UPP8 G0FM",
                 "fromType": AccountType.BASIC,
@@ -243,7 +253,7 @@ class TestNimiqClientMethods(unittest.TestCase):
 
         param = SessionStub.latest_request_params[0]
         self.assertEqual(
-            param.__dict__,
+            param,
             {
                 "from": "NQ39 NY67 X0F0 UTQE 0YER 4JEU B67L UPP8 G0FM",
                 "fromType": AccountType.BASIC,
@@ -603,6 +613,78 @@ class TestNimiqClientMethods(unittest.TestCase):
             result[2].hash,
         )
 
+    def test_iterMempoolContent(self):
+        SessionStub.test_data = MemPoolFixtures.mempool_content_full_transactions()
+
+        result = self.client.iter_mempool_content(True)
+
+        # nothing is sent until the first transaction is requested
+        self.assertEqual(
+            "5bb722c2afe25c18ba33d453b3ac2c90ac278c595cc92f6188c8b699e8fb006a",
+            next(result).hash,
+        )
+        self.assertEqual("mempoolContent", SessionStub.latest_request_method)
+        self.assertEqual(True, SessionStub.latest_request_params[0])
+        self.assertEqual(
+            [
+                "f59a30e0a7e3348ef569225db1f4c29026aeac4350f8c6e751f669eddce0c718",
+                "9cd9c1d0ffcaebfcfe86bc2ae73b4e82a488de99c8e3faef92b05432bb94519c",
+            ],
+            [tx.hash for tx in result],
+        )
+
+    def test_iterMempoolContentHashesOnly(self):
+        SessionStub.test_data = MemPoolFixtures.mempool_content_hashes_only()
+
+        result = list(self.client.iter_mempool_content())
+
+        self.assertEqual(0, len(SessionStub.latest_request_params))
+        self.assertEqual(
+            MemPoolFixtures.mempool_content_hashes_only()["result"], result
+        )
+
+    def test_iterTransactionsByAddress(self):
+        SessionStub.test_data = TransactionFixtures.get_transactions_found()
+
+        result = list(
+            self.client.with_response_mode(
+                ResponseMode.JSON
+            ).iter_transactions_by_address(
+                "NQ05 9VGU 0TYE NXBH MVLR E4JY UG6N 5701 MX9F", 3
+            )
+        )
+
+        self.assertEqual("getTransactionsByAddress", SessionStub.latest_request_method)
+        self.assertEqual(
+            ["NQ05 9VGU 0TYE NXBH MVLR E4JY UG6N 5701 MX9F", 3],
+            SessionStub.latest_request_params,
+        )
+        self.assertEqual(TransactionFixtures.get_transactions_found()["result"], result)
+
+    def test_iterTransactionsByAddressError(self):
+        SessionStub.test_data = {
+            "jsonrpc": "2.0",
+            "error": {"code": -32602, "message": "Invalid address"},
+            "id": 1,
+        }
+        breaker = CircuitBreaker(failure_threshold=1)
+        self.client.circuit_breaker = breaker
+
+        self.assertRaises(
+            RemoteErrorException,
+            list,
+            self.client.iter_transactions_by_address("invalid"),
+        )
+        # the server answered, so the circuit stays closed
+        self.assertEqual(CircuitState.CLOSED, breaker.state)
+
+    def test_iterMempoolContentTimeout(self):
+        self.client.session = TimeoutSessionStub()
+
+        self.assertRaises(
+            TimeoutException, list, self.client.iter_mempool_content(True)
+        )
+
     def test_mempoolWhenFull(self):
         SessionStub.test_data = MemPoolFixtures.mempool()
 
@@ -1237,6 +1319,518 @@ class TestNimiqClientMethods(unittest.TestCase):
 
         self.assertEqual(True, result)
 
+    def test_batch(self):
+        balance = AccountFixtures.get_balance()
+        balance["id"] = 1
+        error = PeerFixtures.peer_state_error()
+        error["id"] = 2
+        block = BlockFixtures.get_block_found()
+        block["id"] = 3
+        SessionStub.test_data = [block, error, balance]
+
+        with self.client.batch() as batch:
+            balance_entry = batch.get_balance(
+                "NQ46 NTNU QX94 MVD0 BBT0 GXAR QUHK VGNF 39ET"
+            )
+            peer_entry = batch.peer_state("unknown")
+            block_entry = batch.get_block_by_number(11608)
+
+        self.assertEqual(3, len(SessionStub.latest_request))
+        self.assertEqual(
+            ["getBalance", "peerState", "getBlockByNumber"],
+            [call_object["method"] for call_object in SessionStub.latest_request],
+        )
+        self.assertEqual(
+            [1, 2, 3], [call_object["id"] for call_object in SessionStub.latest_request]
+        )
+
+        self.assertEqual(1200000, balance_entry.result())
+        self.assertRaises(RemoteErrorException, peer_entry.result)
+        self.assertTrue(isinstance(peer_entry.error, RemoteErrorException))
+        self.assertTrue(isinstance(block_entry.result(), Block))
+        self.assertEqual(11608, block_entry.result().number)
+
+    def test_batchSend(self):
+        balance = AccountFixtures.get_balance()
+        balance["id"] = 2
+        error = PeerFixtures.peer_state_error()
+        error["id"] = 1
+
+        batch = self.client.batch(max_size=1)
+        entries = [batch.peer_state("unknown"), batch.get_balance("NQ46")]
+
+        self.assertRaises(InternalErrorException, entries[0].result)
+
+        SessionStub.test_data = [error, balance]
+        result = batch.send()
+
+        self.assertEqual(1, len(SessionStub.latest_request))
+        self.assertEqual("getBalance", SessionStub.latest_request[0]["method"])
+        self.assertEqual(2, len(result))
+        self.assertTrue(isinstance(result[0], RemoteErrorException))
+        self.assertEqual(1200000, result[1])
+
+    def test_batchMissingResponse(self):
+        SessionStub.test_data = []
+
+        with self.client.batch() as batch:
+            entry = batch.block_number()
+
+        self.assertTrue(entry.done)
+        self.assertRaises(InternalErrorException, entry.result)
+
+    def test_batchUnsupported(self):
+        batch = self.client.batch()
+
+        self.assertRaises(InternalErrorException, batch.batch)
+        self.assertRaises(InternalErrorException, batch.with_timeout, 1)
+        self.assertRaises(
+            InternalErrorException, batch.with_response_mode, ResponseMode.JSON
+        )
+        self.assertRaises(InternalErrorException, batch.deadline, 1)
+        self.assertRaises(InternalErrorException, batch.iter_blocks, 1, 10)
+        self.assertRaises(
+            InternalErrorException, batch.iter_transactions_by_address, "NQ46"
+        )
+        self.assertRaises(InternalErrorException, batch.iter_mempool_content)
+
+    def test_concurrentRequestIds(self):
+        SessionStub.test_data = BlockFixtures.block_number()
+        ids = []
+
+        def worker():
+            for i in range(100):
+                ids.append(self.client._make_call_object("blockNumber", [])["id"])
+
+        threads = [threading.Thread(target=worker) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(800, len(set(ids)))
+        self.assertEqual(800, self.client.id)
+
+    def test_connectionPool(self):
+        client = NimiqClient(pool_maxsize=64, pool_block=True, keep_alive=False)
+
+        adapter = client.session.get_adapter(client.url)
+        self.assertEqual(64, adapter._pool_maxsize)
+        self.assertEqual(True, adapter._pool_block)
+        self.assertEqual("close", client.session.headers["Connection"])
+
+    def test_cacheBlockByHash(self):
+        client = NimiqClient(cache_size=10)
+        client.session = SessionStub()
+        SessionStub.test_data = BlockFixtures.get_block_with_transactions()
+
+        block_hash = "bc3945d22c9f6441409a6e539728534a4fc97859bda87333071fad9dad942786"
+        result = client.get_block_by_hash(block_hash, True)
+
+        self.assertEqual(739501, result.confirmations)
+        self.assertTrue(isinstance(result.transactions[0], Transaction))
+
+        SessionStub.latest_request = None
+        SessionStub.test_data = BlockFixtures.block_number()
+        SessionStub.test_data["result"] = 11608 + 739501 + 10
+        client.block_number()
+
+        SessionStub.latest_request = None
+        result = client.get_block_by_hash(block_hash, True)
+
+        self.assertEqual(None, SessionStub.latest_request)
+        self.assertEqual(11608, result.number)
+        self.assertEqual(739511, result.confirmations)
+        self.assertTrue(isinstance(result.transactions[0], Transaction))
+        self.assertEqual(739512, result.transactions[0].confirmations)
+
+        SessionStub.test_data = BlockFixtures.get_block_found()
+        result = client.get_block_by_hash(block_hash)
+
+        self.assertEqual("getBlockByHash", SessionStub.latest_request["method"])
+        self.assertEqual(739224, result.confirmations)
+
+    def test_cacheTransactionByHash(self):
+        client = NimiqClient(cache_size=10)
+        client.session = SessionStub()
+
+        SessionStub.test_data = TransactionFixtures.get_transaction_full()
+        client.get_transaction_by_hash(
+            "78957b87ab5546e11e9540ce5a37ebbf93a0ebd73c0ce05f137288f30ee9f430"
+        )
+        SessionStub.latest_request = None
+        result = client.get_transaction_by_hash(
+            "78957b87ab5546e11e9540ce5a37ebbf93a0ebd73c0ce05f137288f30ee9f430"
+        )
+
+        self.assertEqual(None, SessionStub.latest_request)
+        self.assertEqual(715571, result.confirmations)
+
+        SessionStub.test_data = TransactionFixtures.get_raw_transaction_info_basic()
+        client.get_transaction_by_hash(
+            "7784f2f6eaa076fa5cf0e4d06311ad204b2f485de622231785451181e8129091"
+        )
+        SessionStub.latest_request = None
+        client.get_transaction_by_hash(
+            "7784f2f6eaa076fa5cf0e4d06311ad204b2f485de622231785451181e8129091"
+        )
+
+        self.assertEqual("getTransactionByHash", SessionStub.latest_request["method"])
+
+    def test_volatileCache(self):
+        client = NimiqClient(volatile_ttls={"blockNumber": 1, "peerCount": 10})
+        client.session = SessionStub()
+        now = [100.0]
+        client.volatile_cache.clock = lambda: now[0]
+
+        SessionStub.test_data = BlockFixtures.block_number()
+        self.assertEqual(748883, client.block_number())
+        SessionStub.test_data = PeerFixtures.peer_count()
+        self.assertEqual(6, client.peer_count())
+
+        SessionStub.latest_request = None
+        now[0] += 0.5
+        self.assertEqual(748883, client.block_number())
+        self.assertEqual(6, client.peer_count())
+        self.assertEqual(None, SessionStub.latest_request)
+
+        # expired results are fetched again, a new block drops all the results
+        now[0] += 10
+        SessionStub.test_data = BlockFixtures.block_number()
+        SessionStub.test_data["result"] = 748884
+        self.assertEqual(748884, client.block_number())
+        self.assertEqual("blockNumber", SessionStub.latest_request_method)
+
+        SessionStub.latest_request = None
+        SessionStub.test_data = PeerFixtures.peer_count()
+        self.assertEqual(6, client.peer_count())
+        self.assertEqual("peerCount", SessionStub.latest_request_method)
+
+    def test_volatileCacheStaleWhileRevalidate(self):
+        client = NimiqClient(volatile_ttls={"blockNumber": 1})
+        client.session = SessionStub()
+        now = [100.0]
+        client.volatile_cache.clock = lambda: now[0]
+
+        SessionStub.test_data = BlockFixtures.block_number()
+        self.assertEqual(748883, client.block_number())
+
+        now[0] += 1.5
+        SessionStub.test_data = BlockFixtures.block_number()
+        SessionStub.test_data["result"] = 748884
+        self.assertEqual(748883, client.block_number())
+
+        for i in range(100):
+            if not client.volatile_cache.refreshing:
+                break
+            time.sleep(0.01)
+        self.assertEqual(748884, client.block_number())
+
+    def test_volatileCacheCopies(self):
+        client = NimiqClient(volatile_ttls={"mempool": 10})
+        client.session = SessionStub()
+        client = client.with_response_mode(ResponseMode.JSON)
+
+        SessionStub.test_data = MemPoolFixtures.mempool()
+        first = client.mempool()
+        first["total"] = 0
+        first["buckets"].append(0)
+        second = client.mempool()
+
+        self.assertEqual(MemPoolFixtures.mempool()["result"], second)
+        self.assertIsNot(first, second)
+
+    def test_volatileStaleTtls(self):
+        client = NimiqClient(
+            volatile_ttls={"blockNumber": 1}, volatile_stale_ttls={"blockNumber": 0}
+        )
+        client.session = SessionStub()
+        now = [100.0]
+        client.volatile_cache.clock = lambda: now[0]
+
+        SessionStub.test_data = BlockFixtures.block_number()
+        self.assertEqual(748883, client.block_number())
+
+        # without a stale period the expired result is fetched again right away
+        now[0] += 1.5
+        SessionStub.test_data = BlockFixtures.block_number()
+        SessionStub.test_data["result"] = 748884
+        self.assertEqual(748884, client.block_number())
+
+    def test_iterBlocks(self):
+        self.client.session = ChainSessionStub(250)
+
+        blocks = list(self.client.iter_blocks(5, 205, batch_size=20, prefetch=3))
+
+        self.assertEqual(list(range(5, 205)), [block.number for block in blocks])
+        self.assertTrue(all(isinstance(block, Block) for block in blocks))
+        self.assertEqual(10, self.client.session.requests)
+
+    def test_iterBlocksUntilLatest(self):
+        self.client.session = ChainSessionStub(95)
+
+        blocks = self.client.iter_blocks(1, batch_size=10)
+
+        self.assertEqual(list(range(1, 96)), [block.number for block in blocks])
+
+    def test_timeout(self):
+        client = NimiqClient(timeout=2.5)
+        client.session = SessionStub()
+        SessionStub.test_data = BlockFixtures.block_number()
+
+        client.block_number()
+
+        self.assertEqual(2.5, SessionStub.latest_request_timeout)
+
+    def test_timeoutException(self):
+        self.client.session = TimeoutSessionStub()
+
+        with self.assertRaises(TimeoutException) as context:
+            self.client.block_number()
+        self.assertTrue(isinstance(context.exception, InternalErrorException))
+
+    def test_withTimeout(self):
+        SessionStub.test_data = BlockFixtures.block_number()
+        self.client.block_number()
+
+        client = self.client.with_timeout((1, 5))
+        client.block_number()
+
+        self.assertEqual((1, 5), SessionStub.latest_request_timeout)
+        self.assertEqual(2, SessionStub.latest_request["id"])
+        self.assertEqual(None, self.client.timeout)
+        self.assertEqual(2, self.client.id)
+
+    def test_deadline(self):
+        SessionStub.test_data = BlockFixtures.block_number()
+        client = self.client.with_timeout(30)
+
+        with client.deadline(10):
+            with client.deadline(20):
+                client.block_number()
+                timeout = SessionStub.latest_request_timeout
+                self.assertTrue(9 < timeout <= 10)
+        client.block_number()
+        self.assertEqual(30, SessionStub.latest_request_timeout)
+
+    def test_deadlineExceeded(self):
+        SessionStub.test_data = BlockFixtures.block_number()
+        SessionStub.latest_request = None
+
+        with self.client.deadline(0):
+            self.assertRaises(TimeoutException, self.client.block_number)
+        self.assertEqual(None, SessionStub.latest_request)
+
+    def test_deadlineIterBlocks(self):
+        self.client.session = ChainSessionStub(50)
+
+        with self.client.deadline(0):
+            blocks = self.client.iter_blocks(1, 50, batch_size=10)
+            self.assertRaises(TimeoutException, list, blocks)
+        self.assertEqual(0, self.client.session.requests)
+
+    def test_slottedModels(self):
+        SessionStub.test_data = BlockFixtures.get_block_with_transactions()
+
+        block = self.client.get_block_by_hash(
+            "bc3945d22c9f6441409a6e539728534a4fc97859bda87333071fad9dad942786", True
+        )
+        transaction = block.transactions[0]
+
+        for model in [block, transaction]:
+            self.assertFalse(hasattr(model, "__dict__"))
+            self.assertRaises(AttributeError, setattr, model, "unknown", 1)
+        self.assertEqual(transaction.from_, getattr(transaction, "from"))
+        setattr(transaction, "from", "00")
+        self.assertEqual("00", transaction.from_)
+        self.assertEqual("00", json.loads(repr(transaction))["from"])
+
+        copied = pickle.loads(pickle.dumps(transaction, 2))
+        self.assertEqual(transaction._asdict(), copied._asdict())
+        self.assertEqual(block.hash, copy.copy(block).hash)
+
+    def test_lazyBlockTransactions(self):
+        SessionStub.test_data = BlockFixtures.get_block_with_transactions()
+
+        block = self.client.get_block_by_number(11608, True)
+
+        self.assertEqual(2, len(block.transactions))
+        self.assertTrue(all(type(tx) is dict for tx in block.transactions.items))
+        transaction = block.transactions[1]
+        self.assertTrue(isinstance(transaction, Transaction))
+        self.assertTrue(transaction is block.transactions[-1])
+        self.assertTrue(type(block.transactions.items[0]) is dict)
+
+        transactions = list(block.transactions)
+        self.assertTrue(all(isinstance(tx, Transaction) for tx in transactions))
+        self.assertEqual(transactions, block.transactions)
+        self.assertEqual(transactions[1:], block.transactions[1:])
+
+        block = Block(
+            **dict(BlockFixtures.get_block_found()["result"], transactions=[1])
+        )
+        self.assertRaises(InternalErrorException, lambda: block.transactions[0])
+
+    def test_transactionFromDict(self):
+        for fixture in [
+            TransactionFixtures.get_transaction_full(),
+            TransactionFixtures.get_transaction_contract_creation(),
+            TransactionFixtures.get_raw_transaction_info_basic(),
+        ]:
+            data = fixture["result"]
+
+            transaction = Transaction.from_dict(data)
+
+            self.assertEqual(Transaction(**dict(data))._asdict(), transaction._asdict())
+            self.assertEqual(data["from"], transaction.from_)
+
+    def test_responseModeJson(self):
+        client = NimiqClient(response_mode=ResponseMode.JSON)
+        client.session = SessionStub()
+
+        SessionStub.test_data = BlockFixtures.get_block_with_transactions()
+        result = client.get_block_by_number(11608, True)
+        self.assertEqual(BlockFixtures.get_block_with_transactions()["result"], result)
+
+        SessionStub.test_data = TransactionFixtures.get_transactions_found()
+        result = client.get_transactions_by_address(
+            "NQ05 9VGU 0TYE NXBH MVLR E4JY UG6N 5701 MX9F"
+        )
+        self.assertEqual(TransactionFixtures.get_transactions_found()["result"], result)
+
+        SessionStub.test_data = MemPoolFixtures.mempool_content_full_transactions()
+        result = client.mempool_content(True)
+        self.assertEqual(
+            MemPoolFixtures.mempool_content_full_transactions()["result"], result
+        )
+
+        SessionStub.test_data = PeerFixtures.peer_list()
+        result = client.peer_list()
+        self.assertEqual(PeerFixtures.peer_list()["result"], result)
+
+        SessionStub.test_data = [dict(PeerFixtures.peer_list(), id=client.id + 1)]
+        with client.batch() as batch:
+            entry = batch.peer_list()
+        self.assertEqual(PeerFixtures.peer_list()["result"], entry.result())
+
+    def test_responseModeBytes(self):
+        client = self.client.with_response_mode(ResponseMode.BYTES)
+
+        SessionStub.test_data = BlockFixtures.get_block_found()
+        result = client.get_block_by_number(11608)
+        self.assertEqual(SessionStub().content, result)
+        self.assertEqual(ResponseMode.MODELS, self.client.response_mode)
+
+        SessionStub.test_data = {"jsonrpc": "2.0", "result": "error", "id": 1}
+        self.assertEqual(SessionStub().content, client.set_log("*", LogLevel.ERROR))
+
+        SessionStub.test_data = PeerFixtures.peer_state_error()
+        self.assertRaises(RemoteErrorException, client.peer_state, "unknown")
+
+    def run_concurrently(self, function, count=8):
+        results = []
+        errors = []
+
+        def worker():
+            try:
+                results.append(function())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_coalesce(self):
+        client = NimiqClient(coalesce=True)
+        client.session = EndpointsSessionStub(
+            {client.url: {"getAccount": AccountFixtures.get_account_basic()["result"]}}
+        )
+        client.session.delays[client.url] = 0.2
+
+        results, errors = self.run_concurrently(
+            lambda: client.get_account("NQ38 YX2J GTMX 5XAU LKFU H0GS A4AA U26L MDA3")
+        )
+
+        self.assertEqual([], errors)
+        self.assertEqual(1, len(client.session.requests[client.url]))
+        self.assertEqual(7, client.single_flight.coalesced)
+        self.assertTrue(all(result is results[0] for result in results))
+
+        client.session.delays[client.url] = 0
+        self.assertFalse(
+            client.get_account("NQ38 YX2J GTMX 5XAU LKFU H0GS A4AA U26L MDA3")
+            is results[0]
+        )
+        self.assertEqual(2, len(client.session.requests[client.url]))
+
+    def test_coalesceError(self):
+        client = NimiqClient(coalesce=True)
+        client.session = EndpointsSessionStub({client.url: None})
+        client.session.delays[client.url] = 0.2
+
+        results, errors = self.run_concurrently(client.block_number)
+
+        self.assertEqual(8, len(errors))
+        self.assertTrue(all(isinstance(e, InternalErrorException) for e in errors))
+        self.assertEqual(1, len(client.session.requests[client.url]))
+
+    def test_coalesceDeadline(self):
+        client = NimiqClient(coalesce=True)
+        client.session = EndpointsSessionStub({client.url: {"blockNumber": 100}})
+        client.session.delays[client.url] = 0.3
+        leader = threading.Thread(target=client.block_number)
+        leader.start()
+        time.sleep(0.05)
+
+        # the waiting request stops at its own deadline
+        start = time.time()
+        with client.deadline(0.1):
+            self.assertRaises(TimeoutException, client.block_number)
+        self.assertTrue(time.time() - start < 0.25)
+        leader.join()
+        self.assertEqual(1, len(client.session.requests[client.url]))
+
+    def test_coalesceLeaderTimeout(self):
+        client = NimiqClient(coalesce=True)
+        client.session = EndpointsSessionStub({client.url: {"blockNumber": 100}})
+        client.session.delays[client.url] = 0.2
+        errors = []
+
+        def leader():
+            with client.deadline(0.1):
+                try:
+                    client.block_number()
+                except TimeoutException as e:
+                    errors.append(e)
+
+        thread = threading.Thread(target=leader)
+        thread.start()
+        time.sleep(0.05)
+
+        # the deadline of the request in flight isn't shared, the waiting one is sent again
+        self.assertEqual(100, client.block_number())
+        thread.join()
+        self.assertEqual(1, len(errors))
+        self.assertEqual(2, len(client.session.requests[client.url]))
+
+    def test_coalesceNotWrites(self):
+        client = NimiqClient(coalesce=True)
+        client.session = EndpointsSessionStub(
+            {client.url: {"sendRawTransaction": "00"}}
+        )
+        client.session.delays[client.url] = 0.05
+
+        results, errors = self.run_concurrently(
+            lambda: client.send_raw_transaction("00"), 4
+        )
+
+        self.assertEqual(["00"] * 4, results)
+        self.assertEqual(4, len(client.session.requests[client.url]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,156 @@
+from nimiqclient import *
+from .fixtures import *
+from nimiqclient.testing import StandInServer
+from .session_stub import ChainSessionStub
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+
+class TestRecording(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.client = NimiqClient()
+        self.client.session = RecordingSession(ChainSessionStub(20))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def record(self):
+        self.client.block_number()
+        hash = self.client.get_block_by_number(3).hash
+        self.client.get_block_by_hash(hash)
+        self.client.get_block_by_hash(hash)
+        list(self.client.iter_blocks(5, 9, batch_size=2))
+        return self.client.session.cassette
+
+    def test_record(self):
+        cassette = self.record()
+
+        self.assertEqual(6, len(cassette))
+        entries = list(cassette)
+        self.assertEqual(([("blockNumber", [])], False), entries[0].calls())
+        self.assertEqual(
+            ([("getBlockByNumber", [5]), ("getBlockByNumber", [6])], True),
+            entries[4].calls(),
+        )
+        self.assertEqual(200, entries[0].status)
+        self.assertEqual(20, json.loads(entries[0].response.decode("utf-8"))["result"])
+        self.assertTrue(all(entry.duration >= 0 for entry in entries))
+        self.assertEqual(
+            sorted(entry.start for entry in entries), [e.start for e in entries]
+        )
+
+    def test_saveLoad(self):
+        cassette = self.record()
+
+        for name in ("traffic.jsonl", "traffic.jsonl.gz"):
+            path = os.path.join(self.directory, name)
+            cassette.save(path)
+            loaded = Cassette.load(path)
+
+            self.assertEqual(len(cassette), len(loaded))
+            for entry, copy in zip(cassette, loaded):
+                self.assertEqual(entry.request, copy.request)
+                self.assertEqual(entry.response, copy.response)
+                self.assertEqual(entry.status, copy.status)
+                self.assertAlmostEqual(entry.start, copy.start, 5)
+
+    def test_loadInvalid(self):
+        path = os.path.join(self.directory, "invalid.jsonl")
+        with open(path, "w") as f:
+            f.write('{"version": 99}\n')
+
+        self.assertRaises(InternalErrorException, Cassette.load, path)
+
+    def test_replaySession(self):
+        cassette = self.record()
+        client = NimiqClient()
+        client.session = ReplaySession(cassette, speed=None)
+        # the request ids of the new client are different
+        client.id = 1000
+
+        self.assertEqual(20, client.block_number())
+        block = client.get_block_by_number(3)
+        self.assertEqual(3, block.number)
+        self.assertEqual(3, client.get_block_by_hash(block.hash).number)
+        blocks = list(client.iter_blocks(5, 9, batch_size=2))
+        self.assertEqual([5, 6, 7, 8], [block.number for block in blocks])
+        self.assertEqual(0, client.session.misses)
+
+    def test_replaySessionMiss(self):
+        client = NimiqClient()
+        client.session = ReplaySession(self.record(), speed=None)
+
+        self.assertRaises(RemoteErrorException, client.get_block_by_number, 4)
+        self.assertEqual(1, client.session.misses)
+
+    def test_replaySessionSpeed(self):
+        cassette = Cassette(
+            [
+                CassetteEntry(
+                    0,
+                    0.2,
+                    200,
+                    b'{"jsonrpc":"2.0","method":"blockNumber","params":[],"id":1}',
+                    b'{"jsonrpc":"2.0","result":7,"id":1}',
+                )
+            ]
+        )
+        session = ReplaySession(cassette, speed=10)
+
+        start = time.time()
+        status, content = session.answer(
+            b'{"jsonrpc":"2.0","method":"blockNumber","params":[],"id":2}'
+        )
+
+        self.assertEqual(200, status)
+        self.assertTrue(0.015 <= time.time() - start < 0.2)
+
+    def test_replay(self):
+        cassette = self.record()
+        client = NimiqClient(cache_size=10)
+        client.session = RecordingSession(ReplaySession(cassette, speed=None))
+
+        results = replay(client, cassette, speed=None)
+
+        self.assertEqual(
+            [
+                "blockNumber",
+                "getBlockByNumber",
+                "getBlockByHash",
+                "getBlockByHash",
+                "batch",
+                "batch",
+            ],
+            [method for method, seconds, error in results],
+        )
+        self.assertEqual([None] * 6, [error for method, seconds, error in results])
+        # the second request of block 3 by hash was answered from the cache
+        self.assertEqual(5, len(client.session.cassette))
+
+    def test_replayStandIn(self):
+        cassette = self.record()
+        with StandInServer(replay=ReplaySession(cassette, speed=None)) as server:
+            client = NimiqClient(port=server.port)
+
+            results = replay(client, cassette, speed=None)
+
+        self.assertEqual([None] * 6, [error for method, seconds, error in results])
+        self.assertEqual(6, server.node.requests)
+
+    def test_replaySpeed(self):
+        cassette = self.record()
+        for index, entry in enumerate(cassette):
+            entry.start = index * 0.1
+        client = NimiqClient()
+        client.session = ReplaySession(cassette, speed=None)
+
+        start = time.time()
+        replay(client, cassette, speed=4)
+
+        self.assertTrue(0.1 <= time.time() - start < 0.4)
@@ -0,0 +1,149 @@
+from nimiqclient import *
+from .session_stub import FlakySessionStub, EndpointsSessionStub
+
+import unittest
+
+
+class TestRetry(unittest.TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(backoff=0, jitter=False)
+        self.client = NimiqClient(retry_policy=self.policy)
+
+    def test_retryRead(self):
+        self.client.session = FlakySessionStub(2, 100)
+
+        self.assertEqual(100, self.client.block_number())
+
+        self.assertEqual(3, len(self.client.session.requests))
+        self.assertEqual(1, self.policy.requests)
+        self.assertEqual(2, self.policy.retries)
+        self.assertEqual(0, self.policy.exhausted)
+
+    def test_retryExhausted(self):
+        self.client.session = FlakySessionStub(3, 100)
+
+        self.assertRaises(InternalErrorException, self.client.block_number)
+
+        self.assertEqual(3, len(self.client.session.requests))
+        self.assertEqual(1, self.policy.exhausted)
+
+    def test_noRetryWrite(self):
+        self.client.session = FlakySessionStub(1, "00")
+
+        self.assertRaises(
+            InternalErrorException, self.client.send_raw_transaction, "00"
+        )
+        self.assertEqual(1, len(self.client.session.requests))
+
+        self.policy.retry_writes = True
+        self.assertEqual("00", self.client.send_raw_transaction("00"))
+
+    def test_retryBatch(self):
+        self.client.session = FlakySessionStub(1, 100)
+
+        with self.client.batch() as batch:
+            entry = batch.block_number()
+
+        self.assertEqual(100, entry.result())
+        self.assertEqual(2, len(self.client.session.requests))
+
+    def test_retryBudget(self):
+        self.policy.budget = 1
+        self.policy.tokens = 1
+        self.client.session = FlakySessionStub(10, 100)
+
+        self.assertRaises(InternalErrorException, self.client.block_number)
+
+        self.assertEqual(2, len(self.client.session.requests))
+        self.assertEqual(1, self.policy.retries)
+        self.assertEqual(1, self.policy.budget_exceeded)
+        self.assertEqual(0, self.policy.tokens)
+
+        for i in range(10):
+            self.policy.record_request()
+        self.assertAlmostEqual(1, self.policy.tokens)
+
+    def test_retryDeadline(self):
+        self.policy.backoff = self.policy.max_backoff = 10
+        self.client.session = FlakySessionStub(1, 100)
+
+        with self.client.deadline(5):
+            self.assertRaises(InternalErrorException, self.client.block_number)
+        self.assertEqual(1, len(self.client.session.requests))
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff=0.1, max_backoff=0.3, jitter=False)
+        payload = {"method": "blockNumber"}
+
+        delays = [policy.next_delay(payload, attempt) for attempt in range(1, 4)]
+        self.assertEqual([0.1, 0.2, None], delays)
+
+        policy = RetryPolicy(max_attempts=5, backoff=0.1, max_backoff=0.3)
+        for attempt in range(1, 5):
+            self.assertTrue(0 <= policy.next_delay(payload, attempt) <= 0.3)
+
+    def test_circuitBreaker(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+        now = [0.0]
+        breaker.clock = lambda: now[0]
+
+        breaker.record_failure()
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+        self.assertEqual(CircuitState.OPEN, breaker.state)
+        self.assertFalse(breaker.allow())
+        self.assertFalse(breaker.available)
+
+        now[0] += 10
+        self.assertTrue(breaker.available)
+        self.assertTrue(breaker.allow())
+        self.assertEqual(CircuitState.HALF_OPEN, breaker.state)
+        self.assertFalse(breaker.allow())
+        breaker.record_failure()
+        self.assertEqual(CircuitState.OPEN, breaker.state)
+
+        now[0] += 10
+        self.assertTrue(breaker.allow())
+        breaker.record_success()
+        self.assertEqual(CircuitState.CLOSED, breaker.state)
+        self.assertEqual(2, breaker.opened)
+        self.assertEqual(2, breaker.rejected)
+
+    def test_circuitOpenFailsFast(self):
+        client = NimiqClient(
+            retry_policy=self.policy,
+            circuit_breaker=CircuitBreaker(failure_threshold=2),
+        )
+        client.session = FlakySessionStub(10, 100)
+
+        self.assertRaises(InternalErrorException, client.block_number)
+        self.assertRaises(CircuitOpenException, client.block_number)
+
+        self.assertEqual(2, len(client.session.requests))
+        self.assertEqual(CircuitState.OPEN, client.circuit_breaker.state)
+
+    def test_balancedCircuitBreaker(self):
+        endpoints = [
+            Endpoint(
+                host="10.0.0.{0}".format(i),
+                circuit_breaker=CircuitBreaker(failure_threshold=1),
+            )
+            for i in range(1, 3)
+        ]
+        client = BalancedNimiqClient(endpoints, retry_policy=self.policy)
+        client.session = EndpointsSessionStub(
+            {endpoints[0].url: None, endpoints[1].url: {"blockNumber": 100}}
+        )
+        endpoints[1].latency = 0.1
+
+        self.assertEqual(100, client.block_number())
+        self.assertEqual(100, client.block_number())
+
+        self.assertEqual(1, len(client.session.requests[endpoints[0].url]))
+        self.assertEqual(2, len(client.session.requests[endpoints[1].url]))
+        self.assertFalse(endpoints[0].available)
+        self.assertEqual(1, self.policy.retries)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+from nimiqclient import *
+from nimiqclient.testing import StandInServer
+
+import unittest
+
+
+class TestStandInServer(unittest.TestCase):
+    def setUp(self):
+        self.server = StandInServer(height=50, transactions=3).start()
+        self.client = NimiqClient(port=self.server.port)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_chain(self):
+        self.assertEqual(50, self.client.block_number())
+
+        block = self.client.get_block_by_number(10, True)
+
+        self.assertEqual(10, block.number)
+        self.assertEqual(3, len(block.transactions))
+        self.assertEqual(10, block.transactions[2].blockNumber)
+        self.assertEqual(
+            block.transactions[0].fromAddress,
+            to_user_friendly_address(
+                bytes(bytearray.fromhex(block.transactions[0].from_))
+            ),
+        )
+        self.assertEqual(
+            block.number,
+            self.client.get_block_by_hash(block.hash).number,
+        )
+        self.assertEqual(self.client.get_block_by_number(9).hash, block.parentHash)
+        self.assertEqual(None, self.client.get_block_by_number(51))
+
+    def test_transactions(self):
+        address = self.server.node.friendly_addresses[10]
+
+        transactions = self.client.get_transactions_by_address(address)
+
+        self.assertEqual(6, len(transactions))
+        self.assertEqual([10, 9, 9, 8, 8, 7], [tx.blockNumber for tx in transactions])
+        self.assertTrue(
+            all(address in (tx.fromAddress, tx.toAddress) for tx in transactions)
+        )
+        self.assertEqual(2, len(self.client.get_transactions_by_address(address, 2)))
+        self.assertEqual([], self.client.get_transactions_by_address("NQ05"))
+        self.assertEqual(
+            transactions[0].hash,
+            self.client.get_transaction_by_hash(transactions[0].hash).hash,
+        )
+        self.assertEqual(
+            transactions[0].hash,
+            self.client.get_transaction_by_block_number_and_index(
+                10, transactions[0].transactionIndex
+            ).hash,
+        )
+        self.assertEqual(
+            None, self.client.get_transaction_by_block_number_and_index(10, 3)
+        )
+
+    def test_mempool(self):
+        transactions = self.client.mempool_content(True)
+
+        self.assertEqual(3, len(transactions))
+        self.assertEqual(None, transactions[0].blockNumber)
+        self.assertEqual(
+            [tx.hash for tx in transactions], self.client.mempool_content()
+        )
+
+    def test_fixtures(self):
+        self.assertRaises(RemoteErrorException, self.client.peer_count)
+
+        self.server.node.fixtures = {
+            "peerCount": 12,
+            "getBalance": lambda params: len(params[0]),
+        }
+
+        self.assertEqual(12, self.client.peer_count())
+        self.assertEqual(4, self.client.get_balance("NQ05"))
+        self.assertRaises(RemoteErrorException, self.client._request, None, "unknown")
+
+    def test_keepAlive(self):
+        blocks = list(self.client.iter_blocks(1, 51, batch_size=10, prefetch=2))
+
+        self.assertEqual(list(range(1, 51)), [block.number for block in blocks])
+        self.assertEqual(5, self.server.node.requests)
+        self.assertEqual(50, self.server.node.calls)
+
+    def test_errorRate(self):
+        self.server.node.error_rate = 1
+
+        self.assertRaises(InternalErrorException, self.client.block_number)
+
+        client = NimiqClient(
+            port=self.server.port, retry_policy=RetryPolicy(backoff=0, jitter=False)
+        )
+        self.assertRaises(InternalErrorException, client.block_number)
+        self.assertEqual(4, self.server.node.requests)
+
+    def test_latency(self):
+        self.server.node.latency = 0.5
+
+        self.assertRaises(TimeoutException, self.client.with_timeout(0.05).block_number)
@@ -0,0 +1,96 @@
+from nimiqclient import *
+from .fixtures import *
+
+import json
+import unittest
+
+
+def chunks(data, size):
+    content = json.dumps(data).encode("utf-8")
+    return [content[start : start + size] for start in range(0, len(content), size)]
+
+
+class TestStream(unittest.TestCase):
+    def test_iterResult(self):
+        data = TransactionFixtures.get_transactions_found()
+
+        for size in (1, 7, 100000):
+            self.assertEqual(data["result"], list(iter_result(chunks(data, size))))
+
+    def test_iterResultIncremental(self):
+        data = MemPoolFixtures.mempool_content_full_transactions()
+        consumed = []
+
+        def tracked():
+            for chunk in chunks(data, 64):
+                consumed.append(chunk)
+                yield chunk
+
+        first = next(iter_result(tracked()))
+
+        self.assertEqual(data["result"][0], first)
+        self.assertTrue(len(b"".join(consumed)) < len(json.dumps(data)) / 2)
+
+    def test_resultParserPush(self):
+        data = TransactionFixtures.get_transactions_found()
+        parser = ResultParser()
+        pending = chunks(data, 5)
+        elements = []
+        requested = []
+
+        while True:
+            try:
+                element = parser.next()
+            except NeedMoreData as e:
+                requested.append(e.size)
+                parser.reader.push(pending.pop(0) if pending else b"")
+                continue
+            if element is ResultParser.END:
+                break
+            elements.append(element)
+
+        self.assertEqual(data["result"], elements)
+        self.assertTrue(len(requested) > 1)
+
+    def test_iterResultKeyOrder(self):
+        content = b' {"id": 1, "result" :[ 1, 23 ,"a\\u00e9"] , "jsonrpc":"2.0"} '
+        # a unicode string on Python 2 too
+        expected = [1, 23, json.loads('"a\\u00e9"')]
+
+        self.assertEqual(expected, list(iter_result([content[:17], content[17:]])))
+        self.assertEqual(
+            expected,
+            list(iter_result([content[i : i + 1] for i in range(len(content))])),
+        )
+
+    def test_iterResultMultibyte(self):
+        content = json.dumps({"result": ["\u00e9\u20ac"]}, ensure_ascii=False)
+        content = content.encode("utf-8")
+
+        self.assertEqual(
+            ["\u00e9\u20ac"],
+            list(iter_result([content[i : i + 1] for i in range(len(content))])),
+        )
+
+    def test_iterResultEmpty(self):
+        self.assertEqual([], list(iter_result([b'{"result": []}'])))
+        self.assertEqual([], list(iter_result([b'{"result": null, "id": 1}'])))
+
+    def test_iterResultError(self):
+        data = {"jsonrpc": "2.0", "error": {"code": 1, "message": "Boom"}, "id": 1}
+
+        self.assertRaises(RemoteErrorException, list, iter_result(chunks(data, 5)))
+
+    def test_iterResultNotArray(self):
+        data = {"jsonrpc": "2.0", "result": {"total": 0}, "id": 1}
+
+        self.assertRaises(InternalErrorException, list, iter_result(chunks(data, 5)))
+
+    def test_iterResultInvalid(self):
+        self.assertRaises(
+            InternalErrorException, list, iter_result([b'{"result": [1, 2'])
+        )
+        self.assertRaises(InternalErrorException, list, iter_result([b"<html>"]))
+        self.assertRaises(
+            InternalErrorException, list, iter_result([b'{"result": [{"a": 1}'])
+        )
@@ -0,0 +1,98 @@
+from nimiqclient import *
+from .fixtures import *
+
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "requires numpy")
+class TestTransactionTable(unittest.TestCase):
+    def test_fromTransactions(self):
+        data = TransactionFixtures.get_transactions_found()["result"]
+        transactions = [Transaction.from_dict(tx) for tx in data]
+
+        table = TransactionTable.from_transactions(transactions)
+
+        self.assertEqual(3, len(table))
+        self.assertEqual(
+            [tx["value"] for tx in data],
+            table["value"].tolist(),
+        )
+        self.assertEqual(data[0]["from"].encode(), table["from"][0])
+        self.assertEqual(data[0]["hash"].encode(), table["hash"][0])
+        self.assertEqual(numpy.int64, table["value"].dtype)
+
+    def test_fromDicts(self):
+        data = MemPoolFixtures.mempool_content_full_transactions()["result"]
+
+        table = TransactionTable.from_transactions(data)
+
+        self.assertEqual(3, len(table))
+        self.assertEqual([-1, -1, -1], table["blockNumber"].tolist())
+        self.assertEqual([b"", b"", b""], table["blockHash"].tolist())
+        self.assertEqual(4140, table["fee"].sum())
+
+    def test_fromHashes(self):
+        data = MemPoolFixtures.mempool_content_hashes_only()["result"]
+
+        self.assertRaises(ValueError, TransactionTable.from_transactions, data)
+
+    def test_fromBlocks(self):
+        data = BlockFixtures.get_block_with_transactions()["result"]
+        block = Block(**data)
+
+        table = TransactionTable.from_blocks([block, data])
+
+        self.assertEqual(4, len(table))
+        self.assertEqual([11608] * 4, table["blockNumber"].tolist())
+        self.assertEqual([0, 1, 0, 1], table["transactionIndex"].tolist())
+        # the transactions of the block were not decoded
+        self.assertTrue(all(type(tx) is dict for tx in block.transactions.items))
+
+    def test_filter(self):
+        data = TransactionFixtures.get_transactions_found()["result"]
+        table = TransactionTable.from_transactions(data)
+
+        filtered = table.filter(table["value"] > 2000000000)
+
+        self.assertEqual(2, len(filtered))
+        self.assertEqual([2635766000, 2860228000], filtered["value"].tolist())
+
+    def test_groupSum(self):
+        data = BlockFixtures.get_block_with_transactions()["result"]
+        table = TransactionTable.from_blocks([data])
+
+        keys, sums = table.group_sum("from", "value")
+
+        self.assertEqual(
+            [
+                b"0e229e99c9af35f040fc38aa5f722a78ce88c15b",
+                b"355b4fe2304a9c818b9f0c3c1aaaf4ad4f6a0279",
+            ],
+            keys.tolist(),
+        )
+        self.assertEqual([2860228000, 2636710000], sums.tolist())
+
+        keys, sums = table.group_sum("to", "flags")
+
+        self.assertEqual(numpy.int64, sums.dtype)
+
+    def test_concatenate(self):
+        first = TransactionTable.from_transactions(
+            TransactionFixtures.get_transactions_found()["result"]
+        )
+        second = TransactionTable.from_transactions(
+            MemPoolFixtures.mempool_content_full_transactions()["result"]
+        )
+
+        table = TransactionTable.concatenate([first, second])
+
+        self.assertEqual(6, len(table))
+        self.assertEqual(
+            first["value"].sum() + second["value"].sum(), table["value"].sum()
+        )
+        self.assertEqual(0, len(TransactionTable.concatenate([])))